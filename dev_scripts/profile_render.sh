@@ -0,0 +1,4 @@
+# Prints a per-class breakdown of render time for the kitchen sink example
+
+set -o xtrace
+NEOSCORE_PROFILE_RENDER=1 python examples/kitchen_sink.py --image
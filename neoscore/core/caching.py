@@ -0,0 +1,270 @@
+"""Bounded caches shared across the application.
+
+Several expensive computations, like text path generation and bounding rect
+measurement, are memoized in module-level caches. These are all :obj:`LruCache`
+instances registered here by name, so their size limits and statistics can be
+managed in one place. See :obj:`.neoscore.cache_stats` and
+:obj:`.neoscore.clear_caches`.
+
+Caches of data tied to particular objects, like flowable layouts, are instead stored
+on those objects so they are freed along with them. These per-object caches are
+created by an :obj:`LruCacheFamily`, which is registered in their place.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar, Union
+from weakref import WeakSet
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_REGISTRY: Dict[str, Union[LruCache, LruCacheFamily]] = {}
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A snapshot of an :obj:`LruCache`'s usage."""
+
+    size: int
+    """The number of entries currently cached"""
+
+    max_size: int
+    """The maximum number of entries before old ones are evicted"""
+
+    hits: int
+    """The number of lookups which found a cached entry"""
+
+    misses: int
+    """The number of lookups which found no cached entry"""
+
+    evictions: int
+    """The number of entries evicted to make room for new ones"""
+
+    estimated_bytes: int
+    """A rough estimate of the memory held by the cached entries"""
+
+
+def _shallow_size(key: Hashable, value: object) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class _CacheCounters:
+    """Lookup and eviction counts, which may be shared by several caches."""
+
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+def _register(name: str, cache: Union[LruCache, LruCacheFamily]):
+    if name in _REGISTRY:
+        raise ValueError(f"A cache named '{name}' already exists")
+    _REGISTRY[name] = cache
+
+
+class LruCache(Generic[K, V]):
+    """A size-bounded cache which evicts the least recently used entries.
+
+    Caches are registered by name on creation, and names must be unique.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str],
+        max_size: int,
+        size_estimator: Optional[Callable[[K, V], int]] = None,
+        _counters: Optional[_CacheCounters] = None,
+    ):
+        """
+        Args:
+            name: A unique name identifying the cache. If ``None``, the cache is not
+                registered. Unregistered caches are typically created with
+                :obj:`LruCacheFamily.new_cache`.
+            max_size: The maximum number of entries to keep.
+            size_estimator: A function estimating the memory in bytes held by an
+                entry. Defaults to the shallow size of the key and value.
+        """
+        if name is not None:
+            _register(name, self)
+        self.name = name
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._size_estimator = size_estimator or _shallow_size
+        self._counters = _counters or _CacheCounters()
+        self._estimated_bytes = 0
+        self._max_size = 0
+        self.max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of entries to keep.
+
+        Reducing this immediately evicts entries over the new limit.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        if value < 1:
+            raise ValueError(f"Cache max_size must be at least 1, got {value}")
+        self._max_size = value
+        self._evict_to(value)
+
+    def get(self, key: K) -> Optional[V]:
+        """Look up an entry, marking it as recently used.
+
+        Returns ``None`` if the key is not cached.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self._counters.misses += 1
+            return None
+        self._counters.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V):
+        """Cache an entry, evicting the least recently used one if the cache is full.
+
+        ``None`` values cannot be cached.
+        """
+        old_value = self._entries.pop(key, None)
+        if old_value is not None:
+            self._estimated_bytes -= self._size_estimator(key, old_value)
+        else:
+            self._evict_to(self._max_size - 1)
+        self._entries[key] = value
+        self._estimated_bytes += self._size_estimator(key, value)
+
+    def clear(self):
+        """Remove all entries and reset statistics."""
+        self._clear_entries()
+        self._counters.__init__()
+
+    def _clear_entries(self):
+        self._entries.clear()
+        self._estimated_bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache's usage."""
+        return CacheStats(
+            len(self._entries),
+            self._max_size,
+            self._counters.hits,
+            self._counters.misses,
+            self._counters.evictions,
+            self._estimated_bytes,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def _evict_to(self, size: int):
+        while len(self._entries) > size:
+            key, value = self._entries.popitem(last=False)
+            self._estimated_bytes -= self._size_estimator(key, value)
+            self._counters.evictions += 1
+
+
+class LruCacheFamily(Generic[K, V]):
+    """A registered group of per-object caches.
+
+    Each cache created by :obj:`new_cache` is meant to be stored on the object its
+    entries belong to, so it is freed along with that object. The family is
+    registered by name in place of its caches, so they can still be inspected,
+    cleared and resized together. Statistics are combined across all live caches,
+    while ``max_size`` applies to each cache individually.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        size_estimator: Optional[Callable[[K, V], int]] = None,
+    ):
+        """
+        Args:
+            name: A unique name identifying the family.
+            max_size: The maximum number of entries to keep in each cache.
+            size_estimator: A function estimating the memory in bytes held by an
+                entry. Defaults to the shallow size of the key and value.
+        """
+        if max_size < 1:
+            raise ValueError(f"Cache max_size must be at least 1, got {max_size}")
+        _register(name, self)
+        self.name = name
+        self._max_size = max_size
+        self._size_estimator = size_estimator
+        self._counters = _CacheCounters()
+        self._caches: WeakSet[LruCache[K, V]] = WeakSet()
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of entries to keep in each cache.
+
+        Reducing this immediately evicts entries over the new limit.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        if value < 1:
+            raise ValueError(f"Cache max_size must be at least 1, got {value}")
+        self._max_size = value
+        for cache in list(self._caches):
+            cache.max_size = value
+
+    def new_cache(self) -> LruCache[K, V]:
+        """Create a new unregistered cache belonging to this family."""
+        cache: LruCache[K, V] = LruCache(
+            None, self._max_size, self._size_estimator, self._counters
+        )
+        self._caches.add(cache)
+        return cache
+
+    def clear(self):
+        """Remove all entries from every cache in the family and reset statistics."""
+        for cache in list(self._caches):
+            cache._clear_entries()
+        self._counters.__init__()
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the combined usage of every cache in the family."""
+        caches = list(self._caches)
+        return CacheStats(
+            sum(len(cache) for cache in caches),
+            self._max_size,
+            self._counters.hits,
+            self._counters.misses,
+            self._counters.evictions,
+            sum(cache._estimated_bytes for cache in caches),
+        )
+
+
+def get_cache(name: str) -> Union[LruCache, LruCacheFamily]:
+    """Get a registered cache by name.
+
+    Raises:
+        KeyError: If no cache is registered with the name.
+    """
+    return _REGISTRY[name]
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """Get usage statistics for every registered cache, keyed by cache name."""
+    return {name: cache.stats() for name, cache in _REGISTRY.items()}
+
+
+def clear_caches():
+    """Clear every registered cache."""
+    for cache in _REGISTRY.values():
+        cache.clear()
@@ -1,14 +1,57 @@
-from collections.abc import Callable
-from typing import Optional
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from itertools import chain
+from operator import methodcaller
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from neoscore.core.brush import Brush
 from neoscore.core.page_supplier import PageOverlayFunc, PageSupplier
 from neoscore.core.paper import Paper
 from neoscore.core.point import Point
+from neoscore.core.rect import Rect
+from neoscore.core.render_profiling import POST_RENDER_HOOK, PRE_RENDER_HOOK, profiler
 from neoscore.core.units import ZERO, Mm
 
+if TYPE_CHECKING:
+    from neoscore.core.layout_controllers import NewLine
+    from neoscore.core.positioned_object import PositionedObject
+
 _PAGE_DISPLAY_GAP = Mm(50)
 
+_run_pre_render_hook = methodcaller("pre_render_hook")
+_run_post_render_hook = methodcaller("post_render_hook")
+
+
+def _run_pre_render_hook_profiled(obj: PositionedObject):
+    with profiler.phase(type(obj), PRE_RENDER_HOOK):
+        obj.pre_render_hook()
+
+
+def _run_post_render_hook_profiled(obj: PositionedObject):
+    with profiler.phase(type(obj), POST_RENDER_HOOK):
+        obj.post_render_hook()
+
+
+def _render_hook_runners() -> Tuple[
+    Callable[[PositionedObject], Any], Callable[[PositionedObject], Any]
+]:
+    """Get functions running objects' pre- and post-render hooks.
+
+    These record timings when render profiling is enabled.
+    """
+    if profiler.enabled:
+        return _run_pre_render_hook_profiled, _run_post_render_hook_profiled
+    return _run_pre_render_hook, _run_post_render_hook
+
 
 class Document:
 
@@ -27,6 +70,11 @@ class Document:
         """
         self._paper = paper
         self._pages = PageSupplier(self, overlay_func)
+        self._dirty_objects: Dict[int, PositionedObject] = {}
+        self._last_render_state: Optional[Tuple[bool, int]] = None
+        self._rendering_in_progress = False
+        self._cull_bounds: Optional[Tuple[float, float, float, float]] = None
+        self._visible_page_indices: Set[int] = set()
 
     @property
     def paper(self) -> Paper:
@@ -36,6 +84,7 @@ class Document:
     @paper.setter
     def paper(self, value):
         self._paper = value
+        self._invalidate_render()
 
     @property
     def pages(self) -> PageSupplier:
@@ -63,12 +112,46 @@ class Document:
         """
         return self._pages
 
-    def _run_on_all_descendants(self, func: Callable):
+    def walk(
+        self,
+        pre: Optional[Callable[[PositionedObject], Any]] = None,
+        post: Optional[Callable[[PositionedObject], Any]] = None,
+    ):
+        """Visit every object on the document's pages in a single depth-first pass.
+
+        This is a faster alternative to iterating over each page's
+        :obj:`.PositionedObject.descendants` when running a function on every
+        object. Pages themselves are not visited.
+
+        Args:
+            pre: A function called on each object before any of its descendants.
+            post: A function called on each object after all of its descendants.
+                This gives the same order as :obj:`.PositionedObject.descendants`.
+        """
         for page in self.pages:
-            for obj in page.descendants:
-                func(obj)
+            # ``child_iters[i + 1]`` iterates over the children of ``nodes[i]``
+            nodes = []
+            child_iters = [iter(page.children)]
+            while child_iters:
+                child = next(child_iters[-1], None)
+                if child is None:
+                    child_iters.pop()
+                    if nodes:
+                        node = nodes.pop()
+                        if post is not None:
+                            post(node)
+                else:
+                    if pre is not None:
+                        pre(child)
+                    nodes.append(child)
+                    child_iters.append(iter(child.children))
 
-    def render(self, display_page_geometry: bool, background_brush: Brush):
+    def render(
+        self,
+        display_page_geometry: bool,
+        background_brush: Brush,
+        cull_rect: Optional[Rect] = None,
+    ):
         """Render all items in the document.
 
         This should not be called directly.
@@ -76,14 +159,235 @@ class Document:
         Args:
             display_page_geometry: Whether to include a preview of page geometry.
             background_brush: The brush used to draw the scene background.
+            cull_rect: An optional document-space region outside which rendering may
+                be skipped. Objects outside flowables are only rendered if they lie on
+                a page intersecting this region, and objects inside flowables are only
+                rendered in flowable lines intersecting it. Render hooks and layout
+                still run for the whole document.
         """
-        self._run_on_all_descendants(lambda g: g.pre_render_hook())
-        if display_page_geometry:
+        run_pre_render_hook, run_post_render_hook = _render_hook_runners()
+        self._rendering_in_progress = True
+        try:
+            self.walk(post=run_pre_render_hook)
+            if display_page_geometry:
+                for page in self.pages:
+                    page.create_geometry_preview(background_brush)
+            self._set_cull_rect(cull_rect)
             for page in self.pages:
-                page.create_geometry_preview(background_brush)
-        for page in self.pages:
-            page.render()
-        self._run_on_all_descendants(lambda g: g.post_render_hook())
+                page.render()
+            self.walk(post=run_post_render_hook)
+        finally:
+            self._rendering_in_progress = False
+        self._dirty_objects.clear()
+        self._last_render_state = (display_page_geometry, len(self.pages))
+
+    def _set_cull_rect(self, cull_rect: Optional[Rect]):
+        """Set the region used to cull rendering, or ``None`` to render everything.
+
+        The cull rect also applies to later incremental renders of subtrees.
+        """
+        if cull_rect is None:
+            self._cull_bounds = None
+            self._visible_page_indices = set()
+            return
+        left = cull_rect.x.base_value
+        top = cull_rect.y.base_value
+        right = left + cull_rect.width.base_value
+        bottom = top + cull_rect.height.base_value
+        self._cull_bounds = (left, top, right, bottom)
+        self._visible_page_indices = {
+            page.index
+            for page in self.pages
+            if self._is_visible(page.document_space_bounding_rect)
+        }
+
+    def _is_visible(self, rect: Rect) -> bool:
+        """Determine whether a document-space rect intersects the cull rect."""
+        if self._cull_bounds is None:
+            return True
+        left, top, right, bottom = self._cull_bounds
+        x = rect.x.base_value
+        y = rect.y.base_value
+        return (
+            x <= right
+            and x + rect.width.base_value >= left
+            and y <= bottom
+            and y + rect.height.base_value >= top
+        )
+
+    def _is_line_visible(self, line: NewLine) -> bool:
+        """Determine whether a flowable line intersects the cull rect."""
+        if self._cull_bounds is None:
+            return True
+        left, top, right, bottom = self._cull_bounds
+        _, x, y, _, _ = line._document_pos()
+        return (
+            x <= right
+            and x + line.length.base_value >= left
+            and y <= bottom
+            and y + line.height.base_value >= top
+        )
+
+    def _is_page_visible_at(self, x: float) -> bool:
+        """Determine whether the page at a document-space x position is visible.
+
+        Positions between pages belong to the nearest page. Positions beyond the
+        first or last page are always considered visible.
+
+        Args:
+            x: A document-space x position in base units.
+        """
+        if self._cull_bounds is None:
+            return True
+        paper = self.paper
+        stride = (paper.width + _PAGE_DISPLAY_GAP).base_value
+        first_page_left = -(
+            paper.margin_left + paper.gutter + (_PAGE_DISPLAY_GAP / 2)
+        ).base_value
+        index = int((x - first_page_left) // stride)
+        if index < 0 or index >= len(self.pages):
+            return True
+        return index in self._visible_page_indices
+
+    def _mark_dirty(self, obj: PositionedObject):
+        """Record that an object's subtree must be re-rendered.
+
+        Changes made while the document is rendering are ignored, since render-time
+        object churn (like generated flowable lines) is accounted for by the render.
+        """
+        if not self._rendering_in_progress:
+            self._dirty_objects[id(obj)] = obj
+
+    def _invalidate_render(self):
+        """Require the next render to re-render the entire document."""
+        self._last_render_state = None
+
+    def _dirty_subtree_roots(
+        self, display_page_geometry: bool
+    ) -> Optional[List[PositionedObject]]:
+        """Find the topmost dirty objects whose subtrees need to be re-rendered.
+
+        Objects whose geometry depends on the position of an object in a dirty
+        subtree (see :obj:`.PositionedObject._add_position_dependent`) are re-rendered
+        too. Objects removed from the document tree since the last render are skipped.
+
+        Returns ``None`` if the whole document needs to be re-rendered instead. This
+        is the case when there was no previous compatible render, or when a dirty
+        subtree is a page, lies in a flowable, or contains one, since flowable layouts
+        can depend on any of their contents.
+        """
+        if self._last_render_state != (display_page_geometry, len(self.pages)):
+            return None
+        dirty = self._dirty_objects
+        for obj in dirty.values():
+            if hasattr(obj, "_neoscore_flowable_type_marker") or hasattr(
+                obj, "_neoscore_page_type_marker"
+            ):
+                return None
+        self._add_dirty_position_dependents()
+        roots = []
+        for obj in dirty.values():
+            if hasattr(obj, "_neoscore_flowable_type_marker") or hasattr(
+                obj, "_neoscore_page_type_marker"
+            ):
+                return None
+            node = obj
+            is_root = True
+            while True:
+                parent = node.parent
+                if not hasattr(parent, "parent"):
+                    # Document root reached
+                    break
+                if hasattr(parent, "_neoscore_flowable_type_marker"):
+                    return None
+                if node not in parent.children:
+                    # Removed from the tree
+                    is_root = False
+                    break
+                if id(parent) in dirty:
+                    # The ancestor's subtree will be re-rendered anyway
+                    is_root = False
+                    break
+                node = parent
+            if is_root:
+                roots.append(obj)
+        for root in roots:
+            for descendant in root.descendants:
+                if hasattr(descendant, "_neoscore_flowable_type_marker"):
+                    return None
+        return roots
+
+    def _add_dirty_position_dependents(self):
+        """Mark dirty every object depending on the position of a dirty object.
+
+        Dependents of dirty objects' descendants are included, since they move along
+        with their ancestors, as are dependents of those dependents.
+        """
+        dirty = self._dirty_objects
+        pending = list(dirty.values())
+        while pending:
+            obj = pending.pop()
+            for node in chain((obj,), obj.descendants):
+                dependents = node._position_dependents
+                if not dependents:
+                    continue
+                for dependent in dependents:
+                    if id(dependent) not in dirty:
+                        dirty[id(dependent)] = dependent
+                        pending.append(dependent)
+
+    def _render_subtrees(self, roots: List[PositionedObject]):
+        """Tear down and re-render the subtrees of some objects outside flowables.
+
+        Re-rendered Qt items are restacked so the document's depth-first stacking
+        order is preserved.
+
+        This should not be called directly.
+        """
+        run_pre_render_hook, run_post_render_hook = _render_hook_runners()
+        self._rendering_in_progress = True
+        try:
+            for root in roots:
+                for interface in root.interfaces:
+                    interface.remove()
+                if root._interface_for_children:
+                    root._interface_for_children.remove()
+                for obj in chain((root,), root.descendants):
+                    obj.interfaces.clear()
+                    obj._interface_for_children = None
+            for root in roots:
+                for obj in root.descendants:
+                    run_pre_render_hook(obj)
+                run_pre_render_hook(root)
+            for root in roots:
+                root.render()
+                Document._restack_rendered_subtree(root)
+            for root in roots:
+                for obj in root.descendants:
+                    run_post_render_hook(obj)
+                run_post_render_hook(root)
+        finally:
+            self._rendering_in_progress = False
+        self._dirty_objects.clear()
+
+    @staticmethod
+    def _restack_rendered_subtree(root: PositionedObject):
+        siblings = root.parent.children
+        index = next(i for i, sibling in enumerate(siblings) if sibling is root)
+        anchor = next(
+            (
+                sibling._interface_for_children
+                for sibling in siblings[index + 1 :]
+                if sibling._interface_for_children
+            ),
+            None,
+        )
+        if anchor is None:
+            # Root is already the topmost rendered sibling
+            return
+        for interface in chain((root._interface_for_children,), root.interfaces):
+            if interface is not None and interface.parent is anchor.parent:
+                interface.stack_before(anchor)
 
     def page_origin(self, index: int) -> Point:
         """Find the origin point of a given page number.
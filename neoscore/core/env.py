@@ -25,3 +25,19 @@ DEBUG = _resolve_bool_env_variable("NEOSCORE_DEBUG")
 
 Set by the environment variable ``NEOSCORE_DEBUG``.
 """
+
+
+CACHE_DIR = os.environ.get("NEOSCORE_CACHE_DIR")
+"""A directory for persistent caches, overriding the platform default.
+
+Set by the environment variable ``NEOSCORE_CACHE_DIR``. If set to an empty string,
+persistent caching is disabled.
+"""
+
+
+PROFILE_RENDER = _resolve_bool_env_variable("NEOSCORE_PROFILE_RENDER")
+"""Whether document renders record per-class timings.
+
+Set by the environment variable ``NEOSCORE_PROFILE_RENDER``. See
+:obj:`.render_profiling`.
+"""
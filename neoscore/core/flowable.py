@@ -1,15 +1,26 @@
 from __future__ import annotations
 
-from typing import Optional
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
 
 from sortedcontainers import SortedKeyList
 
 from neoscore.core import neoscore
+from neoscore.core.caching import LruCacheFamily
 from neoscore.core.layout_controllers import MarginController, NewLine
+from neoscore.core.line_breakers import GreedyLineBreaker, LineBreaker
 from neoscore.core.point import Point, PointDef
 from neoscore.core.positioned_object import PositionedObject
+from neoscore.core.render_profiling import LAYOUT, profiler
 from neoscore.core.units import ZERO, Mm, Unit
 
+if TYPE_CHECKING:
+    from neoscore.core.page import Page
+
+_LAYOUT_CACHES: LruCacheFamily[Hashable, List[NewLine]] = LruCacheFamily(
+    "flowable_layouts", 16
+)
+
 
 class Flowable(PositionedObject):
 
@@ -36,6 +47,7 @@ class Flowable(PositionedObject):
         height: Unit,
         y_padding: Unit = Mm(5),
         break_threshold: Unit = Mm(5),
+        line_breaker: Optional[LineBreaker] = None,
     ):
         """
         Args:
@@ -49,14 +61,19 @@ class Flowable(PositionedObject):
             y_padding: The vertical gap between flowable sections
             break_threshold: The maximum distance the flowable will shorten a line
                 to allow a break to occur on a ``BreakOpportunity``
+            line_breaker: The strategy used to choose line breaks. Defaults to a
+                :obj:`.GreedyLineBreaker`.
         """
         super().__init__(pos, parent)
         self._length = length
         self._height = height
         self._y_padding = y_padding
         self._break_threshold = break_threshold
+        self._line_breaker = line_breaker or GreedyLineBreaker()
         self._lines = []
+        self._line_starts = []
         self._provided_controllers = Flowable._new_provided_controllers_list()
+        self._layout_cache = _LAYOUT_CACHES.new_cache()
 
     @property
     def length(self) -> Unit:
@@ -71,6 +88,7 @@ class Flowable(PositionedObject):
     @height.setter
     def height(self, value: Unit):
         self._height = value
+        self.mark_dirty()
 
     @property
     def y_padding(self) -> Unit:
@@ -80,6 +98,7 @@ class Flowable(PositionedObject):
     @y_padding.setter
     def y_padding(self, value: Unit):
         self._y_padding = value
+        self.mark_dirty()
 
     @property
     def break_threshold(self) -> Unit:
@@ -97,6 +116,21 @@ class Flowable(PositionedObject):
     @break_threshold.setter
     def break_threshold(self, value: Unit):
         self._break_threshold = value
+        self.mark_dirty()
+
+    @property
+    def line_breaker(self) -> LineBreaker:
+        """The strategy used to choose where lines break.
+
+        The default :obj:`.GreedyLineBreaker` fills each line in turn, while an
+        :obj:`.OptimalLineBreaker` chooses breaks minimizing badness across all lines.
+        """
+        return self._line_breaker
+
+    @line_breaker.setter
+    def line_breaker(self, value: LineBreaker):
+        self._line_breaker = value
+        self.mark_dirty()
 
     @property
     def lines(self) -> List[NewLine]:
@@ -108,6 +142,7 @@ class Flowable(PositionedObject):
     @lines.setter
     def lines(self, value: List[NewLine]):
         self._lines = value
+        self._index_lines()
 
     @property
     def provided_controllers(self) -> SortedKeyList[MarginController]:
@@ -154,27 +189,56 @@ class Flowable(PositionedObject):
 
         The generated controllers are stored in ``self.layout_controllers``
         in sorted order by ascending x position
+
+        Layouts are cached by a fingerprint of everything they depend on, so when
+        nothing affecting a flowable's layout has changed since a previous render,
+        that render's lines are reused.
         """
         live_page_width = neoscore.document.paper.live_width
         live_page_height = neoscore.document.paper.live_height
+        first_page = self.first_ancestor_with_attr("_neoscore_page_type_marker")
+        flowable_page_pos = first_page.map_to(self)
         break_opps = self._find_break_opportunities()
+        fingerprint = self._layout_fingerprint(
+            first_page, flowable_page_pos, break_opps
+        )
+        cached_lines = self._layout_cache.get(fingerprint)
+        if cached_lines is not None:
+            if cached_lines is not self.lines:
+                for c in self.lines:
+                    c.remove()
+                for c in cached_lines:
+                    c.page._register_child(c)
+                self.lines = cached_lines
+            return
         for c in self.lines:
             c.remove()
         self.lines = []
-        while True:
-            if not self.lines:
-                flowable_start_x = ZERO
-                page = self.first_ancestor_with_attr("_neoscore_page_type_marker")
-                flowable_page_pos = page.map_to(self)
-                new_line_x = flowable_page_pos.x + self._active_margin_at(
-                    flowable_start_x
-                )
+        break_margins = _MarginCursor(self.provided_controllers)
+
+        def max_line_length(flowable_x: Unit) -> Unit:
+            line_x = break_margins.margin_at(flowable_x)
+            if flowable_x == ZERO:
+                line_x += flowable_page_pos.x
+            return live_page_width - line_x
+
+        line_specs = self.line_breaker.break_lines(
+            self.length,
+            break_opps,
+            self.break_threshold,
+            max_line_length,
+        )
+        margins = _MarginCursor(self.provided_controllers)
+        lines = []
+        for flowable_start_x, length in line_specs:
+            if not lines:
+                page = first_page
+                new_line_x = flowable_page_pos.x + margins.margin_at(flowable_start_x)
                 new_line_y = flowable_page_pos.y
             else:
-                last = self.lines[-1]
-                flowable_start_x = last.flowable_x + last.length
+                last = lines[-1]
                 page = last.page
-                new_line_x = self._active_margin_at(flowable_start_x)
+                new_line_x = margins.margin_at(flowable_start_x)
                 new_line_y = last.y + self.height + self.y_padding
                 new_line_bottom_y = new_line_y + self.height
                 if (
@@ -183,21 +247,7 @@ class Flowable(PositionedObject):
                 ):
                     page = neoscore.document.pages[page.index + 1]
                     new_line_y = ZERO
-            # Now determine this line's length
-            max_length = live_page_width - new_line_x
-            max_line_end_flowable_x = flowable_start_x + max_length
-            nearest_break_opp = next(
-                (opp for opp in reversed(break_opps) if opp < max_line_end_flowable_x),
-                None,
-            )
-            if (
-                nearest_break_opp
-                and max_line_end_flowable_x - nearest_break_opp < self.break_threshold
-            ):
-                length = nearest_break_opp - flowable_start_x
-            else:
-                length = max_length
-            self.lines.append(
+            lines.append(
                 NewLine(
                     (new_line_x, new_line_y),
                     page,
@@ -206,27 +256,54 @@ class Flowable(PositionedObject):
                     self.height,
                 )
             )
-            if flowable_start_x + length > self.length:
-                break
+        self.lines = lines
+        self._layout_cache.put(fingerprint, lines)
+
+    def _layout_fingerprint(
+        self, first_page: Page, flowable_page_pos: Point, break_opps: List[Unit]
+    ) -> Hashable:
+        """Summarize every input to line generation in a hashable value.
+
+        Two calls to ``_generate_lines`` whose fingerprints are equal produce
+        identical lines.
+        """
+        paper = neoscore.document.paper
+        return (
+            first_page.index,
+            flowable_page_pos.x.base_value,
+            flowable_page_pos.y.base_value,
+            paper.live_width.base_value,
+            paper.live_height.base_value,
+            self.length.base_value,
+            self.height.base_value,
+            self.y_padding.base_value,
+            self.break_threshold.base_value,
+            self.line_breaker,
+            tuple(opp.base_value for opp in break_opps),
+            tuple(
+                (c.flowable_x.base_value, c.margin_left.base_value, c.layer_key)
+                for c in self.provided_controllers
+            ),
+        )
+
+    def _index_lines(self):
+        """Index line start positions for fast lookup by ``last_break_index_at``.
+
+        Lines are contiguous and sorted, so their raw start positions form a sorted
+        list which can be binary searched.
+        """
+        self._line_starts = [line.flowable_x.base_value for line in self._lines]
 
     def _find_break_opportunities(self) -> List[Unit]:
         """Find the relative X positions of every break hint in this flowable.
 
         The returned positions will be sorted.
         """
-        opps = self.descendants_with_attribute(
+        opps = self._descendants_with_class_attribute(
             "_neoscore_break_opportunity_type_marker"
         )
         return sorted((self.map_x_to(opp) for opp in opps))
 
-    def _active_margin_at(self, flowable_x: Unit) -> Unit:
-        active_margin_layers: Dict[str, Unit] = {}
-        for controller in self.provided_controllers:
-            if controller.flowable_x > flowable_x:
-                break
-            active_margin_layers[controller.layer_key] = controller.margin_left
-        return sum(active_margin_layers.values(), ZERO)
-
     def map_to_canvas(self, local_point: Point) -> Point:
         """Convert a local point to its position in the canvas.
 
@@ -236,11 +313,21 @@ class Flowable(PositionedObject):
         Args:
             local_point: A position in the flowable's local space.
         """
+        x, y = self._map_to_canvas_raw(
+            local_point.x.base_value, local_point.y.base_value
+        )
+        return Point(Unit(None, _raw_base_value=x), Unit(None, _raw_base_value=y))
+
+    def _map_to_canvas_raw(self, x: float, y: float) -> Tuple[float, float]:
+        """Like :obj:`.map_to_canvas`, but in raw base values.
+
+        This is used internally in hot paths to avoid creating units.
+        """
         if not getattr(self, "_currently_rendering", None):
             print("WARNING: Called Flowable.map_to_canvas outside rendering context")
-        line = self.last_break_at(local_point.x)
-        line_canvas_pos = line.canvas_pos()
-        return line_canvas_pos + Point(local_point.x - line.flowable_x, local_point.y)
+        line = self.lines[self._last_break_index_at_raw(x)]
+        line_x, line_y = line._canvas_pos_raw()
+        return line_x + (x - line.flowable_x.base_value), line_y + y
 
     def last_break_at(self, flowable_x: Unit) -> NewLine:
         """Find the last ``NewLine`` that occurred before a given local flowable_x-pos
@@ -256,22 +343,28 @@ class Flowable(PositionedObject):
         Args:
             flowable_x: An x-axis location in the virtual flowable space.
         """
+        return self._last_break_index_at_raw(flowable_x.base_value)
+
+    def _last_break_index_at_raw(self, flowable_x: float) -> int:
+        """Like ``last_break_index_at``, but taking a raw base value."""
         # Note that this assumes that all layout controllers are line
         # breaks, and will not work if/when other types are added
-        remaining_x = flowable_x
-        for i, controller in enumerate(self.lines):
-            remaining_x -= controller.length
-            if remaining_x <= ZERO:
-                return i
-        else:
-            return len(self.lines) - 1
+        if not self._line_starts:
+            return -1
+        # A position within ``Unit`` comparison tolerance of a line's end belongs to
+        # that line rather than the next one.
+        return (
+            bisect_right(self._line_starts, flowable_x - Unit._CMP_POS_EPSILON, lo=1)
+            - 1
+        )
 
     def render(self):
         super().render()
 
     def pre_render_hook(self):
         super().pre_render_hook()
-        self._generate_lines()
+        with profiler.phase(type(self), LAYOUT):
+            self._generate_lines()
 
     def post_render_hook(self):
         # Clear all auto-generated margin controllers
@@ -281,3 +374,30 @@ class Flowable(PositionedObject):
     @staticmethod
     def _new_provided_controllers_list() -> SortedKeyList[MarginController]:
         return SortedKeyList(key=lambda c: c.flowable_x)
+
+
+class _MarginCursor:
+    """Sweeps margin controllers to find the active margin at increasing positions.
+
+    Since lines are generated in order, this lets line generation find every line's
+    margin in a single pass over the controllers.
+    """
+
+    def __init__(self, controllers: SortedKeyList[MarginController]):
+        self._controllers = iter(controllers)
+        self._next_controller = next(self._controllers, None)
+        self._active_margin_layers: Dict[str, Unit] = {}
+
+    def margin_at(self, flowable_x: Unit) -> Unit:
+        """Find the total active margin at a position.
+
+        Positions must not decrease across calls.
+        """
+        while (
+            self._next_controller is not None
+            and not self._next_controller.flowable_x > flowable_x
+        ):
+            controller = self._next_controller
+            self._active_margin_layers[controller.layer_key] = controller.margin_left
+            self._next_controller = next(self._controllers, None)
+        return sum(self._active_margin_layers.values(), ZERO)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
+from neoscore.core.caching import LruCache
 from neoscore.core.rect import Rect
 from neoscore.core.units import Unit
 from neoscore.interface.font_interface import FontInterface
 
-_BOUNDING_RECT_CACHE: Dict[Tuple[Font, str], Rect] = {}
+_BOUNDING_RECT_CACHE: LruCache[Tuple[Font, str], Rect] = LruCache(
+    "font_bounding_rects", 16384
+)
 
 
 class Font:
@@ -17,6 +20,8 @@ class Font:
     :obj:`.Font.modified`
     """
 
+    _compose_glyph_paths = False
+
     def __init__(
         self,
         family_name: str,
@@ -38,7 +43,11 @@ class Font:
         self._weight = weight
         self._italic = italic
         self._interface = FontInterface(
-            self.family_name, self.size, self.weight, self.italic
+            self.family_name,
+            self.size,
+            self.weight,
+            self.italic,
+            self._compose_glyph_paths,
         )
 
     @property
@@ -124,8 +133,8 @@ class Font:
         """Approximate the bounding rect of a string in this font."""
         key = (self, string)
         cached_rect = _BOUNDING_RECT_CACHE.get(key)
-        if cached_rect:
+        if cached_rect is not None:
             return cached_rect
         rect = self._interface.bounding_rect_of(string)
-        _BOUNDING_RECT_CACHE[key] = rect
+        _BOUNDING_RECT_CACHE.put(key, rect)
         return rect
@@ -0,0 +1,227 @@
+"""Strategies for choosing where a :obj:`.Flowable` breaks its lines."""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional, Tuple
+
+from neoscore.core.units import ZERO, Unit
+
+LineSpec = Tuple[Unit, Unit]
+"""A line's starting position in its flowable and its length."""
+
+
+class LineBreaker:
+    """An abstract line breaking strategy for :obj:`.Flowable` layouts.
+
+    Line breakers decide where each flowable line starts and how long it is. They
+    only choose break positions; the flowable is responsible for placing the
+    resulting lines on pages.
+    """
+
+    def break_lines(
+        self,
+        flowable_length: Unit,
+        break_opportunities: List[Unit],
+        break_threshold: Unit,
+        max_line_length: Callable[[Unit], Unit],
+    ) -> List[LineSpec]:
+        """Find the position and length of every line in a flowable.
+
+        Args:
+            flowable_length: The length of the flowable
+            break_opportunities: The sorted positions of every
+                :obj:`.BreakOpportunity` in the flowable
+            break_threshold: The maximum distance a line may be shortened to break
+                on a ``BreakOpportunity``
+            max_line_length: A function giving the maximum length of a line
+                starting at a given flowable position. Positions passed to this must
+                not decrease across calls.
+
+        Returns:
+            A list of ``(flowable_x, length)`` pairs for each line in order. Lines
+            must be contiguous, starting at ``ZERO``, and the last line must end
+            past ``flowable_length``.
+        """
+        raise NotImplementedError
+
+
+class GreedyLineBreaker(LineBreaker):
+    """The default first-fit line breaking strategy.
+
+    Each line is made as long as possible, shortened only to break on the last
+    ``BreakOpportunity`` within the flowable's ``break_threshold`` of its maximum
+    end. This is fast, but can leave later lines badly filled.
+    """
+
+    def break_lines(
+        self,
+        flowable_length: Unit,
+        break_opportunities: List[Unit],
+        break_threshold: Unit,
+        max_line_length: Callable[[Unit], Unit],
+    ) -> List[LineSpec]:
+        break_opps = [opp.base_value for opp in break_opportunities]
+        lines = []
+        flowable_start_x = ZERO
+        while True:
+            max_length = max_line_length(flowable_start_x)
+            max_line_end_flowable_x = flowable_start_x + max_length
+            # Find the last break opportunity before the maximum line end,
+            # matching the tolerance of ``Unit`` comparisons
+            nearest_break_opp_i = (
+                bisect_left(
+                    break_opps,
+                    max_line_end_flowable_x.base_value + Unit._CMP_NEG_EPSILON,
+                )
+                - 1
+            )
+            if nearest_break_opp_i >= 0:
+                nearest_break_opp = Unit(break_opps[nearest_break_opp_i])
+            else:
+                nearest_break_opp = None
+            if (
+                nearest_break_opp
+                and max_line_end_flowable_x - nearest_break_opp < break_threshold
+            ):
+                length = nearest_break_opp - flowable_start_x
+            else:
+                length = max_length
+            lines.append((flowable_start_x, length))
+            if flowable_start_x + length > flowable_length:
+                return lines
+            flowable_start_x = flowable_start_x + length
+
+
+class OptimalLineBreaker(LineBreaker):
+    """A total-fit line breaking strategy in the style of Knuth and Plass.
+
+    Rather than filling each line in turn, this considers every way of breaking the
+    flowable on its break opportunities and picks the one minimizing total
+    demerits across all lines, so one badly filled line can be avoided by slightly
+    shortening earlier ones.
+
+    As with :obj:`.GreedyLineBreaker`, a line may only break on a
+    ``BreakOpportunity`` within the flowable's ``break_threshold`` of its maximum
+    end. When no such opportunity exists the line is broken at its maximum length,
+    which incurs ``forced_break_demerits``. The last line is never penalized.
+
+    Only break opportunities within the threshold window of each candidate line
+    start are examined, and candidates already worse than a complete layout are
+    pruned, so layout time stays close to linear in the number of break
+    opportunities for typical thresholds.
+    """
+
+    def __init__(self, line_penalty: float = 10, forced_break_demerits: float = 1e5):
+        """
+        Args:
+            line_penalty: A penalty added to the badness of every line. Larger values
+                favor layouts with fewer lines.
+            forced_break_demerits: The demerits of breaking a line at its maximum
+                length when no break opportunity is available.
+        """
+        self._line_penalty = line_penalty
+        self._forced_break_demerits = forced_break_demerits
+
+    @property
+    def line_penalty(self) -> float:
+        """A penalty added to the badness of every line."""
+        return self._line_penalty
+
+    @property
+    def forced_break_demerits(self) -> float:
+        """The demerits of a line broken without a break opportunity."""
+        return self._forced_break_demerits
+
+    def line_demerits(self, slack: float, max_length: float) -> float:
+        """Find the demerits of a line ending on a break opportunity.
+
+        This can be overridden to customize how lines are scored.
+
+        Args:
+            slack: How far the line falls short of its maximum length, in base
+                units.
+            max_length: The line's maximum length, in base units.
+        """
+        badness = 100 * (slack / max_length) ** 3
+        return (self._line_penalty + badness) ** 2
+
+    def break_lines(
+        self,
+        flowable_length: Unit,
+        break_opportunities: List[Unit],
+        break_threshold: Unit,
+        max_line_length: Callable[[Unit], Unit],
+    ) -> List[LineSpec]:
+        break_opps = [opp.base_value for opp in break_opportunities]
+        end = flowable_length.base_value
+        threshold = break_threshold.base_value
+        # Maps each reachable line start to its best total demerits, the
+        # previous line start, and the previous line's length.
+        best: Dict[float, Tuple[float, Optional[float], float]] = {
+            0.0: (0.0, None, 0.0)
+        }
+        # Line starts are popped in increasing order, and lines always move forward,
+        # so a start's best demerits are settled by the time it is popped.
+        pending = [0.0]
+        final: Optional[Tuple[float, float, float]] = None
+
+        def relax(line_end: float, demerits: float, start: float, length: float):
+            existing = best.get(line_end)
+            if existing is None:
+                heapq.heappush(pending, line_end)
+            elif existing[0] <= demerits:
+                return
+            best[line_end] = (demerits, start, length)
+
+        while pending:
+            start = heapq.heappop(pending)
+            demerits = best[start][0]
+            if final is not None and demerits >= final[0]:
+                # Every continuation from here is worse than a complete layout
+                continue
+            max_length = max_line_length(Unit(start)).base_value
+            max_end = start + max_length
+            if max_end - end > Unit._CMP_POS_EPSILON:
+                # A full-length last line from here completes the layout
+                if final is None or demerits < final[0]:
+                    final = (demerits, start, max_length)
+                continue
+            # Break opportunities after the line start, before the maximum line end,
+            # and within the break threshold of it, matching the tolerance of
+            # ``Unit`` comparisons.
+            lo = max(
+                bisect_right(break_opps, start + Unit._CMP_POS_EPSILON),
+                bisect_right(break_opps, max_end - threshold + Unit._CMP_POS_EPSILON),
+            )
+            # Break opportunities past the end of the flowable are ignored.
+            hi = min(
+                bisect_left(break_opps, max_end + Unit._CMP_NEG_EPSILON),
+                bisect_right(break_opps, end + Unit._CMP_POS_EPSILON),
+            )
+            if lo >= hi:
+                relax(
+                    max_end,
+                    demerits + self._forced_break_demerits,
+                    start,
+                    max_length,
+                )
+                continue
+            for i in range(lo, hi):
+                opp = break_opps[i]
+                relax(
+                    opp,
+                    demerits + self.line_demerits(max_end - opp, max_length),
+                    start,
+                    opp - start,
+                )
+
+        _, start, length = final
+        lines = [(Unit(start), Unit(length))]
+        _, prev_start, prev_length = best[start]
+        while prev_start is not None:
+            lines.append((Unit(prev_start), Unit(prev_length)))
+            _, prev_start, prev_length = best[prev_start]
+        lines.reverse()
+        return lines
@@ -0,0 +1,98 @@
+"""A persistent cache of parsed JSON metadata files.
+
+Parsing large JSON files like SMuFL font metadata can dominate the startup time of
+short neoscore programs, so parsed files are stored in a compact binary format in a
+per-user cache directory and reloaded from there in later runs. Cache entries are
+keyed by a hash of the JSON file's contents, so edited files are never read stale.
+
+The cache directory can be overridden or disabled with the ``NEOSCORE_CACHE_DIR``
+environment variable. Failures to read or write the cache are ignored, falling back
+to parsing the JSON directly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import pathlib
+import sys
+import tempfile
+from typing import Any, Optional
+
+from neoscore.core import env
+from neoscore.core.platforms import PlatformType, current_platform
+
+_FORMAT_VERSION = 1
+"""Bump this to invalidate existing cache entries if their format changes."""
+
+
+def default_cache_dir() -> Optional[pathlib.Path]:
+    """Get the directory metadata caches are stored in.
+
+    Returns ``None`` if caching is disabled.
+    """
+    if env.CACHE_DIR is not None:
+        return pathlib.Path(env.CACHE_DIR) if env.CACHE_DIR else None
+    platform = current_platform()
+    if platform == PlatformType.WINDOWS:
+        base = os.environ.get("LOCALAPPDATA")
+        if not base:
+            return None
+        return pathlib.Path(base) / "neoscore" / "Cache"
+    if platform == PlatformType.MAC:
+        return pathlib.Path.home() / "Library" / "Caches" / "neoscore"
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (pathlib.Path(base) if base else pathlib.Path.home() / ".cache") / "neoscore"
+
+
+def load_json(
+    path: str | pathlib.Path, cache_dir: Optional[pathlib.Path] = None
+) -> Any:
+    """Load a JSON file, using a cached binary copy when possible.
+
+    Args:
+        path: The JSON file to load.
+        cache_dir: The cache directory to use. Defaults to
+            :obj:`default_cache_dir`.
+
+    Raises:
+        FileNotFoundError: If the JSON file does not exist.
+        json.JSONDecodeError: If the JSON file is invalid.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+        if cache_dir is None:
+            return json.loads(raw)
+    # marshal's format is specific to the Python version
+    cache_path = cache_dir / (
+        hashlib.sha256(raw).hexdigest()
+        + f"-py{sys.version_info[0]}{sys.version_info[1]}-v{_FORMAT_VERSION}.marshal"
+    )
+    try:
+        with open(cache_path, "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    data = json.loads(raw)
+    _write_cache(cache_path, data)
+    return data
+
+
+def _write_cache(cache_path: pathlib.Path, data: Any):
+    """Atomically write a cache entry, ignoring any failures."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(data, f)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        pass
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import copy
-from typing import Dict, Optional, Type, Union
+from typing import Dict, NamedTuple, Optional, Tuple, Type, Union
 
 from neoscore.core import neoscore, smufl
+from neoscore.core.caching import LruCache
 from neoscore.core.exceptions import (
     MusicFontGlyphNotFoundError,
     MusicFontMetadataNotFoundError,
@@ -15,10 +16,161 @@ from neoscore.core.rect import Rect
 from neoscore.core.units import Mm, Unit, convert_all_to_unit, make_unit_class
 
 
+class _RawGlyphInfo(NamedTuple):
+    """Glyph metadata before conversion to any unit.
+
+    The dicts here are taken directly from the font metadata and must not be mutated.
+    """
+
+    canonical_name: str
+    codepoint: str
+    description: Optional[str]
+    bounding_box: Optional[dict]
+    advance_width: Optional[float]
+    anchors: Optional[dict]
+
+
+class _MusicFontFamilyData:
+    """Unit-independent metadata shared by every ``MusicFont`` of a family.
+
+    Use :obj:`_MusicFontFamilyData.for_family` rather than constructing these directly.
+    """
+
+    def __init__(self, metadata: dict):
+        self.metadata = metadata
+        self._raw_glyph_info: Dict[Tuple[str, Optional[int]], _RawGlyphInfo] = {}
+        self._engraving_defaults: Dict[float, dict] = {}
+
+    @staticmethod
+    def for_family(family_name: str) -> _MusicFontFamilyData:
+        """Get the shared data for a registered music font family.
+
+        Raises:
+            KeyError: If the family is not a registered music font.
+        """
+        metadata = neoscore.registered_music_fonts[family_name]
+        family_data = _FAMILY_DATA.get(family_name)
+        if family_data is None or family_data.metadata is not metadata:
+            # Newly registered or re-registered, so scaled glyph info may be stale
+            family_data = _MusicFontFamilyData(metadata)
+            _FAMILY_DATA[family_name] = family_data
+            _GLYPH_INFO_CACHE.clear()
+        return family_data
+
+    def engraving_defaults(self, unit: Type[Unit]) -> dict:
+        """Get the engraving defaults converted to a unit.
+
+        Since fonts whose units have the same size share the result, it must not be
+        mutated.
+        """
+        result = self._engraving_defaults.get(unit.CONVERSION_RATE)
+        if result is None:
+            result = copy.deepcopy(self.metadata["engravingDefaults"])
+            convert_all_to_unit(result, unit)
+            self._engraving_defaults[unit.CONVERSION_RATE] = result
+        return result
+
+    def raw_glyph_info(
+        self, glyph_name: str, alternate_number: Optional[int]
+    ) -> _RawGlyphInfo:
+        """Look up the unit-independent metadata for a glyph.
+
+        Raises:
+            ValueError: If the glyph could not be found.
+        """
+        key = (glyph_name, alternate_number)
+        result = self._raw_glyph_info.get(key)
+        if result is None:
+            result = self._load_raw_glyph_info(glyph_name, alternate_number)
+            self._raw_glyph_info[key] = result
+        return result
+
+    def _load_raw_glyph_info(
+        self, glyph_name: str, alternate_number: Optional[int]
+    ) -> _RawGlyphInfo:
+        # if an alt glyph get name
+        if alternate_number:
+            glyph_name = self.check_alternate_names(glyph_name, alternate_number)
+
+        # check if glyphname exists then get details from smufl
+        check_name = smufl.glyph_names.get(glyph_name)
+        if check_name:
+            codepoint = check_name["codepoint"]
+            description = check_name["description"]
+        else:
+            #  check is it ligature or optional glyph and get info
+            (codepoint, description) = self.check_optional_glyphs(glyph_name)
+
+        advance_width = None
+        glyph_advance_widths = self.metadata.get("glyphAdvanceWidths")
+        if glyph_advance_widths:
+            advance_width = glyph_advance_widths.get(glyph_name)
+
+        return _RawGlyphInfo(
+            glyph_name,
+            codepoint,
+            description,
+            self.metadata["glyphBBoxes"].get(glyph_name),
+            advance_width,
+            self.metadata["glyphsWithAnchors"].get(glyph_name),
+        )
+
+    def check_alternate_names(self, glyph_name: str, alternate_number: int) -> str:
+        """Find the name of a glyph alternate.
+
+        Raises:
+            ValueError: If the alternate does not exist.
+        """
+        # check if glyphname has alternates
+        alternate_glyphs = self.metadata["glyphsWithAlternates"].get(glyph_name)
+
+        # Alternate not found in the font
+        if not alternate_glyphs:
+            raise ValueError
+
+        # check if valid alt number
+        alt_count = len(alternate_glyphs["alternates"])
+
+        # if the alternate_number is in range
+        if alt_count >= alternate_number:
+            return alternate_glyphs["alternates"][alternate_number - 1]["name"]
+        # Alternate number out of range
+        raise ValueError
+
+    def check_optional_glyphs(self, glyph_name: str) -> Tuple[str, Optional[str]]:
+        """Find the codepoint and description of an optional glyph.
+
+        Raises:
+            ValueError: If the glyph is not an optional glyph in the font.
+        """
+        optional_glyph_field = self.metadata["optionalGlyphs"].get(glyph_name)
+
+        # glyphname is not registered with SMuFL
+        if not optional_glyph_field:
+            raise ValueError
+
+        # some don't have descriptions
+        return optional_glyph_field["codepoint"], optional_glyph_field.get(
+            "description"
+        )
+
+
+_FAMILY_DATA: Dict[str, _MusicFontFamilyData] = {}
+
+_GLYPH_INFO_CACHE: LruCache[
+    Tuple[str, float, str, Optional[int]], GlyphInfo
+] = LruCache("music_font_glyph_info", 16384)
+"""Glyph info shared by all fonts with the same family and unit size"""
+
+
 class MusicFont(Font):
 
     """A SMuFL compliant music font"""
 
+    # Music font glyphs have complex outlines which are much faster to reuse than
+    # to regenerate for every new string.
+    _compose_glyph_paths = True
+
     def __init__(self, family_name: str, size: Union[Unit, Type[Unit]]):
         """
         Args:
@@ -31,16 +183,14 @@ class MusicFont(Font):
         else:
             self._unit = size
         try:
-            self.metadata = neoscore.registered_music_fonts[family_name]
+            self._family_data = _MusicFontFamilyData.for_family(family_name)
         except KeyError:
             raise MusicFontMetadataNotFoundError
-        self._engraving_defaults = copy.deepcopy(self.metadata["engravingDefaults"])
+        self.metadata = self._family_data.metadata
+        self._engraving_defaults = self._family_data.engraving_defaults(self.unit)
         # 1 SMuFL em is the height of a 5-line staff. See:
         # w3c.github.io/smufl/latest/specification/scoring-metrics-glyph-registration.html
         self._em_size = self.unit(4)
-        self._glyph_info_cache = {}
-        # engraving_defaults is small, so eagerly converting it to self.unit is ok
-        convert_all_to_unit(self._engraving_defaults, self.unit)
         super().__init__(family_name, self._em_size, 1, False)
 
     def __str__(self):
@@ -56,6 +206,8 @@ class MusicFont(Font):
     def engraving_defaults(self) -> Dict:
         """The SMuFL engraving defaults for this font.
 
+        This is shared between fonts and must not be modified.
+
         See `SMuFL's description of this data here
         <https://w3c.github.io/smufl/latest/specification/engravingdefaults.html>`_.
         """
@@ -84,52 +236,42 @@ class MusicFont(Font):
                 could not be found in the font.
         """
 
-        key = (glyph_name, alternate_number)
-        cached_result = self._glyph_info_cache.get(key, None)
-        if cached_result:
+        key = (
+            self.family_name,
+            self.unit.CONVERSION_RATE,
+            glyph_name,
+            alternate_number,
+        )
+        cached_result = _GLYPH_INFO_CACHE.get(key)
+        if cached_result is not None:
             return cached_result
         try:
             computed_result = self._glyph_info(glyph_name, alternate_number)
         except ValueError:
             raise MusicFontGlyphNotFoundError(glyph_name, alternate_number)
-        self._glyph_info_cache[key] = computed_result
+        _GLYPH_INFO_CACHE.put(key, computed_result)
         return computed_result
 
     def _glyph_info(
         self, glyph_name: str, alternate_number: Optional[int] = None
     ) -> GlyphInfo:
-        # if an alt glyph get name
-        if alternate_number:
-            glyph_name = self._check_alternate_names(glyph_name, alternate_number)
-
-        # check if glyphname exists then get details from smufl
-        check_name = smufl.glyph_names.get(glyph_name)
-        if check_name:
-            codepoint = check_name["codepoint"]
-            description = check_name["description"]
-        else:
-            #  check is it ligature or optional glyph and get info
-            (codepoint, description) = self._check_optional_glyphs(glyph_name)
-
-        # if we have made it this far and populated
-        # info with all other valid details
-        advance_width = self.unit(0)
-        glyphAdvanceWidths = self.metadata.get("glyphAdvanceWidths")
-        if glyphAdvanceWidths:
-            raw_advance_width = glyphAdvanceWidths.get(glyph_name)
-            if raw_advance_width:
-                advance_width = self.unit(raw_advance_width)
-
-        bounding_rect = copy.deepcopy(self.metadata["glyphBBoxes"].get(glyph_name))
-        if bounding_rect:
-            convert_all_to_unit(bounding_rect, self.unit)
-            bounding_rect = self._convert_bbox_to_rect(bounding_rect)
-
-        # get optional anchor metadata if available
-        anchors = self._load_glyph_anchors(glyph_name)
-
+        raw_info = self._family_data.raw_glyph_info(glyph_name, alternate_number)
+        advance_width = self.unit(raw_info.advance_width or 0)
+        bounding_rect = None
+        if raw_info.bounding_box:
+            bounding_rect = self._convert_bbox_to_rect(
+                {
+                    key: [self.unit(value) for value in values]
+                    for key, values in raw_info.bounding_box.items()
+                }
+            )
         return GlyphInfo(
-            glyph_name, codepoint, description, bounding_rect, advance_width, anchors
+            raw_info.canonical_name,
+            raw_info.codepoint,
+            raw_info.description,
+            bounding_rect,
+            advance_width,
+            self._convert_anchors(raw_info.anchors),
         )
 
     @staticmethod
@@ -160,61 +302,28 @@ class MusicFont(Font):
                 if using an alternate number.
             alternate_number: A glyph alternate number
         """
+        return self._family_data.check_alternate_names(glyph_name, alternate_number)
 
-        # check if glyphname has alternates
-        alternate_glyphs = self.metadata["glyphsWithAlternates"].get(glyph_name)
-
-        # Alternate not found in the font
-        if not alternate_glyphs:
-            raise ValueError
-
-        else:
-            # check if valid alt number
-            alt_count = len(alternate_glyphs["alternates"])
-
-            # if the alternate_number is in range
-            if alt_count >= alternate_number:
-                new_glyph_name = alternate_glyphs["alternates"][alternate_number - 1][
-                    "name"
-                ]
-            else:
-                # Alternate number out of range
-                raise ValueError
-
-        return new_glyph_name
+    def _check_optional_glyphs(self, glyph_name: str) -> Tuple[str, Optional[str]]:
+        """Check to see if the called glyph exists as an optional, and if so return
+        its codepoint and description.
 
-    def _check_optional_glyphs(self, glyph_name: str) -> Tuple[str, str]:
-        """Check to see if the called glyph exists  as an optional, if it does it then
-         populate the GlyphInfo dataclass with basic info.
-
-        Args: info: a partially populated GlyphInfo dataclass
+        Args:
             glyph_name: The canonical name of the glyph, or its main version
                 if using an alternate number.
         """
-
-        # else check the optional glyph list
-        optional_glyph_field = self.metadata["optionalGlyphs"].get(glyph_name)
-
-        if optional_glyph_field:
-            codepoint = optional_glyph_field["codepoint"]
-
-            # some don't have descriptions
-            description = optional_glyph_field.get("description")
-
-        # else glyphname is not registered with SMuFL
-        else:
-            raise ValueError
-
-        return codepoint, description
+        return self._family_data.check_optional_glyphs(glyph_name)
 
     def _load_glyph_anchors(self, glyph_name: str) -> Optional[Dict[str, Point]]:
         """Load any glyph anchors and convert coordinates to neoscore points."""
-        anchors = self.metadata["glyphsWithAnchors"].get(glyph_name)
+        return self._convert_anchors(self.metadata["glyphsWithAnchors"].get(glyph_name))
+
+    def _convert_anchors(self, anchors: Optional[dict]) -> Optional[Dict[str, Point]]:
         if anchors is None:
             return None
-        anchors = copy.deepcopy(anchors)
-        for key, value in anchors.items():
-            # SMuFL coords have opposite Y axis as neoscore, so flip
-            # when wrapping in Point and Unit.
-            anchors[key] = Point(self.unit(value[0]), self.unit(-value[1]))
-        return anchors
+        # SMuFL coords have opposite Y axis as neoscore, so flip
+        # when wrapping in Point and Unit.
+        return {
+            key: Point(self.unit(value[0]), self.unit(-value[1]))
+            for key, value in anchors.items()
+        }
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, List, NamedTuple, Optional, Type, Union, cast
+from typing import List, NamedTuple, Optional, Type, Union, cast
 
 from typing_extensions import TypeAlias
 
 from neoscore.core.brush import BrushDef
+from neoscore.core.caching import LruCache
 from neoscore.core.has_music_font import HasMusicFont
 from neoscore.core.music_char import MusicChar, MusicCharDef
 from neoscore.core.music_font import MusicFont
@@ -27,7 +28,9 @@ class _CachedTextGeometry(NamedTuple):
     bounding_rect: Rect
 
 
-_GEOMETRY_CACHE: Dict[_CachedTextGeometryKey, _CachedTextGeometry] = {}
+_GEOMETRY_CACHE: LruCache[_CachedTextGeometryKey, _CachedTextGeometry] = LruCache(
+    "music_text_geometry", 16384
+)
 
 
 MusicStringDef: TypeAlias = Union[MusicCharDef, List[MusicCharDef]]
@@ -123,6 +126,7 @@ class MusicText(Text, HasMusicFont):
     def music_chars(self, value: List[MusicChar]):
         self._music_chars = value
         self._text = MusicText._music_chars_to_str(value)
+        self.mark_dirty()
 
     @property
     def text(self) -> str:
@@ -137,6 +141,7 @@ class MusicText(Text, HasMusicFont):
         self._music_chars = MusicText._resolve_music_chars(self.music_font, value)
         resolved_str = MusicText._music_chars_to_str(self._music_chars)
         self._text = resolved_str
+        self.mark_dirty()
 
     @property
     def music_font(self) -> MusicFont:
@@ -149,6 +154,7 @@ class MusicText(Text, HasMusicFont):
     @music_font.setter
     def music_font(self, value: MusicFont):
         self._font = value
+        self.mark_dirty()
 
     @property
     def unit(self) -> Type[Unit]:
@@ -159,10 +165,10 @@ class MusicText(Text, HasMusicFont):
     def _raw_scaled_bounding_rect(self) -> Rect:
         key = _CachedTextGeometryKey(self.text, self.music_font, self.scale)
         cached_result = _GEOMETRY_CACHE.get(key)
-        if cached_result:
+        if cached_result is not None:
             return cached_result.bounding_rect
         bounding_rect = self.font.bounding_rect_of(self.text) * self.scale
-        _GEOMETRY_CACHE[key] = _CachedTextGeometry(bounding_rect)
+        _GEOMETRY_CACHE.put(key, _CachedTextGeometry(bounding_rect))
         return bounding_rect
 
     @staticmethod
@@ -8,25 +8,28 @@ from time import time
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 from warnings import warn
 
-import img2pdf  # type: ignore
 from typing_extensions import TypeAlias
 
+from neoscore.core import caching, metadata_cache
 from neoscore.core.brush import Brush, BrushDef
+from neoscore.core.caching import CacheStats
 from neoscore.core.color import Color, ColorDef
 from neoscore.core.exceptions import InvalidImageFormatError
 from neoscore.core.key_event import KeyEvent
 from neoscore.core.mouse_event import MouseEvent
 from neoscore.core.paper import A4, Paper
+from neoscore.core.pdf_writer import StreamingPdfWriter
 from neoscore.core.pen import Pen
 from neoscore.core.point import Point, PointDef
 from neoscore.core.propagating_thread import PropagatingThread
-from neoscore.core.rect import RectDef
-from neoscore.core.units import Unit
+from neoscore.core.rect import Rect, RectDef
+from neoscore.core.units import Mm, Unit
 from neoscore.interface.app_interface import AppInterface
 
 if TYPE_CHECKING:
     from neoscore.core.document import Document
     from neoscore.core.font import Font
+    from neoscore.core.page import Page
 
 
 """The global application state module."""
@@ -69,6 +72,30 @@ When refresh functions indicate no re-render is required, that indication takes
 precedence over this flag.
 """
 
+_incremental_rendering_enabled: bool = False
+"""Whether renders only re-render subtrees changed since the previous render.
+
+Set this using :obj:`.set_incremental_rendering`.
+"""
+
+_item_reconciliation_enabled: bool = False
+"""Whether full renders reuse Qt items from the previous render.
+
+Set this using :obj:`.set_item_reconciliation`.
+"""
+
+_viewport_culling_enabled: bool = False
+"""Whether interactive renders skip content far outside the viewport.
+
+Set this using :obj:`.set_viewport_culling`.
+"""
+
+_viewport_culling_margin: Unit = Mm(100)
+"""How far beyond the visible viewport area culled renders extend."""
+
+_culled_render_rect: Optional[Rect] = None
+"""The document-space region covered by the last culled render, if any."""
+
 _supported_image_extensions = {
     ".bmp",
     ".jpg",
@@ -113,10 +140,18 @@ def setup(paper: Paper = A4):
     global default_font
     global document
     global background_brush
+    global _incremental_rendering_enabled
+    global _item_reconciliation_enabled
+    global _viewport_culling_enabled
+    global _culled_render_rect
     # Some things are imported here to work around cyclic import problems
     from neoscore.core.document import Document
     from neoscore.core.font import Font
 
+    _incremental_rendering_enabled = False
+    _item_reconciliation_enabled = False
+    _viewport_culling_enabled = False
+    _culled_render_rect = None
     document = Document(paper)
 
     app_interface = AppInterface(
@@ -195,8 +230,7 @@ def register_music_font(
     global registered_music_fonts
     family_names = register_font(font_file_path)
     try:
-        with open(metadata_path, "r") as metadata_file:
-            metadata = json.load(metadata_file)
+        metadata = metadata_cache.load_json(metadata_path)
     except FileNotFoundError:
         raise FileNotFoundError(
             "Music font metadata file {} could not be found".format(metadata_path)
@@ -272,24 +306,50 @@ def show(
     global _display_page_geometry_in_refresh_func
     _display_page_geometry_in_refresh_func = display_page_geometry
 
-    _render_document(display_page_geometry, background_brush)
+    _render_document(display_page_geometry, background_brush, True)
     if refresh_func:
         set_refresh_func(refresh_func)
     app_interface.auto_viewport_interaction_enabled = auto_viewport_interaction_enabled
     app_interface.show(min_window_size, max_window_size, fullscreen)
 
 
-def _render_document(display_page_geometry: bool, background_brush: Brush):
+def _render_document(
+    display_page_geometry: bool,
+    background_brush: Brush,
+    cull_to_viewport: bool = False,
+):
     """Render the document, clearing the scene before if needed.
 
     This should be used instead of using ``document.render`` directly.
+
+    Args:
+        display_page_geometry: Whether to include a preview of page geometry.
+        background_brush: The brush used to draw the scene background.
+        cull_to_viewport: Whether this render is for the interactive viewport, and
+            so may skip content outside it if viewport culling is enabled.
     """
     global document
     global app_interface
     global _must_clear_scene_before_next_render
-
+    global _culled_render_rect
+
+    cull_rect = _viewport_cull_rect() if cull_to_viewport else None
+    if cull_rect != _culled_render_rect:
+        # Content culled from the previous render may now be needed,
+        # or content needed before may now be culled.
+        document._invalidate_render()
+        if cull_rect is None:
+            app_interface.reset_scene_rect()
+        _culled_render_rect = cull_rect
+    if _incremental_rendering_enabled and _must_clear_scene_before_next_render:
+        dirty_roots = document._dirty_subtree_roots(display_page_geometry)
+        if dirty_roots is not None:
+            document._render_subtrees(dirty_roots)
+            return
+    reconciler = app_interface.item_reconciler
     if _must_clear_scene_before_next_render:
-        app_interface.clear_scene()
+        if not (_item_reconciliation_enabled and reconciler.tracking_scene):
+            app_interface.clear_scene()
         for page in document.pages:
             for obj in page.descendants:
                 interfaces = getattr(obj, "interfaces", None)
@@ -297,10 +357,148 @@ def _render_document(display_page_geometry: bool, background_brush: Brush):
                     interfaces.clear()
                 if hasattr(obj, "_interface_for_children"):
                     obj._interface_for_children = None
-    document.render(display_page_geometry, background_brush)
+    if _item_reconciliation_enabled:
+        reconciler.begin_frame()
+        try:
+            document.render(display_page_geometry, background_brush, cull_rect)
+        finally:
+            reconciler.end_frame()
+    else:
+        document.render(display_page_geometry, background_brush, cull_rect)
+    if cull_rect is not None:
+        # Keep the whole document scrollable even though only part of it is in
+        # the scene.
+        pages = document.pages
+        app_interface.expand_scene_rect(
+            pages[0].document_space_bounding_rect,
+            pages[-1].document_space_bounding_rect,
+        )
     _must_clear_scene_before_next_render = True
 
 
+def _viewport_cull_rect() -> Optional[Rect]:
+    """Find the region interactive renders should cover, if culling is enabled."""
+    if not _viewport_culling_enabled:
+        return None
+    visible_rect = app_interface.viewport_visible_rect
+    margin = _viewport_culling_margin
+    return Rect(
+        visible_rect.x - margin,
+        visible_rect.y - margin,
+        visible_rect.width + (margin * 2),
+        visible_rect.height + (margin * 2),
+    )
+
+
+def _on_viewport_changed():
+    """Render newly exposed content after the interactive viewport moves."""
+    if _culled_render_rect is None:
+        return
+    visible_rect = app_interface.viewport_visible_rect
+    left = _culled_render_rect.x
+    top = _culled_render_rect.y
+    if (
+        visible_rect.x >= left
+        and visible_rect.y >= top
+        and visible_rect.x + visible_rect.width <= left + _culled_render_rect.width
+        and visible_rect.y + visible_rect.height <= top + _culled_render_rect.height
+    ):
+        return
+    _render_document(_display_page_geometry_in_refresh_func, background_brush, True)
+
+
+def set_incremental_rendering(enabled: bool):
+    """Enable or disable incremental rendering.
+
+    When enabled, re-renders (typically triggered by refresh functions) only tear down
+    and rebuild the subtrees of objects which changed since the previous render,
+    instead of clearing and rebuilding the whole scene. This can make interactive
+    scenes with many static objects much more responsive.
+
+    Changes are tracked through :obj:`.PositionedObject.mark_dirty`, which built-in
+    property setters call automatically. Custom classes whose appearance depends on
+    other state should call it themselves when that state changes.
+
+    Changes involving pages or objects inside a :obj:`.Flowable` fall back to full
+    renders, since they can affect layout elsewhere in the document.
+
+    Args:
+        enabled: Whether incremental rendering should be used.
+    """
+    global _incremental_rendering_enabled
+    _incremental_rendering_enabled = enabled
+    if enabled:
+        # Changes made while disabled were not tracked
+        document._invalidate_render()
+
+
+def set_item_reconciliation(enabled: bool):
+    """Enable or disable reuse of Qt items across renders.
+
+    Normally every render clears the scene and builds new Qt graphics items for every
+    object. When this is enabled, full re-renders instead match each newly rendered
+    interface with the one its object rendered in the same position in the previous
+    render, and update the existing Qt item's changed properties in place. Items which
+    are no longer used are removed afterward.
+
+    This greatly reduces allocation churn in animations using refresh functions,
+    especially when most objects don't change between frames.
+
+    Args:
+        enabled: Whether Qt items should be reused.
+    """
+    global _item_reconciliation_enabled
+    _item_reconciliation_enabled = enabled
+
+
+def set_viewport_culling(enabled: bool, margin: Unit = Mm(100)):
+    """Enable or disable viewport culling in the interactive viewer.
+
+    Normally the interactive viewer renders the whole document, which can make
+    startup and re-renders slow for very long scores. When this is enabled, renders
+    for the interactive viewer only create graphics for pages and flowable lines
+    within ``margin`` of the visible area. More of the document is rendered
+    automatically as the view is scrolled, zoomed, or resized.
+
+    Objects outside flowables are culled by the page they lie on, and objects inside
+    flowables are culled by flowable line. Exported images, PDFs, and SVGs are
+    always fully rendered.
+
+    Args:
+        enabled: Whether viewport culling should be used.
+        margin: How far beyond the visible area to render. Larger margins make
+            re-renders while scrolling less frequent.
+    """
+    global _viewport_culling_enabled
+    global _viewport_culling_margin
+    _viewport_culling_enabled = enabled
+    _viewport_culling_margin = margin
+    if enabled:
+        app_interface.set_view_changed_handler(_on_viewport_changed)
+    else:
+        app_interface.set_view_changed_handler(None)
+
+
+def set_level_of_detail(enabled: bool, threshold: float = 0.35):
+    """Enable or disable simplified rendering when the interactive view is zoomed out.
+
+    When enabled and the viewport scale is below ``threshold``, small objects like
+    noteheads, accidentals and text are painted as solid rectangles of their color
+    instead of their full outlines, and antialiasing is turned off. Larger objects like
+    staff lines and beams are still painted normally. This keeps panning and zooming
+    around large scores smooth at overview zoom levels.
+
+    This only affects the interactive viewport, not exports.
+
+    Args:
+        enabled: Whether simplified rendering should be used.
+        threshold: The viewport scale below which simplified rendering is used.
+            See :obj:`.set_viewport_scale`.
+    """
+    global app_interface
+    app_interface.viewport_lod_threshold = threshold if enabled else None
+
+
 def set_viewport_center_pos(document_pos: PointDef):
     """Center the interactive viewport at a given document-space position.
 
@@ -365,36 +563,79 @@ def get_viewport_rotation() -> float:
     return app_interface.viewport_rotation
 
 
-def render_pdf(pdf_path: str | pathlib.Path, dpi: int = 300):
+def render_pdf(
+    pdf_path: str | pathlib.Path,
+    dpi: int = 300,
+    mode: str = "raster",
+    processes: Optional[int] = None,
+    max_in_flight_pages: int = 8,
+):
     """Render the score as a pdf.
 
+    Two rendering modes are supported:
+
+    * ``"raster"`` renders every page to an image at the given DPI and writes the
+      images into a PDF. Pages are written as soon as they're rendered, so memory
+      use is bounded by ``max_in_flight_pages`` regardless of document length. If
+      rendering fails partway through, the incomplete file is removed.
+    * ``"vector"`` paints every page directly into the PDF as vector graphics. This is
+      much faster and produces far smaller, resolution-independent files. Text is
+      drawn as glyph outlines rather than embedded font text.
+
     Args:
         pdf_path: The output pdf path
-        dpi: Resolution to render at
+        dpi: Resolution to render at. In vector mode, this only sets the precision
+            of coordinates in the PDF.
+        mode: The rendering mode, either ``"raster"`` or ``"vector"``.
+        processes: In raster mode, the number of worker processes to rasterize pages
+            across. If ``None``, pages are rasterized on the main thread. See
+            :obj:`.render_images`.
+        max_in_flight_pages: In raster mode, the maximum number of pages rendered
+            ahead of the one being written. Larger values allow more parallelism at
+            the cost of memory.
+
+    Raises:
+        ValueError: If ``mode`` is not a supported rendering mode, or
+            ``processes`` or ``max_in_flight_pages`` is less than 1.
+        ImageExportError: If low level Qt PDF export fails for unknown reasons.
     """
     global app_interface
     global background_brush
+    if mode not in ("raster", "vector"):
+        raise ValueError(f"Unknown PDF rendering mode: {mode}")
+    if max_in_flight_pages < 1:
+        raise ValueError(
+            f"max_in_flight_pages must be at least 1, got {max_in_flight_pages}"
+        )
+    if processes is not None and processes < 1:
+        raise ValueError(f"processes must be at least 1, got {processes}")
     _render_document(False, background_brush)
-    # Render all pages to temp files
-    page_imgs = []
-    render_threads = []
-    for page in document.pages:
-        img_buffer = bytearray()
-        page_imgs.append(img_buffer)
-        render_threads.append(
-            render_image(
-                page.document_space_bounding_rect,
-                img_buffer,
-                dpi,
-                preserve_alpha=False,
-                wait=False,
-            )
+    if mode == "vector":
+        app_interface.render_pdf(
+            [page.document_space_bounding_rect for page in document.pages],
+            pdf_path,
+            dpi,
         )
-    for thread in render_threads:
-        thread.join()
-    # Assemble into PDF and write it to file path
-    with open(pdf_path, "wb") as f:
-        f.write(img2pdf.convert([bytes(buf) for buf in page_imgs]))
+        return
+    page_imgs = app_interface.render_png_images(
+        [page.document_space_bounding_rect for page in document.pages],
+        dpi,
+        background_brush.color,
+        False,
+        processes,
+        max_in_flight_pages,
+    )
+    try:
+        with open(pdf_path, "wb") as f, StreamingPdfWriter(f) as writer:
+            for img in page_imgs:
+                writer.add_png_page(img, dpi)
+    except BaseException:
+        # Don't leave a truncated PDF behind
+        try:
+            os.remove(pdf_path)
+        except OSError:
+            pass
+        raise
 
 
 def render_image(
@@ -448,17 +689,7 @@ def render_image(
     global app_interface
     global background_brush
 
-    if not ((0 <= quality <= 100) or quality == -1):
-        warn("render_image quality {} invalid; using default.".format(quality))
-        quality = -1
-
-    if (
-        not isinstance(dest, bytearray)
-        and not os.path.splitext(dest)[1] in _supported_image_extensions
-    ):
-        raise InvalidImageFormatError(
-            "image_path {} is not in a supported format.".format(dest)
-        )
+    quality = _validate_image_export(dest, quality)
 
     bg_color = background_brush.color
     _render_document(False, background_brush)
@@ -477,6 +708,180 @@ def render_image(
     return thread
 
 
+def render_images(
+    targets: List[Tuple[Optional[RectDef], str | pathlib.Path | bytearray]],
+    dpi: int = 300,
+    quality: int = -1,
+    autocrop: bool = False,
+    preserve_alpha: bool = True,
+    processes: Optional[int] = None,
+):
+    """Render several sections of the document to images.
+
+    This accepts the same file extensions as :obj:`.render_image`, and blocks until
+    every image is exported.
+
+    If ``processes`` is given, rasterization is spread across that many headless
+    worker processes, so exports of many images scale with the number of available
+    CPU cores (see ``os.cpu_count()``). The document is still laid out and painted
+    into a resolution-independent recording on the main thread, but that is cheap
+    compared to rasterization. Starting workers takes a moment, so this is only
+    worthwhile for larger exports.
+
+    Worker processes are started by running the installed ``neoscore`` package
+    directly, so scripts calling this do not need an ``if __name__ == "__main__"``
+    guard. Fonts registered with :obj:`.register_font` are available to workers.
+
+    Args:
+        targets: A list of ``(rect, dest)`` pairs, where ``rect`` is the part of the
+            document to render, in document coordinates (or ``None`` for the entire
+            scene), and ``dest`` is an output file path or a bytearray to save to.
+            If a bytearray is given, the output format will be PNG.
+        dpi: The pixels per inch of the rendered images.
+        quality: The quality of the output images for compressed
+            image formats. Must be either ``-1`` (default compression) or between ``0``
+            (most compressed) and ``100`` (least compressed).
+        autocrop: Whether to crop the output images to tightly
+            fit the contents of their frames.
+        preserve_alpha: Whether to preserve the alpha channel. If false,
+            ``neoscore.background_brush`` will be used to flatten any transparency.
+        processes: The number of worker processes to use. If ``None``, images are
+            rasterized on the main thread as in :obj:`.render_image`.
+
+    Raises:
+        ValueError: If ``processes`` is given but is less than 1.
+        InvalidImageFormatError: If any file ``dest`` does not have a
+            supported image format file extension.
+        ImageExportError: If low level Qt image export fails for
+            unknown reasons.
+    """
+    global app_interface
+    global background_brush
+
+    if processes is not None and processes < 1:
+        raise ValueError(f"processes must be at least 1, got {processes}")
+    for _, dest in targets:
+        quality = _validate_image_export(dest, quality)
+
+    if processes is None:
+        threads = [
+            render_image(
+                rect,
+                dest,
+                dpi,
+                quality,
+                autocrop,
+                preserve_alpha,
+                wait=False,
+            )
+            for rect, dest in targets
+        ]
+        for thread in threads:
+            thread.join()
+        return
+
+    _render_document(False, background_brush)
+    app_interface.render_images(
+        targets,
+        dpi,
+        quality,
+        background_brush.color,
+        autocrop,
+        preserve_alpha,
+        processes,
+    )
+
+
+def _validate_image_export(dest: str | pathlib.Path | bytearray, quality: int) -> int:
+    """Validate image export arguments, returning the quality to use.
+
+    Raises:
+        InvalidImageFormatError: If ``dest`` is a path without a supported image
+            format file extension.
+    """
+    if not ((0 <= quality <= 100) or quality == -1):
+        warn("render_image quality {} invalid; using default.".format(quality))
+        quality = -1
+
+    if (
+        not isinstance(dest, bytearray)
+        and not os.path.splitext(dest)[1] in _supported_image_extensions
+    ):
+        raise InvalidImageFormatError(
+            "image_path {} is not in a supported format.".format(dest)
+        )
+    return quality
+
+
+def render_svg(
+    rect_or_page: Optional[RectDef | Page],
+    dest: str | pathlib.Path | bytearray,
+    deduplicate_paths: bool = False,
+):
+    """Render a page or section of the document to an SVG image.
+
+    This produces resolution-independent vector output, where one SVG user unit
+    corresponds to one point (:obj:`.Unit`) in the document. Text is drawn as glyph
+    outline paths rather than SVG text.
+
+    Args:
+        rect_or_page: The page to render, or a region of the document in document
+            coordinates. If ``None``, the entire scene will be rendered.
+        dest: An output file path or a bytearray to save to.
+        deduplicate_paths: Whether to write each repeated path (like the many identical
+            noteheads in a typical score) only once, referencing it wherever it
+            appears. This can greatly reduce file size.
+
+    Raises:
+        ImageExportError: If low level Qt SVG export fails for unknown reasons.
+    """
+    global app_interface
+    global background_brush
+    from neoscore.core.page import Page
+
+    if isinstance(rect_or_page, Page):
+        rect = rect_or_page.document_space_bounding_rect
+    else:
+        rect = rect_or_page
+    _render_document(False, background_brush)
+    app_interface.render_svg(rect, dest, deduplicate_paths)
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """Get usage statistics for neoscore's internal caches.
+
+    neoscore memoizes some expensive computations, like text outline generation and
+    text measurement, in bounded least-recently-used caches. This returns a snapshot
+    of each cache's size, hits, misses, evictions and estimated memory use, keyed by
+    cache name.
+    """
+    return caching.cache_stats()
+
+
+def clear_caches():
+    """Clear all of neoscore's internal caches.
+
+    This frees memory held by caches in long-running processes. Caches are refilled
+    as needed, so this never affects rendering results.
+    """
+    caching.clear_caches()
+
+
+def set_cache_max_size(name: str, max_size: int):
+    """Set the maximum number of entries kept by one of neoscore's internal caches.
+
+    Args:
+        name: The cache name, as given in :obj:`.cache_stats`.
+        max_size: The new maximum size. Entries over this limit are evicted
+            immediately, least recently used first.
+
+    Raises:
+        KeyError: If there is no cache with the given name.
+        ValueError: If ``max_size`` is less than 1.
+    """
+    caching.get_cache(name).max_size = max_size
+
+
 def _repl_refresh_func(_: float) -> float:
     """Default refresh func to be used in REPL mode.
 
@@ -484,7 +889,7 @@ def _repl_refresh_func(_: float) -> float:
     """
     global background_brush
     global _display_page_geometry_in_refresh_func
-    _render_document(_display_page_geometry_in_refresh_func, background_brush)
+    _render_document(_display_page_geometry_in_refresh_func, background_brush, True)
     return 0.2
 
 
@@ -511,7 +916,9 @@ def set_refresh_func(refresh_func: RefreshFunc, target_fps: int = 60):
             # Construct default result if none was provided
             result = RefreshFuncResult()
         if result.scene_render_needed:
-            _render_document(_display_page_geometry_in_refresh_func, background_brush)
+            _render_document(
+                _display_page_geometry_in_refresh_func, background_brush, True
+            )
         elapsed_time = time() - frame_time
         return max(frame_wait - elapsed_time, 0)
 
@@ -563,3 +970,4 @@ def shutdown():
     document.
     """
     app_interface.destroy()
+    clear_caches()
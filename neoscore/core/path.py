@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from math import atan, cos, pi, sin, sqrt, tan
-from typing import List, Optional, Tuple, cast
+from typing import Dict, Iterable, List, Optional, Tuple, Union, cast
 
 from neoscore.core.brush import Brush, BrushDef
 from neoscore.core.layout_controllers import NewLine
@@ -14,7 +14,7 @@ from neoscore.core.path_element import (
     PathElement,
 )
 from neoscore.core.pen import Pen, PenDef
-from neoscore.core.point import ORIGIN, Point, PointDef
+from neoscore.core.point import ORIGIN, Point, PointArray, PointDef
 from neoscore.core.positioned_object import PositionedObject, render_cached_property
 from neoscore.core.units import ZERO, Mm, Unit
 from neoscore.interface.path_interface import (
@@ -64,6 +64,8 @@ class Path(PaintedObject):
         self.background_brush = background_brush
         self._rotation = rotation
         self.elements: List[PathElement] = []
+        # Other objects path elements have been anchored to, keyed by ID
+        self._position_anchors: Dict[int, PositionedObject] = {}
         self._current_subpath_start: Optional[Tuple[Point, Optional[parent]]] = None
         self.transform_origin = transform_origin
 
@@ -388,17 +390,10 @@ class Path(PaintedObject):
     @render_cached_property
     def _cacheable_breakable_length(self) -> Unit:
         # Find the positions of every path element relative to the path
-        min_x = Unit(float("inf"))
-        max_x = Unit(-float("inf"))
-        for element in self.elements:
-            # Determine element X relative to self
-            relative_x = self.map_x_to(element)
-            # Now update min/max accordingly
-            if relative_x > max_x:
-                max_x = relative_x
-            if relative_x < min_x:
-                min_x = relative_x
-        return max_x - min_x
+        if not self.elements:
+            return Unit(-float("inf"))
+        relative_xs = [self._map_x_to_raw(element) for element in self.elements]
+        return Unit(None, _raw_base_value=max(relative_xs) - min(relative_xs))
 
     @property
     def breakable_length(self) -> Unit:
@@ -425,6 +420,7 @@ class Path(PaintedObject):
             self._background_brush = Brush.from_def(value)
         else:
             self._background_brush = None
+        self.mark_dirty()
 
     def line_to(self, x: Unit, y: Unit, parent: Optional[PositionedObject] = None):
         """Draw a path from the current position to a new point.
@@ -441,7 +437,29 @@ class Path(PaintedObject):
         """
         if not len(self.elements):
             self.move_to(ZERO, ZERO)
-        self.elements.append(LineTo(Point(x, y), parent or self))
+        self.elements.append(LineTo(Point(x, y), self._anchor(parent)))
+        self.mark_dirty()
+
+    def lines_to(
+        self,
+        points: Union[PointArray, Iterable[PointDef]],
+        parent: Optional[PositionedObject] = None,
+    ):
+        """Draw a series of connected lines through some points.
+
+        This is equivalent to calling :obj:`.line_to` for each point, so batches of
+        coordinates computed in a :obj:`.PointArray` can be added at once.
+
+        Args:
+            points: The end points of each line in order.
+            parent: An optional parent, whose position the target coordinates
+                will be relative to.
+        """
+        if not len(self.elements):
+            self.move_to(ZERO, ZERO)
+        parent = self._anchor(parent)
+        self.elements.extend(LineTo(Point.from_def(p), parent) for p in points)
+        self.mark_dirty()
 
     def move_to(self, x: Unit, y: Unit, parent: Optional[PositionedObject] = None):
         """Close the current sub-path and start a new one.
@@ -452,8 +470,10 @@ class Path(PaintedObject):
             parent: An optional parent, whose position the target coordinate will
                 be relative to.
         """
-        self._current_subpath_start = (Point(x, y), parent or self)
-        self.elements.append(MoveTo(Point(x, y), parent or self))
+        parent = self._anchor(parent)
+        self._current_subpath_start = (Point(x, y), parent)
+        self.elements.append(MoveTo(Point(x, y), parent))
+        self.mark_dirty()
 
     def close_subpath(self):
         """Close the current sub-path with a line.
@@ -503,41 +523,86 @@ class Path(PaintedObject):
         """
         c1 = ControlPoint(
             Point(control_1_x, control_1_y),
-            control_1_parent or self,
+            self._anchor(control_1_parent),
         )
         c2 = ControlPoint(
             Point(control_2_x, control_2_y),
-            control_2_parent or self,
+            self._anchor(control_2_parent),
         )
         if not len(self.elements):
             self.move_to(ZERO, ZERO)
-        self.elements.append(CurveTo(Point(end_x, end_y), end_parent or self, c1, c2))
+        self.elements.append(
+            CurveTo(Point(end_x, end_y), self._anchor(end_parent), c1, c2)
+        )
+        self.mark_dirty()
+
+    def _anchor(self, parent: Optional[PositionedObject]) -> PositionedObject:
+        """Resolve the parent of a new path element, defaulting to ``self``.
 
-    def _relative_element_pos(self, element: PositionedObject) -> Point:
-        return self.map_to(element)
+        The path is registered as depending on the position of any other parent.
+        """
+        if parent is None:
+            return self
+        if parent is not self and id(parent) not in self._position_anchors:
+            self._position_anchors[id(parent)] = parent
+            parent._add_position_dependent(self)
+        return parent
+
+    def _clear_elements(self):
+        """Remove all path elements so the path can be redrawn.
+
+        Elements are removed from the objects they're anchored to, and the path stops
+        depending on those objects' positions. Since elements are invisible leaves,
+        their rendered items are removed directly instead of re-rendering the
+        objects they were anchored to.
+        """
+        for element in self.elements:
+            parts: List[PathElement] = [element]
+            if isinstance(element, CurveTo):
+                parts += [element.control_1, element.control_2]
+            for part in parts:
+                if part._interface_for_children:
+                    part._interface_for_children.remove()
+                    part._interface_for_children = None
+                part.parent._unregister_child(part, mark_dirty=False)
+        self.elements.clear()
+        self._current_subpath_start = None
+        for anchor in self._position_anchors.values():
+            anchor._remove_position_dependent(self)
+        self._position_anchors.clear()
+        self.mark_dirty()
 
     def _resolve_path_elements(self) -> List[ResolvedPathElement]:
         resolved: List[ResolvedPathElement] = []
+        map_to_raw = self._map_to_raw
         for element in self.elements:
             # Interface drawing methods expect coordinates
             # relative to PathInterface root
-            pos = self._relative_element_pos(element)
+            x, y = map_to_raw(element)
             if isinstance(element, LineTo):
-                resolved.append(ResolvedLineTo(pos.x, pos.y))
+                resolved.append(
+                    ResolvedLineTo(
+                        Unit(None, _raw_base_value=x), Unit(None, _raw_base_value=y)
+                    )
+                )
             elif isinstance(element, MoveTo):
-                resolved.append(ResolvedMoveTo(pos.x, pos.y))
+                resolved.append(
+                    ResolvedMoveTo(
+                        Unit(None, _raw_base_value=x), Unit(None, _raw_base_value=y)
+                    )
+                )
             elif isinstance(element, CurveTo):
                 element = cast(CurveTo, element)
-                resolved_c1_pos = self._relative_element_pos(element.control_1)
-                resolved_c2_pos = self._relative_element_pos(element.control_2)
+                c1_x, c1_y = map_to_raw(element.control_1)
+                c2_x, c2_y = map_to_raw(element.control_2)
                 resolved.append(
                     ResolvedCurveTo(
-                        resolved_c1_pos.x,
-                        resolved_c1_pos.y,
-                        resolved_c2_pos.x,
-                        resolved_c2_pos.y,
-                        pos.x,
-                        pos.y,
+                        Unit(None, _raw_base_value=c1_x),
+                        Unit(None, _raw_base_value=c1_y),
+                        Unit(None, _raw_base_value=c2_x),
+                        Unit(None, _raw_base_value=c2_y),
+                        Unit(None, _raw_base_value=x),
+                        Unit(None, _raw_base_value=y),
                     )
                 )
             else:
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import struct
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_COLOR_TYPE_CHANNELS = {0: ("/DeviceGray", 1), 2: ("/DeviceRGB", 3)}
+_POINTS_PER_INCH = 72
+_CATALOG_OBJECT = 1
+_PAGES_OBJECT = 2
+
+
+class StreamingPdfWriter:
+    """A minimal PDF writer which writes raster pages as soon as they're added.
+
+    Pages are PNG images shown full-page. Since PNG image data is already compressed
+    with the same scheme PDF uses, it is copied into the PDF without being decoded.
+    Only the file offsets of written objects are held in memory, so arbitrarily long
+    documents can be written with memory use bounded by the size of a single page.
+    """
+
+    def __init__(self, file: BinaryIO):
+        """
+        Args:
+            file: A binary file to write to. It does not need to be seekable.
+        """
+        self._file = file
+        self._offset = 0
+        self._object_offsets: Dict[int, int] = {}
+        self._page_objects: List[int] = []
+        self._next_object = _PAGES_OBJECT + 1
+        self._closed = False
+        # The second line's high bytes mark the file as binary
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    @property
+    def page_count(self) -> int:
+        """The number of pages written so far."""
+        return len(self._page_objects)
+
+    def add_png_page(self, png: bytes | bytearray, dpi: float):
+        """Write a page showing a PNG image.
+
+        The page is sized to fit the image at the given resolution.
+
+        Args:
+            png: The PNG image data. Only non-interlaced 8-bit grayscale and RGB
+                images are supported.
+            dpi: The pixels per inch of the image.
+
+        Raises:
+            ValueError: If the image is not a supported PNG.
+        """
+        if self._closed:
+            raise ValueError("Cannot add pages to a closed PDF writer")
+        width, height, color_space, colors, data = StreamingPdfWriter._read_png(png)
+        page_width = width * _POINTS_PER_INCH / dpi
+        page_height = height * _POINTS_PER_INCH / dpi
+        image_object = self._write_object(
+            (
+                f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height}"
+                f" /ColorSpace {color_space} /BitsPerComponent 8 /Filter /FlateDecode"
+                f" /DecodeParms << /Predictor 15 /Colors {colors}"
+                f" /BitsPerComponent 8 /Columns {width} >> >>"
+            ),
+            data,
+        )
+        content = f"q {page_width:.4f} 0 0 {page_height:.4f} 0 0 cm /Im0 Do Q"
+        content_object = self._write_object("<< >>", content.encode("ascii"))
+        page_object = self._write_object(
+            f"<< /Type /Page /Parent {_PAGES_OBJECT} 0 R"
+            f" /MediaBox [0 0 {page_width:.4f} {page_height:.4f}]"
+            f" /Resources << /XObject << /Im0 {image_object} 0 R >> >>"
+            f" /Contents {content_object} 0 R >>"
+        )
+        self._page_objects.append(page_object)
+
+    def close(self):
+        """Write the document's page tree and cross-reference table.
+
+        This does not close the underlying file. When the writer is used as a
+        context manager, this is called on exit unless an exception was raised.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        kids = " ".join(f"{page} 0 R" for page in self._page_objects)
+        self._write_object(
+            f"<< /Type /Pages /Kids [{kids}] /Count {len(self._page_objects)} >>",
+            object_number=_PAGES_OBJECT,
+        )
+        self._write_object(
+            f"<< /Type /Catalog /Pages {_PAGES_OBJECT} 0 R >>",
+            object_number=_CATALOG_OBJECT,
+        )
+        xref_offset = self._offset
+        size = self._next_object
+        lines = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        for number in range(1, size):
+            lines.append(f"{self._object_offsets[number]:010d} 00000 n \n")
+        lines.append(
+            f"trailer\n<< /Size {size} /Root {_CATALOG_OBJECT} 0 R >>\n"
+            f"startxref\n{xref_offset}\n%%EOF\n"
+        )
+        self._write("".join(lines).encode("ascii"))
+
+    def __enter__(self) -> StreamingPdfWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Don't finish a document whose pages failed to write; it would look
+            # like a valid PDF missing pages.
+            self._closed = True
+
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self._offset += len(data)
+
+    def _write_object(
+        self,
+        dictionary: str,
+        stream: Optional[bytes] = None,
+        object_number: Optional[int] = None,
+    ) -> int:
+        """Write an indirect object, returning its object number.
+
+        If ``stream`` is given, ``dictionary`` is treated as the stream's dictionary
+        and its ``/Length`` entry is filled in automatically.
+        """
+        if object_number is None:
+            object_number = self._next_object
+            self._next_object += 1
+        self._object_offsets[object_number] = self._offset
+        if stream is None:
+            self._write(
+                f"{object_number} 0 obj\n{dictionary}\nendobj\n".encode("ascii")
+            )
+            return object_number
+        dictionary = dictionary[:-2] + f" /Length {len(stream)} >>"
+        self._write(f"{object_number} 0 obj\n{dictionary}\nstream\n".encode("ascii"))
+        self._write(stream)
+        self._write(b"\nendstream\nendobj\n")
+        return object_number
+
+    @staticmethod
+    def _read_png(png: bytes | bytearray) -> Tuple[int, int, str, int, bytes]:
+        """Extract the image properties and compressed data of a PNG image.
+
+        Returns:
+            A tuple of the image's width, height, PDF color space, color channel
+            count, and concatenated ``IDAT`` data.
+
+        Raises:
+            ValueError: If the image is not a supported PNG.
+        """
+        if png[:8] != _PNG_SIGNATURE:
+            raise ValueError("Image is not a PNG")
+        position = 8
+        header = None
+        data_chunks = []
+        while position < len(png):
+            length, chunk_type = struct.unpack(">I4s", png[position : position + 8])
+            chunk_data = png[position + 8 : position + 8 + length]
+            if chunk_type == b"IHDR":
+                header = struct.unpack(">IIBBBBB", chunk_data)
+            elif chunk_type == b"IDAT":
+                data_chunks.append(chunk_data)
+            elif chunk_type == b"IEND":
+                break
+            # Skip chunk length, type, data, and CRC
+            position += 12 + length
+        if header is None or not data_chunks:
+            raise ValueError("PNG is missing image data")
+        width, height, bit_depth, color_type, _, _, interlace = header
+        if (
+            bit_depth != 8
+            or interlace != 0
+            or color_type not in _PNG_COLOR_TYPE_CHANNELS
+        ):
+            raise ValueError(
+                "Only non-interlaced 8-bit grayscale and RGB PNGs are supported"
+            )
+        color_space, colors = _PNG_COLOR_TYPE_CHANNELS[color_type]
+        return width, height, color_space, colors, b"".join(data_chunks)
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
-from typing import NamedTuple, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from typing_extensions import TypeAlias
 
-from neoscore.core.units import ZERO, Unit
+from neoscore.core.units import ZERO, Unit, UnitArray, _numpy
+
+if TYPE_CHECKING:
+    import numpy
 
 
 class Point(NamedTuple):
@@ -63,3 +76,150 @@ ORIGIN = Point(ZERO, ZERO)
 
 PointDef: TypeAlias = Union[Point, Tuple[Unit, Unit]]
 """A Point or an argument tuple for one"""
+
+
+class PointArray:
+    """An immutable array of two-dimensional points sharing a unit type.
+
+    ``PointArray`` works like a sequence of :obj:`Point` objects, but stores its
+    coordinates as an ``(n, 2)`` NumPy array of base unit floats, so whole batches of
+    points can be offset and scaled in single NumPy operations. This requires NumPy to
+    be installed.
+    ::
+
+        points = PointArray([(Mm(1), Mm(2)), (Mm(3), Mm(4))], Mm)
+        points + Point(Mm(1), Mm(1))  # PointArray([(2.0, 3.0), (4.0, 5.0)], Mm)
+
+    Arithmetic works like that of :obj:`.UnitArray`, with points or point arrays in
+    place of units.
+    """
+
+    __slots__ = ("base_values", "unit")
+
+    def __init__(
+        self,
+        points: Union[PointArray, Iterable[PointDef], numpy.ndarray],
+        unit: Type[Unit] = Unit,
+        _raw_base_values: Optional[numpy.ndarray] = None,
+    ):
+        """
+        Args:
+            points: The array's points. This can be another ``PointArray``, which will
+                be converted to ``unit``, an ``(n, 2)`` array of numbers in ``unit``, or
+                any iterable of ``PointDef``\ s.
+            unit: The unit type of the array's coordinates.
+        """
+        np = _numpy()
+        if _raw_base_values is not None:
+            # Short-circuiting constructor for internal use
+            base_values = _raw_base_values
+        elif isinstance(points, PointArray):
+            base_values = points.base_values
+        elif isinstance(points, np.ndarray):
+            base_values = points.astype(np.float64) * unit.CONVERSION_RATE
+        else:
+            rate = unit.CONVERSION_RATE
+            base_values = np.array(
+                [
+                    [
+                        v.base_value if hasattr(v, "base_value") else v * rate
+                        for v in point
+                    ]
+                    for point in points
+                ],
+                np.float64,
+            )
+        base_values = base_values.reshape(-1, 2)
+        if base_values.flags.writeable:
+            base_values.flags.writeable = False
+        self.base_values: numpy.ndarray = base_values
+        """The underlying ``(n, 2)`` float64 array of coordinates in base units."""
+        self.unit: Type[Unit] = unit
+        """The unit type of coordinates in this array."""
+
+    @staticmethod
+    def from_xy(x: UnitArray, y: UnitArray) -> PointArray:
+        """Create a point array from arrays of X and Y coordinates.
+
+        The result uses the unit of ``x``.
+        """
+        np = _numpy()
+        return PointArray(None, x.unit, np.column_stack((x.base_values, y.base_values)))
+
+    def _new(self, base_values: numpy.ndarray) -> PointArray:
+        return PointArray(None, self.unit, base_values)
+
+    @property
+    def x(self) -> UnitArray:
+        """The X coordinates of every point"""
+        return UnitArray(None, self.unit, self.base_values[:, 0])
+
+    @property
+    def y(self) -> UnitArray:
+        """The Y coordinates of every point"""
+        return UnitArray(None, self.unit, self.base_values[:, 1])
+
+    def __repr__(self):
+        rate = self.unit.CONVERSION_RATE
+        return "PointArray({}, {})".format(
+            [
+                (round(x / rate, 3), round(y / rate, 3))
+                for x, y in self.base_values.tolist()
+            ],
+            self.unit.__name__,
+        )
+
+    def __len__(self) -> int:
+        return len(self.base_values)
+
+    def __iter__(self) -> Iterator[Point]:
+        unit = self.unit
+        for x, y in self.base_values.tolist():
+            yield Point(unit(None, _raw_base_value=x), unit(None, _raw_base_value=y))
+
+    def __getitem__(self, key):
+        """Get a single ``Point`` by index, or a ``PointArray`` by slice or mask."""
+        values = self.base_values[key]
+        if values.ndim == 2:
+            return self._new(values)
+        unit = self.unit
+        return Point(
+            unit(None, _raw_base_value=float(values[0])),
+            unit(None, _raw_base_value=float(values[1])),
+        )
+
+    def to_list(self) -> list:
+        """Get the array's points as a list of ``Point``\ s."""
+        return list(self)
+
+    @staticmethod
+    def _other_base_values(other: Union[PointArray, PointDef]):
+        base_values = getattr(other, "base_values", None)
+        if base_values is not None:
+            return base_values
+        try:
+            x, y = other
+            return _numpy().array((x.base_value, y.base_value))
+        except (AttributeError, TypeError, ValueError):
+            raise TypeError
+
+    def __add__(self, other: Union[PointArray, PointDef]) -> PointArray:
+        return self._new(self.base_values + PointArray._other_base_values(other))
+
+    def __sub__(self, other: Union[PointArray, PointDef]) -> PointArray:
+        return self._new(self.base_values - PointArray._other_base_values(other))
+
+    def __mul__(self, other: Union[float, numpy.ndarray]) -> PointArray:
+        """Point arrays may be multiplied by scalars or arrays of per-point scalars."""
+        if hasattr(other, "base_value") or hasattr(other, "base_values"):
+            raise TypeError
+        np = _numpy()
+        if isinstance(other, np.ndarray) and other.ndim == 1:
+            other = other[:, np.newaxis]
+        return self._new(self.base_values * other)
+
+    def __neg__(self) -> PointArray:
+        return self._new(-self.base_values)
+
+    def __abs__(self) -> PointArray:
+        return self._new(abs(self.base_values))
@@ -2,12 +2,25 @@ from __future__ import annotations
 
 import math
 from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any, List, Optional, Set, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
+from weakref import WeakKeyDictionary
 
 from backports.cached_property import cached_property
 
 from neoscore.core import neoscore
-from neoscore.core.point import ORIGIN, Point, PointDef
+from neoscore.core.point import ORIGIN, Point, PointArray, PointDef
+from neoscore.core.render_profiling import INTERFACE_CREATION, LAYOUT, profiler
 from neoscore.core.units import ZERO, Unit
 from neoscore.interface.invisible_object_interface import InvisibleObjectInterface
 from neoscore.interface.positioned_object_interface import PositionedObjectInterface
@@ -18,6 +31,9 @@ if TYPE_CHECKING:
     from neoscore.core.layout_controllers import NewLine
 
 
+_NOT_CACHED = object()
+
+
 class render_cached_property(cached_property):  # noqa
 
     """A property annotation for fields which can be cached at render time.
@@ -48,10 +64,15 @@ class render_cached_property(cached_property):  # noqa
     def __get__(self, obj, cls):  # noqa
         if obj is None:
             return self
+        property_name = self.func.__name__
+        # This is a data descriptor (it defines `__set__`), so it takes precedence
+        # over the instance dict and must look up cached values itself.
+        cached = obj.__dict__.get(property_name, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached
         result = self.func(obj)
         if not getattr(obj, "_currently_rendering", None):
             return result
-        property_name = self.func.__name__
         value = obj.__dict__[property_name] = result
         obj._render_cached_properties.add(property_name)  # noqa
         return value
@@ -81,6 +102,20 @@ class PositionedObject:
     ``neoscore.document.pages[n]``
     """
 
+    # Incremented whenever an object with descendants moves or changes parent,
+    # invalidating every object's cached document position.
+    _position_generation = 0
+
+    # A cached ``(generation, x, y, root, flowable)`` tuple of this object's logical
+    # position in base units relative to the root of its ancestor chain (usually the
+    # document), along with that root and the nearest flowable ancestor, if any.
+    _document_pos_cache: Optional[Tuple[int, float, float, Any, Any]] = None
+
+    # Objects outside this object's subtree whose geometry depends on its position,
+    # like paths with elements anchored here, mapped to how many times each has been
+    # added. See ``_add_position_dependent``.
+    _position_dependents: Optional[WeakKeyDictionary] = None
+
     def __init__(
         self,
         pos: PointDef,
@@ -91,14 +126,23 @@ class PositionedObject:
             pos: The position of the object relative to its parent
             parent: The parent object. Defaults to the document's first page.
         """
-        self.pos = pos
         self._children: List[PositionedObject] = []
+        # An index of this object's descendants, mapping each exact class to its
+        # instances keyed by id. This is maintained by ``_register_child`` and
+        # ``_unregister_child`` for every ancestor of a moved subtree.
+        self._descendants_by_class: Dict[
+            Type[PositionedObject], Dict[int, PositionedObject]
+        ] = {}
+        self.pos = pos
         self._parent = PositionedObject._resolve_parent(parent)
         self._set_parent_and_register_self(parent)
         self._render_cached_properties: Set[str] = set()
         self._currently_rendering = False
         self._interfaces = []
         self._interface_for_children = None
+        # Whether ``_interface_for_children`` should be created on first access
+        # because its creation was skipped for an object on a culled page.
+        self._interface_for_children_deferred = False
         self._scale = 1.0
         self._rotation = 0.0
         self.transform_origin = ORIGIN
@@ -111,6 +155,8 @@ class PositionedObject:
     @pos.setter
     def pos(self, value: PointDef):
         self._pos = Point.from_def(value)
+        self._invalidate_document_pos()
+        self.mark_dirty()
 
     @property
     def scale(self) -> float:
@@ -126,6 +172,7 @@ class PositionedObject:
     @scale.setter
     def scale(self, value: float):
         self._scale = value
+        self.mark_dirty()
 
     @property
     def rotation(self) -> float:
@@ -141,6 +188,7 @@ class PositionedObject:
     @rotation.setter
     def rotation(self, value: float):
         self._rotation = value
+        self.mark_dirty()
 
     @property
     def transform_origin(self) -> Point:
@@ -150,6 +198,7 @@ class PositionedObject:
     @transform_origin.setter
     def transform_origin(self, value: PointDef):
         self._transform_origin = Point.from_def(value)
+        self.mark_dirty()
 
     @property
     def x(self) -> Unit:
@@ -193,6 +242,7 @@ class PositionedObject:
     def parent(self, value: Optional[PositionedObject]):
         self._parent._unregister_child(self)
         self._set_parent_and_register_self(value)
+        self.mark_dirty()
 
     @property
     def children(self) -> List[PositionedObject]:
@@ -201,22 +251,42 @@ class PositionedObject:
 
     @children.setter
     def children(self, value: List[PositionedObject]):
+        old_children = {id(child): child for child in self._children}
+        new_children = {id(child): child for child in value}
+        for key, child in old_children.items():
+            if key not in new_children:
+                self._unindex_child_subtree(child)
+        for key, child in new_children.items():
+            if key not in old_children:
+                self._index_child_subtree(child)
         self._children = value
+        self.mark_dirty()
 
     @property
     def descendants(self) -> Iterator[PositionedObject]:
         """All the objects in the children subtree.
 
-        This recursively searches all the object's children
-        (and their children, etc.) and provides an iterator over them.
+        This searches all the object's children (and their children, etc.) and
+        provides an iterator over them. Each object is yielded after all of its own
+        descendants.
 
-        The current implementation performs a simple recursive DFS over
-        the tree, and has the potential to be rather slow.
+        The traversal uses an explicit stack rather than recursion, so each object is
+        visited in constant time regardless of its depth in the tree. As with
+        iterating over a list, children added to an object before its traversal
+        finishes are included.
         """
-        for child in self.children:
-            for subchild in child.descendants:
-                yield subchild
-            yield child
+        # ``child_iters[i + 1]`` iterates over the children of ``nodes[i]``
+        nodes = []
+        child_iters = [iter(self.children)]
+        while child_iters:
+            child = next(child_iters[-1], None)
+            if child is None:
+                child_iters.pop()
+                if nodes:
+                    yield nodes.pop()
+            else:
+                nodes.append(child)
+                child_iters.append(iter(child.children))
 
     @render_cached_property
     def flowable(self) -> Optional[Flowable]:
@@ -246,23 +316,40 @@ class PositionedObject:
 
         Users should rarely, if ever, have to deal with this field.
         """
+        if (
+            self._interface_for_children is None
+            and self._interface_for_children_deferred
+        ):
+            # Culled at render time, but now needed by a visible descendant.
+            reconciler = neoscore.app_interface.item_reconciler
+            reconciler.push_owner(self)
+            with profiler.phase(type(self), INTERFACE_CREATION):
+                self._create_interface_for_children()
+            reconciler.pop_owner()
         return self._interface_for_children
 
     def descendants_of_class_or_subclass(
         self, graphic_object_class: Type[PositionedObject]
     ) -> Iterator[PositionedObject]:
-        """Yield all child descendants with a given class or its subclasses."""
-        for descendant in self.descendants:
-            if isinstance(descendant, graphic_object_class):
-                yield descendant
+        """Yield all child descendants with a given class or its subclasses.
+
+        This is looked up in this object's class index, taking time proportional to
+        the number of matching descendants rather than the size of the subtree.
+        """
+        return self._indexed_descendants(
+            cls
+            for cls in self._descendants_by_class
+            if issubclass(cls, graphic_object_class)
+        )
 
     def descendants_of_exact_class(
         self, graphic_object_class: Type[PositionedObject]
     ) -> Iterator[PositionedObject]:
-        """Yield all child descendants of a given class, excluding sublcasses"""
-        for descendant in self.descendants:
-            if type(descendant) == graphic_object_class:
-                yield descendant
+        """Yield all child descendants of a given class, excluding sublcasses
+
+        This is looked up in this object's class index.
+        """
+        return self._indexed_descendants((graphic_object_class,))
 
     def descendants_with_attribute(self, attribute: str) -> Iterator[PositionedObject]:
         """Yield all child descendants which has a given attribute.
@@ -273,6 +360,34 @@ class PositionedObject:
             if hasattr(descendant, attribute):
                 yield descendant
 
+    def _descendants_with_class_attribute(
+        self, attribute: str
+    ) -> Iterator[PositionedObject]:
+        """Like :obj:`descendants_with_attribute`, but only matching class attributes.
+
+        This is looked up in this object's class index, so it is much faster for
+        finding descendants by class-level type marker attributes.
+        """
+        return self._indexed_descendants(
+            cls for cls in self._descendants_by_class if hasattr(cls, attribute)
+        )
+
+    def _indexed_descendants(
+        self, classes: Iterable[Type[PositionedObject]]
+    ) -> Iterator[PositionedObject]:
+        """Find descendants of some exact classes using this object's class index.
+
+        The results are collected eagerly, so the tree may be safely modified while
+        iterating over them.
+        """
+        index = self._descendants_by_class
+        result = []
+        for cls in list(classes):
+            class_objects = index.get(cls)
+            if class_objects:
+                result.extend(class_objects.values())
+        return iter(result)
+
     @property
     def ancestors(self) -> Iterator[PositionedObject]:
         """All ancestors of this object.
@@ -303,12 +418,13 @@ class PositionedObject:
             ValueError:
                 If ``descendant`` is not a descendant of this object.
         """
+        self._check_is_ancestor_of(descendant)
+        x, y = self._descendant_pos_raw(descendant)
         pos = descendant.pos
-        for parent in descendant.ancestors:
-            if parent == self:
-                return pos
-            pos += parent.pos
-        raise ValueError(f"{self} is not an ancestor of {descendant}")
+        return Point(
+            type(pos.x)(None, _raw_base_value=x),
+            type(pos.y)(None, _raw_base_value=y),
+        )
 
     def descendant_pos_x(self, descendant: PositionedObject) -> Unit:
         """Find the x position of a descendant relative to this object.
@@ -319,12 +435,24 @@ class PositionedObject:
             ValueError:
                 If ``descendant`` is not a descendant of this object.
         """
-        pos_x = descendant.pos.x
-        for parent in descendant.ancestors:
-            if parent == self:
-                return pos_x
-            pos_x += parent.pos.x
-        raise ValueError(f"{self} is not an ancestor of {descendant}")
+        self._check_is_ancestor_of(descendant)
+        return type(descendant.pos.x)(
+            None,
+            _raw_base_value=descendant._document_pos()[1] - self._document_pos()[1],
+        )
+
+    def _descendant_pos_raw(self, descendant: PositionedObject) -> Tuple[float, float]:
+        """Like :obj:`.descendant_pos`, but in raw base values.
+
+        Unlike ``descendant_pos``, this does not check that ``descendant`` is actually
+        a descendant of this object.
+        """
+        self_cache = self._document_pos()
+        descendant_cache = descendant._document_pos()
+        return (
+            descendant_cache[1] - self_cache[1],
+            descendant_cache[2] - self_cache[2],
+        )
 
     def map_to(self, dst: PositionedObject) -> Point:
         """Find an object's logical position relative to this one
@@ -335,68 +463,96 @@ class PositionedObject:
         for two objects in a ``Flowable`` container whether they are separated by
         a line break.
         """
-        # When changing this method be sure to make the equivalent change in `map_x_to`
-        # Handle easy cases
-        if self == dst:
+        if self is dst:
             return ORIGIN
-        if self.parent == dst.parent:
-            return dst.pos - self.pos
-        if dst.parent == self:
-            return dst.pos
-        if self.parent == dst:
-            return -self.pos
-        # Start by collecting all ancestor using IDs because they're hashable
-        self_ancestor_ids = set(id(obj) for obj in self.ancestors)
-        relative_dst_pos = dst.pos
-        for dst_ancestor in dst.ancestors:
-            if hasattr(dst_ancestor, "parent"):
-                relative_dst_pos += dst_ancestor.pos
-            if id(dst_ancestor) in self_ancestor_ids:
-                # Now find relative_self_pos and return relative_dst_pos - relative_self_pos
-                relative_self_pos = self.pos
-                for self_ancestor in self.ancestors:
-                    if hasattr(self_ancestor, "parent"):
-                        relative_self_pos += self_ancestor.pos
-                    if self_ancestor == dst_ancestor:
-                        return relative_dst_pos - relative_self_pos
-                # Since we've already determined there is a common
-                # ancestor, this should never happen
-                assert False, "Unreachable"
-        raise ValueError(f"{self} and {dst} have no common ancestor")
+        x, y = self._map_to_raw(dst)
+        dst_pos = dst.pos
+        return Point(
+            type(dst_pos.x)(None, _raw_base_value=x),
+            type(dst_pos.y)(None, _raw_base_value=y),
+        )
 
     def map_x_to(self, dst: PositionedObject) -> Unit:
         """Like :obj:`.map_to`, but only return the X distance from to ``dst``."""
+        if self is dst:
+            return ZERO
+        return type(dst.pos.x)(None, _raw_base_value=self._map_x_to_raw(dst))
 
-        # This implementation is copied from `map_to` and tweaked to only handle the X
-        # axis. This is a very common operation, so this optimization is useful.
+    def _map_to_raw(self, dst: PositionedObject) -> Tuple[float, float]:
+        """Like :obj:`.map_to`, but in raw base values.
 
+        This is used internally in hot paths to avoid creating units.
+        """
+        # When changing this method be sure to make the equivalent change in
+        # `_map_x_to_raw`
         # Handle easy cases
-        if self == dst:
-            return ZERO
-        if self.parent == dst.parent:
-            return dst.x - self.x
-        if dst.parent == self:
-            return dst.x
-        if self.parent == dst:
-            return -self.x
-        # Start by collecting all ancestor using IDs because they're hashable
-        self_ancestor_ids = set(id(obj) for obj in self.ancestors)
-        relative_dst_x = dst.x
-        for dst_ancestor in dst.ancestors:
-            if hasattr(dst_ancestor, "parent"):
-                relative_dst_x += dst_ancestor.x
-            if id(dst_ancestor) in self_ancestor_ids:
-                # Now find relative_self_x and return relative_dst_x - relative_self_x
-                relative_self_x = self.x
-                for self_ancestor in self.ancestors:
-                    if hasattr(self_ancestor, "parent"):
-                        relative_self_x += self_ancestor.x
-                    if self_ancestor == dst_ancestor:
-                        return relative_dst_x - relative_self_x
-                # Since we've already determined there is a common
-                # ancestor, this should never happen
-                assert False, "Unreachable"
-        raise ValueError(f"{self} and {dst} have no common ancestor")
+        if self is dst:
+            return 0.0, 0.0
+        dst_parent = dst._parent
+        if dst_parent is self._parent:
+            dst_pos = dst._pos
+            self_pos = self._pos
+            return (
+                dst_pos.x.base_value - self_pos.x.base_value,
+                dst_pos.y.base_value - self_pos.y.base_value,
+            )
+        if dst_parent is self:
+            dst_pos = dst._pos
+            return dst_pos.x.base_value, dst_pos.y.base_value
+        if self._parent is dst:
+            self_pos = self._pos
+            return -self_pos.x.base_value, -self_pos.y.base_value
+        self_cache = self._document_pos()
+        dst_cache = dst._document_pos()
+        if self_cache[3] is not dst_cache[3]:
+            raise ValueError(f"{self} and {dst} have no common ancestor")
+        return dst_cache[1] - self_cache[1], dst_cache[2] - self_cache[2]
+
+    def _map_x_to_raw(self, dst: PositionedObject) -> float:
+        """Like :obj:`.map_x_to`, but in raw base values.
+
+        This is used internally in hot paths to avoid creating units.
+        """
+        # This implementation is copied from `_map_to_raw` and tweaked to only handle
+        # the X axis. This is a very common operation, so this optimization is useful.
+        # Handle easy cases
+        if self is dst:
+            return 0.0
+        dst_parent = dst._parent
+        if dst_parent is self._parent:
+            return dst._pos.x.base_value - self._pos.x.base_value
+        if dst_parent is self:
+            return dst._pos.x.base_value
+        if self._parent is dst:
+            return -self._pos.x.base_value
+        self_cache = self._document_pos()
+        dst_cache = dst._document_pos()
+        if self_cache[3] is not dst_cache[3]:
+            raise ValueError(f"{self} and {dst} have no common ancestor")
+        return dst_cache[1] - self_cache[1]
+
+    def map_to_all(self, dsts: Iterable[PositionedObject]) -> PointArray:
+        """Find many objects' logical positions relative to this one at once.
+
+        This is equivalent to calling :obj:`.map_to` on each object, but returns the
+        positions as a single :obj:`.PointArray` in base units, computed with one
+        NumPy operation. This requires NumPy to be installed.
+
+        Raises:
+            ValueError: If any object does not share a common ancestor with this one.
+        """
+        self_cache = self._document_pos()
+        root = self_cache[3]
+        coords = []
+        for dst in dsts:
+            dst_cache = dst._document_pos()
+            if dst_cache[3] is not root:
+                raise ValueError(f"{self} and {dst} have no common ancestor")
+            coords.append((dst_cache[1], dst_cache[2]))
+        return PointArray(coords) - Point(
+            Unit(None, _raw_base_value=self_cache[1]),
+            Unit(None, _raw_base_value=self_cache[2]),
+        )
 
     def distance_to(self, obj: PositionedObject, offset: Point = ORIGIN) -> Unit:
         """Find the distance to a given object, with an optional extra offset.
@@ -418,21 +574,127 @@ class PositionedObject:
         For objects in :obj:`.Flowable`\ s, this should only be accessed at render time,
         when flowable layouts are available.
         """
-        pos = ORIGIN
-        current = self
-        while hasattr(current, "parent"):
-            pos += current.pos
-            current = current.parent
-            if hasattr(current, "map_to_canvas"):
-                # Parent appears to be a flowable,
-                # so let it decide where the point goes.
-                return cast(Any, current).map_to_canvas(pos)
-        return pos
+        x, y = self._canvas_pos_raw()
+        return Point(Unit(None, _raw_base_value=x), Unit(None, _raw_base_value=y))
+
+    def _canvas_pos_raw(self) -> Tuple[float, float]:
+        """Like :obj:`.canvas_pos`, but in raw base values.
+
+        This is used internally in hot paths to avoid creating units.
+        """
+        _, x, y, _, flowable = self._document_pos()
+        if flowable is not None:
+            # Let the flowable decide where the point goes.
+            _, flowable_x, flowable_y, _, _ = flowable._document_pos()
+            return flowable._map_to_canvas_raw(x - flowable_x, y - flowable_y)
+        return x, y
+
+    def _document_pos(self) -> Tuple[int, float, float, Any, Any]:
+        """Find this object's cached logical document position.
+
+        Returns:
+            A ``(generation, x, y, root, flowable)`` tuple, where ``x`` and ``y`` are
+            the object's position in base units relative to ``root``, the top of its
+            ancestor chain (usually the document), and ``flowable`` is the nearest
+            flowable ancestor, if any.
+
+        Positions are cached until this object or an ancestor moves or changes
+        parent, so repeated coordinate queries don't need to walk the ancestor chain.
+        """
+        generation = PositionedObject._position_generation
+        cache = self._document_pos_cache
+        if cache is not None and cache[0] == generation:
+            return cache
+        # Walk up to the nearest ancestor with a valid cache, or the root
+        uncached = []
+        node = self
+        while True:
+            uncached.append(node)
+            parent = node._parent
+            if not hasattr(parent, "parent"):
+                # Root found
+                cache = (generation, 0.0, 0.0, parent, None)
+                break
+            parent_cache = parent._document_pos_cache
+            if parent_cache is not None and parent_cache[0] == generation:
+                cache = parent_cache
+                break
+            node = parent
+        # Then fill in caches back down to this object
+        for node in reversed(uncached):
+            parent = node._parent
+            if hasattr(parent, "_neoscore_flowable_type_marker"):
+                flowable = parent
+            else:
+                flowable = cache[4]
+            pos = node._pos
+            cache = (
+                generation,
+                cache[1] + pos.x.base_value,
+                cache[2] + pos.y.base_value,
+                cache[3],
+                flowable,
+            )
+            node._document_pos_cache = cache
+        return cache
+
+    def _invalidate_document_pos(self):
+        """Invalidate cached document positions affected by moving this object."""
+        self._document_pos_cache = None
+        if self._children:
+            PositionedObject._position_generation += 1
+
+    def _check_is_ancestor_of(self, descendant: PositionedObject):
+        """Raise a ``ValueError`` if this is not an ancestor of ``descendant``."""
+        ancestor = descendant._parent
+        while hasattr(ancestor, "parent"):
+            if ancestor is self:
+                return
+            ancestor = ancestor._parent
+        raise ValueError(f"{self} is not an ancestor of {descendant}")
 
     def remove(self):
         """Remove this object from the document tree."""
         if self.parent:
-            self.parent.children.remove(self)
+            self.parent._unregister_child(self)
+
+    def _add_position_dependent(self, dependent: PositionedObject):
+        """Record that another object's geometry depends on this object's position.
+
+        When incremental rendering is enabled, dependents are re-rendered along with
+        this object whenever it or one of its ancestors is marked dirty.
+        """
+        if dependent is self:
+            return
+        if self._position_dependents is None:
+            self._position_dependents = WeakKeyDictionary()
+        dependents = self._position_dependents
+        dependents[dependent] = dependents.get(dependent, 0) + 1
+
+    def _remove_position_dependent(self, dependent: PositionedObject):
+        """Undo one call to :obj:`._add_position_dependent`.
+
+        The dependent is forgotten once every addition of it has been undone, so an
+        object anchored here in several ways stays registered until all are gone.
+        """
+        dependents = self._position_dependents
+        if not dependents or dependent not in dependents:
+            return
+        if dependents[dependent] > 1:
+            dependents[dependent] -= 1
+        else:
+            del dependents[dependent]
+
+    def mark_dirty(self):
+        """Mark this object and its descendants as needing to be re-rendered.
+
+        This only has an effect when incremental rendering is enabled with
+        :obj:`.neoscore.set_incremental_rendering`. Built-in property setters call this
+        automatically, but subclasses whose appearance depends on other state should
+        call it whenever that state changes.
+        """
+        if neoscore._incremental_rendering_enabled:
+            neoscore.document._mark_dirty(self)
 
     def pre_render_hook(self):
         """Run code once just before document rendering begins.
@@ -456,73 +718,131 @@ class PositionedObject:
 
         This and other render methods should generally not be called directly.
         """
-        if self.flowable is not None:
-            self.render_in_flowable()
-        else:
-            self._interface_for_children = InvisibleObjectInterface(
-                self.pos,
-                # Hack because root document obj lacks this property
-                getattr(self.parent, "interface_for_children", None),
-                self.scale,
-                self.rotation,
-                self.transform_origin,
-            )
-            self._interface_for_children.render()
-            self.render_complete(self.pos)
+        reconciler = neoscore.app_interface.item_reconciler
+        reconciler.push_owner(self)
+        cls = type(self)
+        with profiler.phase(cls, LAYOUT):
+            if self.flowable is not None:
+                self.render_in_flowable()
+            elif neoscore.document._is_page_visible_at(self._document_pos()[1]):
+                with profiler.phase(cls, INTERFACE_CREATION):
+                    self._create_interface_for_children()
+                    self.render_complete(self.pos)
+            else:
+                # Objects on culled pages get no interfaces, unless a descendant on
+                # a visible page needs this one for its parent.
+                self._interface_for_children = None
+                self._interface_for_children_deferred = True
+        reconciler.pop_owner()
         for child in self.children:
             child.render()
 
+    def _create_interface_for_children(self):
+        self._interface_for_children_deferred = False
+        self._interface_for_children = InvisibleObjectInterface(
+            self.pos,
+            # Hack because root document obj lacks this property
+            getattr(self.parent, "interface_for_children", None),
+            self.scale,
+            self.rotation,
+            self.transform_origin,
+        )
+        self._interface_for_children.render()
+
     def render_in_flowable(self):
         """Render the object to the scene, dispatching partial rendering calls
         when needed if an object flows across a break in the flowable.
 
         This and other render methods should generally not be called directly.
         """
-        # Calculate position within flowable
-        assert self.flowable is not None
-        pos_in_flowable = self.flowable.descendant_pos(self)
-        first_line_i = self.flowable.last_break_index_at(pos_in_flowable.x)
-        first_line = self.flowable.lines[first_line_i]
+        # Calculate position within flowable. Layout math here is done on raw base
+        # values, and units are only created for the render method arguments.
+        flowable = self.flowable
+        assert flowable is not None
+        document = neoscore.document
+        cls = type(self)
+        lines = flowable.lines
+        self_pos = self.pos
+        pos_x, pos_y = flowable._descendant_pos_raw(self)
+        first_line_i = flowable._last_break_index_at_raw(pos_x)
+        first_line = lines[first_line_i]
+        breakable_length = self.breakable_length
+        breakable_length_value = breakable_length.base_value
         first_line_length = (
-            first_line.flowable_x + first_line.length - pos_in_flowable.x
+            first_line.flowable_x.base_value + first_line.length.base_value - pos_x
         )
-        remaining_x = self.breakable_length - first_line_length
-        if remaining_x <= ZERO:
-            self.render_complete(self.canvas_pos(), first_line, pos_in_flowable.x)
+        remaining_x = breakable_length_value - first_line_length
+        flowable_x = type(self_pos.x)(None, _raw_base_value=pos_x)
+        if remaining_x < Unit._CMP_POS_EPSILON:
+            if document._is_line_visible(first_line):
+                line_x, line_y = first_line._canvas_pos_raw()
+                render_pos = Point(
+                    Unit(
+                        None,
+                        _raw_base_value=line_x
+                        + (pos_x - first_line.flowable_x.base_value),
+                    ),
+                    Unit(None, _raw_base_value=line_y + pos_y),
+                )
+                with profiler.phase(cls, INTERFACE_CREATION):
+                    self.render_complete(render_pos, first_line, flowable_x)
             return
 
         # Render before break
-        if first_line_length < Unit(1):
+        if first_line_length - 1 < Unit._CMP_NEG_EPSILON:
             # If a break-spanning object starts very close to its first line end,
             # skip that line.
             first_line_i += 1
-            first_line = self.flowable.lines[first_line_i]
+            first_line = lines[first_line_i]
             first_line_length = (
-                first_line.flowable_x + first_line.length - pos_in_flowable.x
+                first_line.flowable_x.base_value + first_line.length.base_value - pos_x
             )
-            remaining_x = self.breakable_length - first_line_length
-        line_pos = first_line.canvas_pos()
-        render_start_pos = Point(
-            line_pos.x + (pos_in_flowable.x - first_line.flowable_x),
-            line_pos.y + pos_in_flowable.y,
-        )
-        self.render_before_break(render_start_pos, first_line, pos_in_flowable.x)
+            remaining_x = breakable_length_value - first_line_length
+        if document._is_line_visible(first_line):
+            line_x, line_y = first_line._canvas_pos_raw()
+            render_start_pos = Point(
+                Unit(
+                    None,
+                    _raw_base_value=line_x + (pos_x - first_line.flowable_x.base_value),
+                ),
+                Unit(None, _raw_base_value=line_y + pos_y),
+            )
+            with profiler.phase(cls, INTERFACE_CREATION):
+                self.render_before_break(render_start_pos, first_line, flowable_x)
 
         # Iterate through remaining length
-        for current_line_i in range(first_line_i + 1, len(self.flowable.lines)):
-            current_line = self.flowable.lines[current_line_i]
-            line_pos = current_line.canvas_pos()
-            render_start_pos = Point(line_pos.x, line_pos.y + pos_in_flowable.y)
-            local_object_x = self.breakable_length - remaining_x
-            if remaining_x > current_line.length:
-                # Render spanning continuation
-                self.render_spanning_continuation(
-                    render_start_pos, current_line, local_object_x
+        length_type = type(breakable_length)
+        for current_line_i in range(first_line_i + 1, len(lines)):
+            current_line = lines[current_line_i]
+            line_visible = document._is_line_visible(current_line)
+            if line_visible:
+                line_x, line_y = current_line._canvas_pos_raw()
+                render_start_pos = Point(
+                    Unit(None, _raw_base_value=line_x),
+                    Unit(None, _raw_base_value=line_y + pos_y),
                 )
-                remaining_x -= current_line.length
+            current_line_length = current_line.length.base_value
+            if remaining_x - current_line_length > Unit._CMP_POS_EPSILON:
+                # Render spanning continuation
+                if line_visible:
+                    local_object_x = length_type(
+                        None, _raw_base_value=breakable_length_value - remaining_x
+                    )
+                    with profiler.phase(cls, INTERFACE_CREATION):
+                        self.render_spanning_continuation(
+                            render_start_pos, current_line, local_object_x
+                        )
+                remaining_x -= current_line_length
             else:
                 # Render end
-                self.render_after_break(render_start_pos, current_line, local_object_x)
+                if line_visible:
+                    local_object_x = length_type(
+                        None, _raw_base_value=breakable_length_value - remaining_x
+                    )
+                    with profiler.phase(cls, INTERFACE_CREATION):
+                        self.render_after_break(
+                            render_start_pos, current_line, local_object_x
+                        )
                 break
 
     def render_complete(
@@ -632,13 +952,76 @@ class PositionedObject:
         if value is None:
             value = neoscore.document.pages[0]
         self._parent = value
+        self._invalidate_document_pos()
         if hasattr(self._parent, "_register_child"):
             self._parent._register_child(self)
 
     def _register_child(self, child: PositionedObject):
-        """Add an object to ``self.children``."""
+        """Add an object to ``self.children``.
+
+        The child's subtree is added to the class indexes of this object and its
+        ancestors.
+        """
         self.children.append(child)
+        self._index_child_subtree(child)
+        child.mark_dirty()
 
-    def _unregister_child(self, child: PositionedObject):
-        """Remove an object from ``self.children``."""
+    def _unregister_child(self, child: PositionedObject, mark_dirty: bool = True):
+        """Remove an object from ``self.children``.
+
+        The child's subtree is removed from the class indexes of this object and its
+        ancestors.
+
+        Args:
+            child: The child to remove.
+            mark_dirty: Whether to mark this object dirty so the child's rendered
+                items are torn down. Callers passing ``False`` must remove those
+                items themselves.
+        """
         self.children.remove(child)
+        self._unindex_child_subtree(child)
+        if mark_dirty:
+            self.mark_dirty()
+
+    def _index_child_subtree(self, child: PositionedObject):
+        """Add a child's subtree to the class indexes of this object and ancestors."""
+        subtree_index = child._subtree_class_index()
+        ancestor: Any = self
+        while hasattr(ancestor, "_descendants_by_class"):
+            index = ancestor._descendants_by_class
+            for cls, objects in subtree_index.items():
+                class_objects = index.get(cls)
+                if class_objects is None:
+                    index[cls] = dict(objects)
+                else:
+                    class_objects.update(objects)
+            ancestor = ancestor._parent
+
+    def _unindex_child_subtree(self, child: PositionedObject):
+        """Remove a child's subtree from the class indexes of this object and ancestors."""
+        subtree_index = child._subtree_class_index()
+        ancestor: Any = self
+        while hasattr(ancestor, "_descendants_by_class"):
+            index = ancestor._descendants_by_class
+            for cls, objects in subtree_index.items():
+                class_objects = index.get(cls)
+                if class_objects is None:
+                    continue
+                for key in objects:
+                    class_objects.pop(key, None)
+                if not class_objects:
+                    del index[cls]
+            ancestor = ancestor._parent
+
+    def _subtree_class_index(
+        self,
+    ) -> Dict[Type[PositionedObject], Dict[int, PositionedObject]]:
+        """Get a class index of this object and its descendants."""
+        result = {
+            cls: dict(objects) for cls, objects in self._descendants_by_class.items()
+        }
+        class_objects = result.get(type(self))
+        if class_objects is None:
+            class_objects = result[type(self)] = {}
+        class_objects[id(self)] = self
+        return result
@@ -0,0 +1,199 @@
+"""Per-class render timing instrumentation.
+
+When enabled, document renders record how many times each class's objects enter
+each render phase and how long they spend there. Timings are exclusive, so time
+spent in a nested phase (for instance Qt item creation within an object's interface
+creation) is only counted toward the nested phase.
+
+Profiling is enabled by setting the environment variable ``NEOSCORE_PROFILE_RENDER``
+(see :obj:`.env.PROFILE_RENDER`), or by setting :obj:`RenderProfiler.enabled` on
+:obj:`profiler`. Collected timings can be inspected with :obj:`RenderProfiler.stats`
+and dumped with :obj:`RenderProfiler.format_table` or :obj:`RenderProfiler.to_json`.
+When enabled by the environment variable, a table of timings is also printed to
+stderr when the program exits.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import sys
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+from neoscore.core import env
+
+PRE_RENDER_HOOK = "pre_render_hook"
+"""Time spent in ``pre_render_hook`` methods, excluding flowable layout."""
+
+LAYOUT = "layout"
+"""Time spent laying out flowables and positioning objects for rendering."""
+
+INTERFACE_CREATION = "interface_creation"
+"""Time spent in ``render_complete`` and the other partial render methods."""
+
+QT_ITEM_CREATION = "qt_item_creation"
+"""Time spent creating or patching Qt items and adding them to the scene."""
+
+POST_RENDER_HOOK = "post_render_hook"
+"""Time spent in ``post_render_hook`` methods."""
+
+PHASES = (
+    PRE_RENDER_HOOK,
+    LAYOUT,
+    INTERFACE_CREATION,
+    QT_ITEM_CREATION,
+    POST_RENDER_HOOK,
+)
+"""All render phases, in the order they occur."""
+
+_NULL_CONTEXT = nullcontext()
+
+
+@dataclass
+class PhaseStats:
+    """The accumulated timing of one class in one render phase."""
+
+    count: int = 0
+    """The number of times the phase was entered"""
+
+    total_time: float = 0
+    """The total time spent in the phase, in seconds"""
+
+
+class RenderProfiler:
+    """A collector of per-class render phase timings."""
+
+    def __init__(self, enabled: bool = False):
+        """
+        Args:
+            enabled: Whether timings should be collected.
+        """
+        self.enabled = enabled
+        self._stats: Dict[str, Dict[str, PhaseStats]] = {}
+        # Open phases, as [class name, phase, resume time, elapsed time]
+        self._stack: List[list] = []
+
+    def phase(self, cls: Optional[type], phase: str) -> ContextManager:
+        """Time a block of code as a render phase of a class.
+
+        This does nothing if profiling is disabled.
+
+        Args:
+            cls: The class to record the time under. If ``None``, the class of the
+                innermost open phase is used.
+            phase: One of the phases in :obj:`PHASES`.
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._timed_phase(cls, phase)
+
+    @contextmanager
+    def _timed_phase(self, cls: Optional[type], phase: str) -> Iterator[None]:
+        stack = self._stack
+        if cls is None:
+            class_name = stack[-1][0] if stack else "<unknown>"
+        else:
+            class_name = cls.__qualname__
+        now = perf_counter()
+        if stack:
+            # Pause the enclosing phase
+            outer = stack[-1]
+            outer[3] += now - outer[2]
+        frame = [class_name, phase, now, 0.0]
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            now = perf_counter()
+            stack.pop()
+            class_stats = self._stats.setdefault(class_name, {})
+            phase_stats = class_stats.get(phase)
+            if phase_stats is None:
+                phase_stats = class_stats[phase] = PhaseStats()
+            phase_stats.count += 1
+            phase_stats.total_time += frame[3] + (now - frame[2])
+            if stack:
+                stack[-1][2] = now
+
+    def stats(self) -> Dict[str, Dict[str, PhaseStats]]:
+        """Get the timings collected so far.
+
+        Returns:
+            A dict mapping class names to dicts mapping phase names to their stats.
+            Phases a class never entered are omitted.
+        """
+        return {
+            class_name: {
+                phase: PhaseStats(phase_stats.count, phase_stats.total_time)
+                for phase, phase_stats in class_stats.items()
+            }
+            for class_name, class_stats in self._stats.items()
+        }
+
+    def reset(self):
+        """Discard all collected timings."""
+        self._stats.clear()
+
+    def format_table(self) -> str:
+        """Format the collected timings as a plain text table.
+
+        Each row gives a class's total milliseconds and entry count for every phase,
+        and rows are sorted by total time with the slowest classes first.
+        """
+        rows = []
+        for class_name, class_stats in self._stats.items():
+            total = sum(s.total_time for s in class_stats.values())
+            cells = []
+            for phase in PHASES:
+                phase_stats = class_stats.get(phase)
+                if phase_stats is None:
+                    cells.append("-")
+                else:
+                    cells.append(
+                        f"{phase_stats.total_time * 1000:.2f} ({phase_stats.count})"
+                    )
+            rows.append((total, [class_name, f"{total * 1000:.2f}"] + cells))
+        rows.sort(key=lambda row: row[0], reverse=True)
+        header = ["class", "total ms"] + [f"{phase} ms (n)" for phase in PHASES]
+        lines = [header] + [cells for _, cells in rows]
+        widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(line, widths))
+            )
+            for line in lines
+        )
+
+    def to_json(self) -> str:
+        """Serialize the collected timings as JSON.
+
+        The result is an object mapping class names to objects mapping phase names
+        to objects with ``count`` and ``total_time`` (in seconds) fields.
+        """
+        return json.dumps(
+            {
+                class_name: {
+                    phase: asdict(phase_stats)
+                    for phase, phase_stats in class_stats.items()
+                }
+                for class_name, class_stats in self._stats.items()
+            },
+            indent=2,
+        )
+
+
+profiler = RenderProfiler(env.PROFILE_RENDER)
+"""The global render profiler."""
+
+
+def _print_profile_table():
+    if profiler.stats():
+        print(profiler.format_table(), file=sys.stderr)
+
+
+if env.PROFILE_RENDER:
+    atexit.register(_print_profile_table)
@@ -75,21 +75,35 @@ class RepeatingMusicTextLine(Spanner2D, MusicText):
             background_brush=background_brush,
         )
         Spanner2D.__init__(self, end_pos, end_parent or self)
+        self._repeated_text = text
+        self._start_cap_text = start_cap_text
+        self._end_cap_text = end_cap_text
+        self._fill_length()
+
+    def _end_changed(self):
+        super()._end_changed()
+        # The text is first filled in at the end of ``__init__``
+        if hasattr(self, "_repeated_text"):
+            self._fill_length()
+
+    def _fill_length(self):
+        """Set the text to enough repetitions to cover the spanner."""
+        self.text = self._repeated_text
         self.rotation = self.angle
         single_repetition_chars = self.music_chars
         main_char_width = self._approx_width(single_repetition_chars)
 
-        if start_cap_text:
+        if self._start_cap_text:
             # Again need to hackily set temporary text value to work out the width
-            self.text = start_cap_text
+            self.text = self._start_cap_text
             start_cap_chars = self.music_chars
             start_cap_width = self.font.bounding_rect_of(self.text).width
         else:
             start_cap_chars = []
             start_cap_width = ZERO
-        if end_cap_text:
+        if self._end_cap_text:
             # Same idea...
-            self.text = end_cap_text
+            self.text = self._end_cap_text
             end_cap_chars = self.music_chars
             end_cap_width = self.font.bounding_rect_of(self.text).width
         else:
@@ -72,6 +72,7 @@ class RichText(PositionedObject):
     @html_text.setter
     def html_text(self, value: str):
         self._html_text = value
+        self.mark_dirty()
 
     @property
     def width(self) -> Optional[Unit]:
@@ -85,6 +86,7 @@ class RichText(PositionedObject):
     @width.setter
     def width(self, value: Optional[Unit]):
         self._width = value
+        self.mark_dirty()
 
     @property
     def font(self) -> Font:
@@ -97,6 +99,7 @@ class RichText(PositionedObject):
     @font.setter
     def font(self, value: Font):
         self._font = value
+        self.mark_dirty()
 
     # Since RichText isn't breakable (for now?), we only need to
     # implement complete rendering
@@ -1,11 +1,17 @@
-"""SMuFL spec metadata loaded into module constants."""
-import json
+"""SMuFL spec metadata, loaded lazily into module constants on first access."""
 import pathlib
+from typing import Any
 
-# Load metadata into dictionaries
+from neoscore.core import metadata_cache
 
 _SMUFL_DIR = pathlib.Path(__file__).parent / ".." / "resources" / "smufl"
 
+_METADATA_FILES = {
+    "classes": "classes.json",
+    "glyph_names": "glyphnames.json",
+    "ranges": "ranges.json",
+}
+
 classes: dict
 """The raw SMuFL ``classes.json`` metadata.
 
@@ -30,11 +36,12 @@ See https://w3c.github.io/smufl/latest/specification/ranges.html
 :meta hide-value:
 """
 
-with open(_SMUFL_DIR / "classes.json", "r") as classes_file:
-    classes = json.load(classes_file)
-
-with open(_SMUFL_DIR / "glyphnames.json", "r") as glyphnames_file:
-    glyph_names = json.load(glyphnames_file)
 
-with open(_SMUFL_DIR / "ranges.json", "r") as ranges_file:
-    ranges = json.load(ranges_file)
+def __getattr__(name: str) -> Any:
+    # Called only for attributes not yet loaded
+    file_name = _METADATA_FILES.get(name)
+    if file_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = metadata_cache.load_json(_SMUFL_DIR / file_name)
+    globals()[name] = value
+    return value
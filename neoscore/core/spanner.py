@@ -36,7 +36,7 @@ class Spanner:
                 the starting point.
         """
         self._end_x = end_x
-        self._end_parent = end_parent
+        self.end_parent = end_parent
 
     @property
     def end_x(self) -> Unit:
@@ -46,6 +46,7 @@ class Spanner:
     @end_x.setter
     def end_x(self, value: Unit):
         self._end_x = value
+        self._end_changed()
 
     @render_cached_property
     def end_y(self) -> Unit:
@@ -67,7 +68,20 @@ class Spanner:
 
     @end_parent.setter
     def end_parent(self, value: PositionedObject):
+        previous = getattr(self, "_end_parent", None)
+        if previous is not None:
+            previous._remove_position_dependent(cast(PositionedObject, self))
         self._end_parent = value
+        value._add_position_dependent(cast(PositionedObject, self))
+        self._end_changed()
+
+    def _end_changed(self):
+        """Respond to a change of the endpoint.
+
+        Spanners which draw themselves from their endpoint when created should
+        override this to redraw, calling the superclass implementation as well.
+        """
+        cast(PositionedObject, self).mark_dirty()
 
     @render_cached_property
     def spanner_x_length(self) -> Unit:
@@ -91,6 +91,7 @@ class Text(PaintedObject):
     @text.setter
     def text(self, value: str):
         self._text = value
+        self.mark_dirty()
 
     @property
     def font(self) -> Font:
@@ -99,6 +100,7 @@ class Text(PaintedObject):
     @font.setter
     def font(self, value: Font):
         self._font = value
+        self.mark_dirty()
 
     @property
     def background_brush(self) -> Optional[Brush]:
@@ -111,6 +113,7 @@ class Text(PaintedObject):
             self._background_brush = Brush.from_def(value)
         else:
             self._background_brush = None
+        self.mark_dirty()
 
     @property
     def breakable(self) -> bool:
@@ -120,6 +123,7 @@ class Text(PaintedObject):
     @breakable.setter
     def breakable(self, value: bool):
         self._breakable = value
+        self.mark_dirty()
 
     @property
     def alignment_x(self) -> AlignmentX:
@@ -133,6 +137,7 @@ class Text(PaintedObject):
     @alignment_x.setter
     def alignment_x(self, value: AlignmentX):
         self._alignment_x = value
+        self.mark_dirty()
 
     @property
     def alignment_y(self) -> AlignmentY:
@@ -142,6 +147,7 @@ class Text(PaintedObject):
     @alignment_y.setter
     def alignment_y(self, value: AlignmentY):
         self._alignment_y = value
+        self.mark_dirty()
 
     @render_cached_property
     def _alignment_offset(self) -> Point:
@@ -2,7 +2,20 @@
 from __future__ import annotations
 
 import decimal
-from typing import Any, Optional, Type, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+if TYPE_CHECKING:
+    import numpy
 
 TUnit = TypeVar("TUnit", bound="Unit")
 
@@ -157,6 +170,174 @@ ZERO = Unit(0)
 """Shorthand for a zero unit"""
 
 
+_numpy_module: Any = None
+
+
+def _numpy() -> Any:
+    """Import NumPy on first use, since it is an optional dependency."""
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError(
+                "UnitArray and PointArray require NumPy, which can be installed"
+                " with `pip install neoscore[numpy]`"
+            ) from e
+        _numpy_module = numpy
+    return _numpy_module
+
+
+class UnitArray:
+    """An immutable array of graphical distances sharing a unit type.
+
+    ``UnitArray`` works like a sequence of :obj:`Unit` objects, but stores its values
+    as a NumPy array of base unit floats. Arithmetic on the whole array is performed in
+    single NumPy operations instead of allocating a ``Unit`` per value, which is much
+    faster for large batches of coordinates. This requires NumPy to be installed.
+    ::
+
+        UnitArray([1, 2, 3], Mm) + Mm(1)  # UnitArray([2.0, 3.0, 4.0], Mm)
+
+    Values given as plain numbers are interpreted in the array's ``unit``, while
+    ``Unit`` values are converted to it. As with ``Unit``, results of operations
+    between arrays or units are given in the unit of the array on the left. Unlike
+    ``Unit``, arithmetic with a ``UnitArray`` on the right of a ``Unit`` is not
+    supported.
+    """
+
+    __slots__ = ("base_values", "unit")
+
+    def __init__(
+        self,
+        values: Union[UnitArray, Iterable[Union[Unit, float]], numpy.ndarray],
+        unit: Type[Unit] = Unit,
+        _raw_base_values: Optional[numpy.ndarray] = None,
+    ):
+        """
+        Args:
+            values: The array values. This can be another ``UnitArray``, which will be
+                converted to ``unit``, or any iterable of numbers and ``Unit``\ s.
+            unit: The unit type of the array's values.
+        """
+        np = _numpy()
+        if _raw_base_values is not None:
+            # Short-circuiting constructor for internal use
+            base_values = _raw_base_values
+        elif isinstance(values, UnitArray):
+            base_values = values.base_values
+        elif isinstance(values, np.ndarray):
+            base_values = values.astype(np.float64) * unit.CONVERSION_RATE
+        else:
+            rate = unit.CONVERSION_RATE
+            base_values = np.fromiter(
+                (
+                    v.base_value if hasattr(v, "base_value") else v * rate
+                    for v in values
+                ),
+                np.float64,
+            )
+        if base_values.flags.writeable:
+            base_values.flags.writeable = False
+        self.base_values: numpy.ndarray = base_values
+        """The underlying float64 array of values in base units."""
+        self.unit: Type[Unit] = unit
+        """The unit type of values in this array."""
+
+    def _new(self, base_values: numpy.ndarray) -> UnitArray:
+        return UnitArray(None, self.unit, base_values)
+
+    @property
+    def display_values(self) -> numpy.ndarray:
+        """The array values in this array's unit."""
+        return self.base_values / self.unit.CONVERSION_RATE
+
+    def __repr__(self):
+        return "UnitArray({}, {})".format(
+            [round(float(v), 3) for v in self.display_values], self.unit.__name__
+        )
+
+    def __len__(self) -> int:
+        return len(self.base_values)
+
+    def __iter__(self) -> Iterator[Unit]:
+        unit = self.unit
+        for value in self.base_values.tolist():
+            yield unit(None, _raw_base_value=value)
+
+    def __getitem__(self, key):
+        """Get a single ``Unit`` by index, or a ``UnitArray`` by slice or mask."""
+        value = self.base_values[key]
+        if isinstance(value, _numpy().ndarray):
+            return self._new(value)
+        return self.unit(None, _raw_base_value=float(value))
+
+    def to_list(self) -> list:
+        """Get the array values as a list of ``Unit``\ s."""
+        return list(self)
+
+    def sum(self) -> Unit:
+        """Get the sum of all values."""
+        return self.unit(None, _raw_base_value=float(self.base_values.sum()))
+
+    def min(self) -> Unit:
+        """Get the smallest value. The array must not be empty."""
+        return self.unit(None, _raw_base_value=float(self.base_values.min()))
+
+    def max(self) -> Unit:
+        """Get the largest value. The array must not be empty."""
+        return self.unit(None, _raw_base_value=float(self.base_values.max()))
+
+    @staticmethod
+    def _other_base_values(other: Union[UnitArray, Unit]):
+        base_value = getattr(other, "base_value", None)
+        if base_value is not None:
+            return base_value
+        base_values = getattr(other, "base_values", None)
+        if base_values is None:
+            raise TypeError
+        return base_values
+
+    def __add__(self, other: Union[UnitArray, Unit]) -> UnitArray:
+        return self._new(self.base_values + UnitArray._other_base_values(other))
+
+    def __sub__(self, other: Union[UnitArray, Unit]) -> UnitArray:
+        return self._new(self.base_values - UnitArray._other_base_values(other))
+
+    def __mul__(self, other: Union[float, numpy.ndarray]) -> UnitArray:
+        if hasattr(other, "base_value") or hasattr(other, "base_values"):
+            raise TypeError
+        return self._new(self.base_values * other)
+
+    def __rmul__(self, other: Union[float, numpy.ndarray]) -> UnitArray:
+        # __rmul__ behaves identically to __mul__
+        return self.__mul__(other)
+
+    def __truediv__(
+        self, other: Union[UnitArray, Unit, float, numpy.ndarray]
+    ) -> Union[UnitArray, numpy.ndarray]:
+        if hasattr(other, "base_value") or hasattr(other, "base_values"):
+            # UnitArray / Unit -> float array
+            return self.base_values / UnitArray._other_base_values(other)
+        # UnitArray / float -> UnitArray
+        return self._new(self.base_values / other)
+
+    def __neg__(self) -> UnitArray:
+        return self._new(-self.base_values)
+
+    def __abs__(self) -> UnitArray:
+        return self._new(abs(self.base_values))
+
+    def isclose(self, other: Union[UnitArray, Unit]) -> numpy.ndarray:
+        """Compare values element-wise with the same tolerance as ``Unit`` equality.
+
+        Returns:
+            A boolean array.
+        """
+        difference = self.base_values - UnitArray._other_base_values(other)
+        return abs(difference) < Unit._CMP_POS_EPSILON
+
+
 def make_unit_class(name: str, conversion_rate: float) -> Type[Unit]:
     """Create a ``Unit`` subclass with a name and base unit conversion rate"""
     return cast(
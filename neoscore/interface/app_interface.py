@@ -1,21 +1,38 @@
 from __future__ import annotations
 
+import io
+import math
 import multiprocessing
 import pathlib
 import threading
-from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
-
-from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QPoint, QRectF
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+from PyQt5.QtCore import (
+    QBuffer,
+    QByteArray,
+    QIODevice,
+    QMarginsF,
+    QPoint,
+    QRectF,
+    QSize,
+)
 from PyQt5.QtGui import (
     QBitmap,
     QColor,
     QFontDatabase,
     QImage,
+    QPageSize,
     QPainter,
+    QPdfWriter,
+    QPicture,
     QPixmapCache,
     QRegion,
 )
-from PyQt5.QtWidgets import QApplication, QGraphicsScene
+from PyQt5.QtSvg import QSvgGenerator
+from PyQt5.QtWidgets import QApplication, QGraphicsItem, QGraphicsScene
 
 from neoscore.core import env, math_helpers
 from neoscore.core.color import Color
@@ -27,14 +44,21 @@ from neoscore.core.propagating_thread import PropagatingThread
 from neoscore.core.rect import Rect, RectDef
 from neoscore.core.units import Inch, Mm
 from neoscore.interface.brush_interface import BrushInterface
+from neoscore.interface.item_reconciler import ItemReconciler
 from neoscore.interface.qt import file_paths
 from neoscore.interface.qt.converters import (
     color_to_q_color,
     qt_point_to_point,
+    qt_rect_to_rect,
     rect_to_qt_rect_f,
 )
 from neoscore.interface.qt.main_window import MainWindow
 from neoscore.interface.qt.viewport import Viewport
+from neoscore.interface.raster_worker import (
+    RasterJob,
+    RasterWorkerPool,
+    serialize_picture,
+)
 from neoscore.interface.repl import running_in_ipython_gui_repl
 
 if TYPE_CHECKING:
@@ -43,6 +67,8 @@ if TYPE_CHECKING:
 _RENDER_IMAGE_THREAD_MAX = multiprocessing.cpu_count()
 _INCHES_PER_METER: float = Inch(1) / Mm(1000)
 _QT_PIXMAP_CACHE_LIMIT_KB = 200_000
+_SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+_XLINK_NAMESPACE = "http://www.w3.org/1999/xlink"
 
 
 class AppInterface:
@@ -76,6 +102,8 @@ class AppInterface:
             _RENDER_IMAGE_THREAD_MAX
         )
         self._viewport_rotation = 0
+        self.item_reconciler = ItemReconciler()
+        self.registered_font_paths: List[str] = []
 
     def set_refresh_func(self, refresh_func: Callable[[float], float]):
         """Set a function to run automatically on a timer in the main window."""
@@ -89,6 +117,24 @@ class AppInterface:
         """Set a function to run on keyboard input events."""
         self.main_window.graphicsView.key_event_handler = handler
 
+    def set_view_changed_handler(self, handler: Optional[Callable[[], None]]):
+        """Set a function to run after the viewport is scrolled, zoomed, or resized."""
+        self.view.view_changed_handler = handler
+
+    def expand_scene_rect(self, *rects: Rect):
+        """Grow the scene rect to include the given document-space rects.
+
+        This keeps regions which have not been rendered reachable by scrolling.
+        """
+        scene_rect = self.scene.itemsBoundingRect()
+        for rect in rects:
+            scene_rect = scene_rect.united(rect_to_qt_rect_f(rect))
+        self.scene.setSceneRect(scene_rect)
+
+    def reset_scene_rect(self):
+        """Make the scene rect automatically fit all items in the scene again."""
+        self.scene.setSceneRect(QRectF())
+
     def show(
         self,
         min_size: Optional[Tuple[int, int]] = None,
@@ -152,13 +198,8 @@ class AppInterface:
 
         """
         dpm = AppInterface._dpi_to_dpm(dpi)
-        scale = dpm / Mm(1000).base_value
-        if rect:
-            source_rect = rect_to_qt_rect_f(Rect.from_def(rect))
-        else:
-            source_rect = self.scene.sceneRect()
-        pix_width = int(source_rect.width() * scale)
-        pix_height = int(source_rect.height() * scale)
+        source_rect = self._source_rect(rect)
+        pix_width, pix_height = AppInterface._image_size(source_rect, dpm)
 
         if preserve_alpha:
             q_image_format = QImage.Format_ARGB32
@@ -173,11 +214,7 @@ class AppInterface:
 
         painter = QPainter()
         painter.begin(q_image)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        target_rect = QRectF(q_image.rect())
-
-        self.scene.render(painter, target=target_rect, source=source_rect)
+        self._render_scene(painter, QRectF(q_image.rect()), source_rect)
         painter.end()
 
         def finalize():
@@ -210,6 +247,210 @@ class AppInterface:
         thread.start()
         return thread
 
+    def render_images(
+        self,
+        targets: List[Tuple[Optional[RectDef], str | pathlib.Path | bytearray]],
+        dpi: int,
+        quality: int,
+        bg_color: Color,
+        autocrop: bool,
+        preserve_alpha: bool,
+        processes: int,
+    ):
+        """Render several parts of the scene to images using worker processes.
+
+        Each region is recorded into a ``QPicture`` on the main thread, which is
+        cheap compared to rasterization. The pictures are then rasterized, autocropped
+        and saved in parallel by a pool of headless worker processes, starting as soon
+        as each is recorded. This blocks until all images are saved.
+
+        Args:
+            targets: A list of ``(rect, dest)`` pairs, where ``rect`` and ``dest`` are
+                as in ``render_image``.
+            dpi: The pixels per inch of the rendered images.
+            quality: The quality of the output images for compressed image formats.
+            bg_color: The background color for the images.
+            autocrop: Whether to crop the output images to tightly fit their contents.
+            preserve_alpha: Whether to preserve the alpha channel.
+            processes: The maximum number of worker processes to use.
+
+        Raises:
+            ImageExportError: If any image could not be rendered or saved.
+        """
+        if not targets:
+            return
+        pool = RasterWorkerPool(
+            min(processes, len(targets)), self.registered_font_paths
+        )
+        with pool, self._item_caching_disabled():
+            for rect, dest in targets:
+                if isinstance(dest, bytearray):
+                    job_dest, buffer_dest = None, dest
+                else:
+                    job_dest, buffer_dest = file_paths.resolve_qt_path(dest), None
+                job = self._record_raster_job(
+                    rect, job_dest, dpi, quality, bg_color, autocrop, preserve_alpha
+                )
+                pool.submit(job, buffer_dest)
+
+    def render_png_images(
+        self,
+        rects: List[Optional[RectDef]],
+        dpi: int,
+        bg_color: Color,
+        preserve_alpha: bool,
+        processes: Optional[int],
+        max_in_flight: int,
+    ) -> Iterator[bytearray]:
+        """Render several parts of the scene to PNG images, yielding them in order.
+
+        Images are rendered ahead of the one being consumed, but at most
+        ``max_in_flight`` images are rendered or being rendered at once. This bounds
+        memory use no matter how many images are rendered, as long as the caller
+        releases each image once it's done with it.
+
+        Args:
+            rects: The parts of the document to render, in document coordinates.
+                ``None`` renders the entire scene.
+            dpi: The pixels per inch of the rendered images.
+            bg_color: The background color for the images.
+            preserve_alpha: Whether to preserve the alpha channel.
+            processes: The maximum number of worker processes to rasterize images
+                across, as in ``render_images``. If ``None``, images are rendered as
+                in ``render_image``.
+            max_in_flight: The maximum number of images rendered ahead.
+
+        Raises:
+            ImageExportError: If any image could not be rendered.
+        """
+        if not rects:
+            return
+        in_flight: Deque[Tuple[bytearray, Callable[[], object]]] = deque()
+        with ExitStack() as stack:
+            if processes is None:
+
+                def start(rect: Optional[RectDef], img_buffer: bytearray):
+                    return self.render_image(
+                        rect, img_buffer, dpi, -1, bg_color, False, preserve_alpha
+                    ).join
+
+            else:
+                pool = stack.enter_context(
+                    RasterWorkerPool(
+                        min(processes, len(rects)), self.registered_font_paths
+                    )
+                )
+                stack.enter_context(self._item_caching_disabled())
+
+                def start(rect: Optional[RectDef], img_buffer: bytearray):
+                    job = self._record_raster_job(
+                        rect, None, dpi, -1, bg_color, False, preserve_alpha
+                    )
+                    return pool.submit(job, img_buffer).result
+
+            for rect in rects:
+                if len(in_flight) >= max_in_flight:
+                    img_buffer, wait = in_flight.popleft()
+                    wait()
+                    yield img_buffer
+                img_buffer = bytearray()
+                in_flight.append((img_buffer, start(rect, img_buffer)))
+            while in_flight:
+                img_buffer, wait = in_flight.popleft()
+                wait()
+                yield img_buffer
+
+    def render_pdf(
+        self,
+        page_rects: List[RectDef],
+        dest: str | pathlib.Path,
+        dpi: int,
+    ):
+        """Render regions of the scene to a vector PDF, one page per region.
+
+        Each page is sized to match its region. Scene items are painted directly into
+        the PDF as vector graphics, so output size and rendering time depend on the
+        scene's contents rather than the resolution. Text drawn by neoscore is
+        rendered as glyph outline paths rather than as embedded font text.
+
+        Args:
+            page_rects: The parts of the document to render, in document coordinates.
+            dest: An output file path.
+            dpi: The resolution of the PDF's coordinate space.
+
+        Raises:
+            ImageExportError: If the PDF could not be written.
+        """
+        writer = QPdfWriter(file_paths.resolve_qt_path(dest))
+        writer.setResolution(dpi)
+        writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+        painter = QPainter()
+        with self._item_caching_disabled():
+            for i, rect in enumerate(page_rects):
+                source_rect = rect_to_qt_rect_f(Rect.from_def(rect))
+                # Page sizes must be set before beginning each page
+                writer.setPageSize(QPageSize(source_rect.size(), QPageSize.Unit.Point))
+                if i == 0:
+                    if not painter.begin(writer):
+                        raise ImageExportError(
+                            f"Unknown error occurred when exporting PDF to {dest}"
+                        )
+                else:
+                    writer.newPage()
+                target_rect = QRectF(0, 0, writer.width(), writer.height())
+                self._render_scene(painter, target_rect, source_rect)
+        if painter.isActive():
+            painter.end()
+
+    def render_svg(
+        self,
+        rect: Optional[RectDef],
+        dest: str | pathlib.Path | bytearray,
+        deduplicate_paths: bool,
+    ):
+        """Render the scene, or part of it, to an SVG image.
+
+        One SVG user unit corresponds to one point in document space.
+
+        Args:
+            rect: The part of the document to render, in document coordinates.
+                If ``None``, the entire scene will be rendered.
+            dest: An output file path or a bytearray to save to.
+            deduplicate_paths: Whether to write repeated paths (like identical
+                glyphs) once in the SVG's ``<defs>`` and reference them with
+                ``<use>`` elements, which can greatly reduce file size.
+
+        Raises:
+            ImageExportError: If Qt SVG export fails for unknown reasons.
+        """
+        source_rect = self._source_rect(rect)
+        buffer = QBuffer()
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        generator = QSvgGenerator()
+        generator.setOutputDevice(buffer)
+        generator.setResolution(72)
+        generator.setSize(
+            QSize(math.ceil(source_rect.width()), math.ceil(source_rect.height()))
+        )
+        target_rect = QRectF(0, 0, source_rect.width(), source_rect.height())
+        generator.setViewBox(target_rect)
+        painter = QPainter()
+        if not painter.begin(generator):
+            raise ImageExportError("Unknown error occurred when exporting SVG")
+        with self._item_caching_disabled():
+            self._render_scene(painter, target_rect, source_rect)
+        painter.end()
+        svg = bytes(buffer.data())
+        buffer.close()
+        if deduplicate_paths:
+            svg = AppInterface._deduplicate_svg_paths(svg)
+        if isinstance(dest, bytearray):
+            dest.clear()
+            dest.extend(svg)
+        else:
+            with open(dest, "wb") as f:
+                f.write(svg)
+
     def destroy(self):
         """Destroy the window and all global interface-level data."""
         self.app.exit()
@@ -233,6 +474,7 @@ class AppInterface:
         font_id = self.font_database.addApplicationFont(font_file_path)
         if font_id == AppInterface._QT_FONT_ERROR_CODE:
             raise FontRegistrationError(font_file_path)
+        self.registered_font_paths.append(font_file_path)
         family_names = self.font_database.applicationFontFamilies(font_id)
         if not len(family_names):
             # I think this should be impossible, but log a warning just in case
@@ -270,6 +512,29 @@ class AppInterface:
     def viewport_center_pos(self, value: Point):
         self.view.centerOn(value.x.base_value, value.y.base_value)
 
+    @property
+    def viewport_lod_threshold(self) -> Optional[float]:
+        """The viewport scale below which simplified rendering is used.
+
+        ``None`` disables simplified rendering.
+        """
+        return self.view.lod_threshold
+
+    @viewport_lod_threshold.setter
+    def viewport_lod_threshold(self, value: Optional[float]):
+        self.view.lod_threshold = value
+        # Invalidate item caches painted under the previous setting
+        self.scene.update()
+        for item in self.scene.items():
+            item.update()
+
+    @property
+    def viewport_visible_rect(self) -> Rect:
+        """The document-space region currently visible in the interactive viewport."""
+        return qt_rect_to_rect(
+            self.view.mapToScene(self.view.viewport().rect()).boundingRect()
+        )
+
     @property
     def viewport_scale(self) -> float:
         """The interactive viewport's scale (zoom).
@@ -317,10 +582,86 @@ class AppInterface:
         success = self.font_database.removeAllApplicationFonts()
         if not success:
             raise RuntimeError("Failed to remove application fonts.")
+        self.registered_font_paths.clear()
 
     def clear_scene(self):
-        """Clear the QT Scene. This should be called before each render."""
+        """Clear the QT Scene.
+
+        This should be called before each render, unless Qt items are being reused
+        through ``item_reconciler``.
+        """
         self.scene.clear()
+        self.item_reconciler.reset()
+
+    def _source_rect(self, rect: Optional[RectDef]) -> QRectF:
+        """Get the scene rect to render for a rect given to an export method."""
+        if rect:
+            return rect_to_qt_rect_f(Rect.from_def(rect))
+        return self.scene.sceneRect()
+
+    def _render_scene(
+        self, painter: QPainter, target_rect: QRectF, source_rect: QRectF
+    ):
+        """Paint a region of the scene using an active painter.
+
+        This is the common rendering path used by all export methods.
+        """
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.scene.render(painter, target=target_rect, source=source_rect)
+
+    def _record_raster_job(
+        self,
+        rect: Optional[RectDef],
+        dest: Optional[str],
+        dpi: int,
+        quality: int,
+        bg_color: Color,
+        autocrop: bool,
+        preserve_alpha: bool,
+    ) -> RasterJob:
+        """Record a part of the scene into a job for a ``RasterWorkerPool``.
+
+        Item caching should be disabled while recording.
+        """
+        dpm = AppInterface._dpi_to_dpm(dpi)
+        source_rect = self._source_rect(rect)
+        pix_width, pix_height = AppInterface._image_size(source_rect, dpm)
+        picture = QPicture()
+        painter = QPainter()
+        painter.begin(picture)
+        self._render_scene(painter, QRectF(0, 0, pix_width, pix_height), source_rect)
+        painter.end()
+        return RasterJob(
+            serialize_picture(picture),
+            pix_width,
+            pix_height,
+            dpm,
+            color_to_q_color(bg_color).rgba(),
+            preserve_alpha,
+            autocrop,
+            quality,
+            dest,
+        )
+
+    @contextmanager
+    def _item_caching_disabled(self) -> Iterator[None]:
+        """Temporarily disable Qt item caching throughout the scene.
+
+        Cached items are painted from pixmaps, which must be avoided when painting
+        to vector outputs.
+        """
+        cached_items = [
+            (item, item.cacheMode())
+            for item in self.scene.items()
+            if item.cacheMode() != QGraphicsItem.CacheMode.NoCache
+        ]
+        for item, _ in cached_items:
+            item.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+        try:
+            yield
+        finally:
+            for item, cache_mode in cached_items:
+                item.setCacheMode(cache_mode)
 
     def _optimize_for_interactive_view(self):
         QPixmapCache.setCacheLimit(_QT_PIXMAP_CACHE_LIMIT_KB)
@@ -332,6 +673,12 @@ class AppInterface:
         """Convert a Dots Per Inch value to Dots Per Meter"""
         return int(dpi / _INCHES_PER_METER)
 
+    @staticmethod
+    def _image_size(source_rect: QRectF, dpm: int) -> Tuple[int, int]:
+        """Get the pixel size of an image of a scene region at a given resolution."""
+        scale = dpm / Mm(1000).base_value
+        return int(source_rect.width() * scale), int(source_rect.height() * scale)
+
     @staticmethod
     def _autocrop(q_image: QImage, q_color: QColor) -> QImage:
         """Automatically crop a qt image around the pixels not of a given color.
@@ -341,3 +688,51 @@ class AppInterface:
         mask = q_image.createMaskFromColor(q_color.rgb())
         crop_rect = QRegion(QBitmap.fromImage(mask)).boundingRect()
         return q_image.copy(crop_rect)
+
+    @staticmethod
+    def _deduplicate_svg_paths(svg: bytes) -> bytes:
+        """Rewrite an SVG so repeated identical paths are only defined once.
+
+        Each ``<path>`` whose attributes exactly match at least one other is moved into
+        ``<defs>`` and replaced by ``<use>`` elements referencing it. Since the defined
+        paths keep all their attributes, and inherited styles come from each
+        ``<use>``'s ancestors, rendering is unchanged.
+        """
+        root = ElementTree.fromstring(svg)
+        path_tag = f"{{{_SVG_NAMESPACE}}}path"
+        occurrences: Dict[Tuple[Tuple[str, str], ...], int] = {}
+        for element in root.iter(path_tag):
+            key = tuple(sorted(element.attrib.items()))
+            occurrences[key] = occurrences.get(key, 0) + 1
+        defs = root.find(f"{{{_SVG_NAMESPACE}}}defs")
+        if defs is None:
+            defs = ElementTree.Element(f"{{{_SVG_NAMESPACE}}}defs")
+            root.insert(0, defs)
+        ids: Dict[Tuple[Tuple[str, str], ...], str] = {}
+        parents = [element for element in root.iter() if element is not defs]
+        for parent in parents:
+            for i, element in enumerate(parent):
+                if element.tag != path_tag:
+                    continue
+                key = tuple(sorted(element.attrib.items()))
+                if occurrences[key] < 2:
+                    continue
+                path_id = ids.get(key)
+                if path_id is None:
+                    path_id = f"neoscore-path-{len(ids)}"
+                    ids[key] = path_id
+                    ElementTree.SubElement(
+                        defs, path_tag, dict(element.attrib, id=path_id)
+                    )
+                parent[i] = ElementTree.Element(
+                    f"{{{_SVG_NAMESPACE}}}use",
+                    {f"{{{_XLINK_NAMESPACE}}}href": "#" + path_id},
+                )
+        ElementTree.register_namespace("", _SVG_NAMESPACE)
+        ElementTree.register_namespace("xlink", _XLINK_NAMESPACE)
+        # ``tostring`` only accepts ``xml_declaration`` from Python 3.8
+        buffer = io.BytesIO()
+        ElementTree.ElementTree(root).write(
+            buffer, encoding="UTF-8", xml_declaration=True
+        )
+        return buffer.getvalue()
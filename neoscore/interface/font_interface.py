@@ -18,6 +18,12 @@ class FontInterface:
     size: Unit
     weight: Optional[int]
     italic: bool
+    compose_glyph_paths: bool = False
+    """Whether text paths should be composed from cached glyph outlines.
+
+    This is much faster for fonts with complex glyph outlines, like music fonts, but
+    can be slower for ordinary text fonts. See :obj:`.glyph_atlas`.
+    """
 
     ascent: Unit = field(init=False)
     """The ascent of the font.
@@ -70,7 +70,6 @@ class ImageInterface(PositionedObjectInterface):
 
     def render(self):
         if self.file_path.suffix == ".svg":
-            qt_object = self._create_svg_qt_object()
+            self._render_reconciled(self._create_svg_qt_object)
         else:
-            qt_object = self._create_pixmap_qt_object()
-        self._register_qt_object(qt_object)
+            self._render_reconciled(self._create_pixmap_qt_object)
@@ -12,6 +12,9 @@ class InvisibleObjectInterface(PositionedObjectInterface):
     """A stub interface for use as a virtual parent in scenes."""
 
     def render(self):
+        self._render_reconciled(self._create_qt_object)
+
+    def _create_qt_object(self) -> QGraphicsSimpleTextItem:
         qt_object = QGraphicsSimpleTextItem()
         qt_object.setPos(point_to_qt_point_f(self.pos))
         if self.transform_origin != ORIGIN:
@@ -26,4 +29,4 @@ class InvisibleObjectInterface(PositionedObjectInterface):
             qt_object.setTransformOriginPoint(
                 point_to_qt_point_f(self.transform_origin)
             )
-        self._register_qt_object(qt_object)
+        return qt_object
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from PyQt5.QtWidgets import QGraphicsItem
+
+if TYPE_CHECKING:
+    from neoscore.interface.positioned_object_interface import PositionedObjectInterface
+
+_SlotKey = Tuple[Hashable, int]
+"""An ``(owner_key, slot_index)`` key identifying an interface within a frame."""
+
+
+class ItemReconciler:
+    """A helper which reuses Qt items across renders instead of recreating them.
+
+    Each interface rendered during a frame is keyed by the object which rendered it
+    (its owner) and its order among that owner's interfaces. Since objects spanning
+    several flowable lines render one interface per line slice, this key is stable
+    across frames as long as the owner's rendering structure doesn't change.
+
+    Objects rendered while another object is rendering (for instance temporary objects
+    created in ``render_complete`` implementations) are usually recreated every frame,
+    so rather than by identity, these are keyed by their order within the enclosing
+    object's rendering.
+
+    When an interface is rendered, the interface which held its key in the previous
+    frame is offered to it, and if both are of the same type, the new interface patches
+    the previous Qt item to match itself rather than creating a new one. Items left
+    unclaimed at the end of a frame are removed from the scene.
+
+    Sibling stacking order is restored at the end of each frame so the result matches
+    what a full scene rebuild would produce.
+
+    This should not be used directly; see :obj:`.neoscore.set_item_reconciliation`.
+    """
+
+    def __init__(self):
+        self._active = False
+        self._tracking_scene = True
+        self._owner_stack: List[Hashable] = []
+        self._slot_counts: Dict[Hashable, int] = {}
+        self._nested_counts: Dict[Hashable, int] = {}
+        self._previous: Dict[_SlotKey, PositionedObjectInterface] = {}
+        self._current: Dict[_SlotKey, PositionedObjectInterface] = {}
+        self._previous_order: Dict[
+            int, Tuple[Optional[QGraphicsItem], List[QGraphicsItem]]
+        ] = {}
+        self._current_order: Dict[
+            int, Tuple[Optional[QGraphicsItem], List[QGraphicsItem]]
+        ] = {}
+        self._appended: Set[int] = set()
+
+    @property
+    def tracking_scene(self) -> bool:
+        """Whether every item in the scene was created or claimed in a tracked frame.
+
+        If this is false, the scene must be cleared before the next frame begins, since
+        items rendered outside frames would otherwise never be removed.
+        """
+        return self._tracking_scene
+
+    def reset(self):
+        """Forget all tracked items.
+
+        This should be called whenever the scene is cleared.
+        """
+        self._active = False
+        self._tracking_scene = True
+        self._owner_stack.clear()
+        self._slot_counts.clear()
+        self._nested_counts.clear()
+        self._previous.clear()
+        self._current.clear()
+        self._previous_order.clear()
+        self._current_order.clear()
+        self._appended.clear()
+
+    def begin_frame(self):
+        """Start tracking a new frame, offering the last frame's items for reuse."""
+        self._previous = self._current
+        self._previous_order = self._current_order
+        self._current = {}
+        self._current_order = {}
+        self._slot_counts.clear()
+        self._nested_counts.clear()
+        self._owner_stack.clear()
+        self._appended.clear()
+        self._active = True
+
+    def end_frame(self):
+        """Finish the current frame, removing unclaimed items and fixing stacking."""
+        self._active = False
+        claimed_ids = {id(i._qt_object) for i in self._current.values()}
+        for parent_key, (parent, items) in self._current_order.items():
+            previous_parent, previous_items = self._previous_order.get(
+                parent_key, (None, [])
+            )
+            if previous_parent is not parent:
+                previous_items = []
+            ItemReconciler._restore_stacking(items, previous_items, self._appended)
+        for interface in self._previous.values():
+            qt_object = interface._qt_object
+            if id(qt_object) in claimed_ids:
+                continue
+            scene = qt_object.scene()
+            if scene is not None:
+                scene.removeItem(qt_object)
+        self._previous = {}
+        self._previous_order = {}
+        self._appended.clear()
+
+    def push_owner(self, owner: Any):
+        """Make an object the owner of subsequently rendered interfaces."""
+        if not self._active:
+            return
+        if self._owner_stack:
+            enclosing_key = self._owner_stack[-1]
+            index = self._nested_counts.get(enclosing_key, 0)
+            self._nested_counts[enclosing_key] = index + 1
+            self._owner_stack.append((enclosing_key, index))
+        else:
+            self._owner_stack.append(id(owner))
+
+    def pop_owner(self):
+        """Restore the owner which was active before the last ``push_owner``."""
+        if self._active:
+            self._owner_stack.pop()
+
+    def claim(
+        self, interface: PositionedObjectInterface
+    ) -> Optional[PositionedObjectInterface]:
+        """Find the previous frame's interface an about-to-render interface may patch.
+
+        Returns ``None`` if reconciliation is inactive or there is no compatible
+        interface to reuse.
+        """
+        if not self._active:
+            return None
+        previous = self._previous.get(self._next_key())
+        if previous is None or type(previous) is not type(interface):
+            return None
+        return previous
+
+    def record(self, interface: PositionedObjectInterface, appended: bool):
+        """Record a newly rendered interface.
+
+        Args:
+            interface: The rendered interface, whose ``_qt_object`` must be set.
+            appended: Whether the interface's Qt item was newly added to its parent
+                (or the scene), placing it atop its siblings.
+        """
+        if not self._active:
+            # Rendered outside a frame, so the scene contents are no longer known
+            self._tracking_scene = False
+            return
+        key = self._next_key()
+        self._slot_counts[key[0]] = key[1] + 1
+        self._current[key] = interface
+        qt_object = interface._qt_object
+        parent = qt_object.parentItem()
+        parent_key = id(parent)
+        entry = self._current_order.get(parent_key)
+        if entry is None:
+            self._current_order[parent_key] = (parent, [qt_object])
+        else:
+            entry[1].append(qt_object)
+        if appended:
+            self._appended.add(id(qt_object))
+
+    def _next_key(self) -> _SlotKey:
+        owner_key = self._owner_stack[-1] if self._owner_stack else None
+        return owner_key, self._slot_counts.get(owner_key, 0)
+
+    @staticmethod
+    def _restore_stacking(
+        items: List[QGraphicsItem],
+        previous_items: List[QGraphicsItem],
+        appended: Set[int],
+    ):
+        """Restack sibling items into render order if Qt's order differs.
+
+        Qt keeps reused items in their old relative order and places newly added
+        ones on top, so that is compared against the order they were rendered in.
+        """
+        item_ids = {id(item) for item in items}
+        qt_order = [
+            item
+            for item in previous_items
+            if id(item) in item_ids and id(item) not in appended
+        ]
+        qt_order.extend(item for item in items if id(item) in appended)
+        if len(qt_order) == len(items) and all(a is b for a, b in zip(qt_order, items)):
+            return
+        for i in range(len(items) - 2, -1, -1):
+            items[i].stackBefore(items[i + 1])
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, NamedTuple, Optional, Union
+from typing import List, NamedTuple, Optional, Tuple, Union
 
 from PyQt5.QtGui import QPainterPath
 from typing_extensions import TypeAlias
@@ -101,16 +101,44 @@ class PathInterface(PositionedObjectInterface):
                 raise TypeError("Unknown ResolvedPathElement type")
         return path
 
+    @staticmethod
+    def elements_equal(
+        elements: List[ResolvedPathElement], other: List[ResolvedPathElement]
+    ) -> bool:
+        """Determine whether two element lists are exactly equal.
+
+        Unlike ``==``, this compares units exactly rather than with the tolerance used
+        by :obj:`.Unit` comparisons, so small changes accumulated across frames are
+        not lost.
+        """
+        if elements is other:
+            return True
+        if len(elements) != len(other):
+            return False
+        for el, other_el in zip(elements, other):
+            if type(el) is not type(other_el):
+                return False
+            for unit, other_unit in zip(el, other_el):
+                if unit.base_value != other_unit.base_value:
+                    return False
+        return True
+
+    @property
+    def _clip_region(self) -> Tuple[float, Optional[float]]:
+        return (
+            self.clip_start_x.base_value if self.clip_start_x is not None else 0,
+            self.clip_width.base_value if self.clip_width is not None else None,
+        )
+
     def render(self):
         """Render the path to the scene."""
-        self._register_qt_object(self._create_qt_object())
+        self._render_reconciled(self._create_qt_object)
 
     def _create_qt_object(self) -> QClippingPath:
         painter_path = PathInterface.create_qt_path(self.elements)
         qt_object = QClippingPath(
             painter_path,
-            self.clip_start_x.base_value if self.clip_start_x is not None else 0,
-            self.clip_width.base_value if self.clip_width is not None else None,
+            *self._clip_region,
             self.scale,
             self.rotation,
             self.background_brush.qt_object if self.background_brush else None,
@@ -122,3 +150,28 @@ class PathInterface(PositionedObjectInterface):
         qt_object.setPen(self.pen.qt_object)
         qt_object.update_geometry()
         return qt_object
+
+    def _patch_qt_object(
+        self, previous: PathInterface, qt_object: QClippingPath
+    ) -> bool:
+        self._patch_transform(previous, qt_object)
+        geometry_changed = False
+        if not PathInterface.elements_equal(self.elements, previous.elements):
+            qt_object.setPath(PathInterface.create_qt_path(self.elements))
+            geometry_changed = True
+        if self.scale != previous.scale or self._clip_region != previous._clip_region:
+            qt_object.set_clip_region(*self._clip_region)
+            geometry_changed = True
+        if self.pen != previous.pen:
+            qt_object.setPen(self.pen.qt_object)
+            geometry_changed = True
+        if self.brush != previous.brush:
+            qt_object.setBrush(self.brush.qt_object)
+        if self.background_brush != previous.background_brush:
+            qt_object.background_brush = (
+                self.background_brush.qt_object if self.background_brush else None
+            )
+            qt_object.update()
+        if geometry_changed:
+            qt_object.update_geometry()
+        return True
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from typing import Callable, Optional
 from warnings import warn
 
 from PyQt5.QtWidgets import QGraphicsItem
 
 from neoscore.core import neoscore
 from neoscore.core.point import Point
+from neoscore.core.render_profiling import QT_ITEM_CREATION, profiler
+from neoscore.interface.qt.converters import point_to_qt_point_f
 
 
 @dataclass(frozen=True)
@@ -60,11 +62,94 @@ class PositionedObjectInterface:
         """Render the object to the scene.
 
         This is typically done by constructing a `QGraphicsItem` subclass and calling
-        `_register_qt_object` with it. Do *not* manually assign the Qt object's parent
-        or add it to the Qt scene.
+        `_register_qt_object` with it, or by passing a function constructing one to
+        `_render_reconciled`, which allows Qt objects from previous frames to be reused.
+        Do *not* manually assign the Qt object's parent or add it to the Qt scene.
         """
         raise NotImplementedError
 
+    def _render_reconciled(self, create: Callable[[], QGraphicsItem]):
+        """Render by patching a reusable Qt item from the previous frame if possible.
+
+        If item reconciliation is inactive, no reusable item is available, or
+        :obj:`._patch_qt_object` declines to patch it, a new Qt object is made with
+        ``create``.
+        """
+        with profiler.phase(None, QT_ITEM_CREATION):
+            previous = neoscore.app_interface.item_reconciler.claim(self)
+            if previous is not None:
+                qt_object = previous._qt_object
+                if self._patch_qt_object(previous, qt_object):
+                    self._register_qt_object(qt_object)
+                    return
+            self._register_qt_object(create())
+
+    def _patch_qt_object(
+        self, previous: PositionedObjectInterface, qt_object: QGraphicsItem
+    ) -> bool:
+        """Update a Qt object rendered for ``previous`` so it matches this interface.
+
+        ``previous`` is always of the same type as ``self``. The parent relationship
+        is handled separately, so it should not be patched here.
+
+        By default, this patches objects whose fields only differ in their transforms.
+        Subclasses with cheaply mutable Qt objects should override this to support
+        patching other fields too.
+
+        Returns:
+            Whether the object could be patched. If false, ``qt_object`` must be left
+            unmodified, and a new object will be created instead.
+        """
+        for f in fields(self)[_BASE_FIELD_COUNT:]:
+            if getattr(self, f.name) != getattr(previous, f.name):
+                return False
+        self._patch_transform(previous, qt_object)
+        return True
+
+    def _patch_transform(
+        self, previous: PositionedObjectInterface, qt_object: QGraphicsItem
+    ):
+        """Update a Qt object's position and transforms where they have changed."""
+        if (
+            self.pos.x.base_value != previous.pos.x.base_value
+            or self.pos.y.base_value != previous.pos.y.base_value
+        ):
+            qt_object.setPos(point_to_qt_point_f(self.pos))
+            # Device coordinate caches are reused for translations, which can be
+            # misaligned by a fraction of a pixel, so explicitly invalidate them.
+            qt_object.update()
+        if (
+            self.transform_origin.x.base_value != previous.transform_origin.x.base_value
+            or self.transform_origin.y.base_value
+            != previous.transform_origin.y.base_value
+        ):
+            qt_object.setTransformOriginPoint(
+                point_to_qt_point_f(self.transform_origin)
+            )
+        if self.scale != previous.scale:
+            qt_object.setScale(self.scale)
+        if self.rotation != previous.rotation:
+            qt_object.setRotation(self.rotation)
+
+    def remove(self):
+        """Remove the object and its descendant Qt items from the scene.
+
+        This is a no-op if the object has not been rendered.
+        """
+        qt_object = getattr(self, "_qt_object", None)
+        if qt_object is None:
+            return
+        scene = qt_object.scene()
+        if scene is not None:
+            scene.removeItem(qt_object)
+
+    def stack_before(self, sibling: PositionedObjectInterface):
+        """Move this object's Qt item just below a rendered sibling's.
+
+        Both interfaces must be rendered and share the same parent.
+        """
+        self._qt_object.stackBefore(sibling._qt_object)
+
     def _parent_qt_obj(self) -> Optional[QGraphicsItem]:
         if self.parent:
             parent_qt_obj = getattr(self.parent, "_qt_object", None)
@@ -78,8 +163,20 @@ class PositionedObjectInterface:
 
     def _register_qt_object(self, obj: QGraphicsItem):
         parent_obj = self._parent_qt_obj()
+        appended = False
         if parent_obj:
-            obj.setParentItem(parent_obj)
+            if obj.parentItem() is not parent_obj:
+                obj.setParentItem(parent_obj)
+                appended = True
         else:
-            neoscore.app_interface.scene.addItem(obj)
+            if obj.parentItem() is not None:
+                obj.setParentItem(None)
+                appended = True
+            if obj.scene() is None:
+                neoscore.app_interface.scene.addItem(obj)
+                appended = True
         super().__setattr__("_qt_object", obj)
+        neoscore.app_interface.item_reconciler.record(self, appended)
+
+
+_BASE_FIELD_COUNT = len(fields(PositionedObjectInterface))
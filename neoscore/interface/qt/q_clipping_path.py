@@ -1,7 +1,15 @@
 from typing import Optional
 
-from PyQt5.QtCore import QPointF, QRectF
-from PyQt5.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import (
+    QBrush,
+    QColor,
+    QPaintEngine,
+    QPainter,
+    QPainterPath,
+    QPainterPathStroker,
+    QPen,
+)
 from PyQt5.QtWidgets import QGraphicsItem, QGraphicsPathItem
 
 from neoscore.core import env
@@ -24,10 +32,9 @@ class QClippingPath(QGraphicsPathItem):
     scaling. For example if a rendered region of 50 points is required
     on a path with a scale of 2, ``clip_width=50`` should be passed.
 
-    While the Qt superclass is mutable, this is intended to be treated
-    immutably. Mutations after instantation will result unexpected
-    behavior. Object mutations at higher abstraction levels should
-    result in new Qt objects created.
+    While the Qt superclass is mutable, mutations affecting the item's
+    geometry (its path, pen, scale, or clipping region) must be followed
+    by a call to ``update_geometry``, or unexpected behavior will result.
 
     Internally, the clipping implementation is rather subtle in how it
     integrates with Qt's coordinate and painter systems. The item's
@@ -118,7 +125,40 @@ class QClippingPath(QGraphicsPathItem):
             painter.setPen(QPen(QColor("#ff0000"), 0))
             painter.drawRect(bounding_rect)
 
-        super().paint(painter, *args, **kwargs)
+        if (
+            self.clip_start_x or self.clip_width is not None
+        ) and painter.paintEngine().type() == QPaintEngine.Type.SVG:
+            # Qt's SVG paint engine ignores clip rects
+            self._paint_geometrically_clipped(painter)
+        else:
+            super().paint(painter, *args, **kwargs)
+
+    def _paint_geometrically_clipped(self, painter: QPainter):
+        """Paint by intersecting the path's fill and stroke shapes with the clip rect.
+
+        This is used for paint devices which don't support clipping.
+        """
+        clip_path = QPainterPath()
+        clip_path.addRect(self.clip_rect)
+        path = self.path()
+        brush = self.brush()
+        if brush.style() != Qt.BrushStyle.NoBrush:
+            painter.fillPath(path.intersected(clip_path), brush)
+        pen = self.pen()
+        if pen.style() != Qt.PenStyle.NoPen:
+            stroke = QPainterPathStroker(pen).createStroke(path)
+            painter.fillPath(stroke.intersected(clip_path), pen.brush())
+
+    def set_clip_region(self, clip_start_x: float, clip_width: Optional[float]):
+        """Change the clipping region.
+
+        Arguments work like those in the constructor, adjusted by the item's current
+        scale, so any scale change should be made before calling this.
+        ``update_geometry`` must be called afterward.
+        """
+        scale = self.scale()
+        self.clip_start_x = clip_start_x / scale
+        self.clip_width = None if clip_width is None else clip_width / scale
 
     def update_geometry(self):
         """Recalculate the object's bounding and clipping rects.
@@ -138,6 +178,9 @@ class QClippingPath(QGraphicsPathItem):
         # Clip rect is used by painter, which translates by -clip_start_x,
         # so we need to cancel that out here
         self.clip_rect = self.bounding_rect.translated(self.clip_start_x, 0)
+        # Clip changes don't always alter the bounding rect, so explicitly invalidate
+        # any cached rendering.
+        self.update()
 
     @staticmethod
     def calculate_bounding_rect(
@@ -1,5 +1,9 @@
+from typing import Dict, List, Optional
+
 from PyQt5 import QtGui, QtWidgets
-from PyQt5.QtCore import QPointF
+from PyQt5.QtCore import QPointF, QRect, Qt, QTimer
+from PyQt5.QtGui import QColor, QPainterPath
+from PyQt5.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
 
 from neoscore.core.key_event import KeyEventType
 from neoscore.core.mouse_event import MouseEventType
@@ -7,6 +11,7 @@ from neoscore.interface.qt.converters import (
     q_key_event_to_key_event,
     q_mouse_event_to_mouse_event,
 )
+from neoscore.interface.qt.q_clipping_path import QClippingPath
 
 _NO_DRAG = 0
 _SCROLL_HAND_DRAG = 1
@@ -15,6 +20,7 @@ _SCROLL_BAR_AS_NEEDED = 0
 _SCROLL_BAR_ALWAYS_OFF = 1
 _FOCUS_POLICY_STRONG_FOCUS = 0x1 | 0x2 | 0x8
 _FOCUS_POLICY_NO_FOCUS = 0
+_LOD_SIMPLIFY_SIZE_PX = 4
 
 
 class Viewport(QtWidgets.QGraphicsView):
@@ -34,6 +40,10 @@ class Viewport(QtWidgets.QGraphicsView):
         self.setViewportUpdateMode(_NO_VIEWPORT_UPDATE)  # noqa
         self.mouse_event_handler = None
         self.key_event_handler = None
+        self.view_changed_handler = None
+        self._view_change_pending = False
+        self.lod_threshold = None
+        self._lod_placeholders: Dict[int, QPainterPath] = {}
 
     def set_auto_interaction(self, enabled: bool):
         """Set whether mouse and scrollbar interaction is enabled."""
@@ -67,12 +77,120 @@ class Viewport(QtWidgets.QGraphicsView):
         # Move scene to old position
         delta = new_pos - old_pos
         self.translate(delta.x(), delta.y())
+        self._notify_view_changed()
 
     def scrollContentsBy(self, *args):
         """Override of superclass scroll action to trigger a viewport update."""
         super().scrollContentsBy(*args)
+        self._notify_view_changed()
         self.viewport().update()
 
+    def level_of_detail(self) -> float:
+        """The view's current zoom level, as used for level-of-detail rendering."""
+        return QStyleOptionGraphicsItem.levelOfDetailFromTransform(self.transform())
+
+    def lod_simplification_active(self) -> bool:
+        """Whether the view is zoomed out past ``lod_threshold``."""
+        return (
+            self.lod_threshold is not None
+            and self.level_of_detail() < self.lod_threshold
+        )
+
+    def paintEvent(self, event):
+        """Override of superclass painting to batch small items when zoomed out.
+
+        While level-of-detail simplification is active, exposed paths smaller than
+        ``_LOD_SIMPLIFY_SIZE_PX`` on screen are skipped by Qt's item painting, and
+        ``drawForeground`` instead fills their bounding rects with a single path per
+        color.
+        """
+        if not self.lod_simplification_active():
+            super().paintEvent(event)
+            return
+        culled_items = self._cull_small_paths(event.rect())
+        try:
+            super().paintEvent(event)
+        finally:
+            for item in culled_items:
+                item.setFlag(QGraphicsItem.ItemHasNoContents, False)
+            self._lod_placeholders = {}
+
+    def _cull_small_paths(self, view_rect: QRect) -> List[QClippingPath]:
+        """Hide paths too small to see in detail, collecting placeholders for them.
+
+        Culled items are flagged ``ItemHasNoContents`` so Qt doesn't paint them at
+        all. The flag must be cleared once painting finishes.
+
+        Returns:
+            The culled items.
+        """
+        scene_rect = self.mapToScene(view_rect).boundingRect()
+        transform = self.transform()
+        culled_items = []
+        placeholders: Dict[int, QPainterPath] = {}
+        for item in self.scene().items(
+            scene_rect, Qt.ItemSelectionMode.IntersectsItemBoundingRect
+        ):
+            if (
+                not isinstance(item, QClippingPath)
+                or not item.isVisible()
+                or item.flags() & QGraphicsItem.ItemHasNoContents
+            ):
+                continue
+            item_rect = item.sceneBoundingRect()
+            device_rect = transform.mapRect(item_rect)
+            if (
+                device_rect.width() >= _LOD_SIMPLIFY_SIZE_PX
+                or device_rect.height() >= _LOD_SIMPLIFY_SIZE_PX
+            ):
+                continue
+            item.setFlag(QGraphicsItem.ItemHasNoContents, True)
+            culled_items.append(item)
+            color = _placeholder_color(item)
+            if color is None:
+                continue
+            path = placeholders.get(color.rgba())
+            if path is None:
+                path = QPainterPath()
+                # Overlapping rects should merge rather than cancel out
+                path.setFillRule(Qt.FillRule.WindingFill)
+                placeholders[color.rgba()] = path
+            path.addRect(item_rect)
+        self._lod_placeholders = placeholders
+        return culled_items
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        # The view paints items with the same painter after the background.
+        # Changing the view's own render hints here would trigger another repaint.
+        if self.lod_simplification_active():
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+
+    def drawForeground(self, painter, rect):
+        super().drawForeground(painter, rect)
+        for rgba, path in self._lod_placeholders.items():
+            painter.fillPath(path, QColor.fromRgba(rgba))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._notify_view_changed()
+
+    def _notify_view_changed(self):
+        """Schedule a call to ``view_changed_handler``, if set.
+
+        Changes made in quick succession, like the many scrolls of a single drag, are
+        coalesced into one call once control returns to the event loop.
+        """
+        if self.view_changed_handler and not self._view_change_pending:
+            self._view_change_pending = True
+            QTimer.singleShot(0, self._run_view_changed_handler)
+
+    def _run_view_changed_handler(self):
+        self._view_change_pending = False
+        if self.view_changed_handler:
+            self.view_changed_handler()
+            self.viewport().update()
+
     def window_document_pos(self) -> QPointF:
         return self.mapToScene(0, 0)
 
@@ -131,3 +249,21 @@ class Viewport(QtWidgets.QGraphicsView):
             super().keyPressEvent(e)
 
     # End of input event handler overrides
+
+
+def _placeholder_color(item: QClippingPath) -> Optional[QColor]:
+    """Find the color a path's level-of-detail placeholder should be filled with.
+
+    This is the path's brush color, falling back to its pen color, with the item's
+    opacity applied. Returns ``None`` for paths drawing nothing.
+    """
+    brush = item.brush()
+    if brush.style() != Qt.BrushStyle.NoBrush:
+        color = brush.color()
+    else:
+        pen = item.pen()
+        if pen.style() == Qt.PenStyle.NoPen:
+            return None
+        color = pen.color()
+    color.setAlphaF(color.alphaF() * item.effectiveOpacity())
+    return color
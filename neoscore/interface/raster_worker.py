@@ -0,0 +1,290 @@
+"""Rasterization of recorded scene pictures in headless worker processes.
+
+Qt scenes can only be painted from the main thread of the process which owns them,
+so to rasterize many pages in parallel, each page is first recorded into a
+resolution-independent ``QPicture`` on the main thread. The serialized pictures are
+then played back into images by worker processes, each running its own headless Qt
+application.
+
+Workers are started by running this module as a script, and communicate with the
+parent process by exchanging pickled messages over their standard input and output.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import pickle
+import queue
+import subprocess
+import sys
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional, Tuple
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QColor, QImage, QPainter, QPicture
+
+from neoscore.core.exceptions import ImageExportError
+from neoscore.core.propagating_thread import PropagatingThread
+
+_PACKAGE_ROOT = pathlib.Path(__file__).parent.parent.parent
+
+
+@dataclass(frozen=True)
+class RasterJob:
+    """A recorded scene picture to be rasterized by a worker process."""
+
+    picture: bytes
+    """The serialized ``QPicture``, painted at the output's pixel size"""
+
+    width: int
+    """The output image width in pixels"""
+
+    height: int
+    """The output image height in pixels"""
+
+    dots_per_meter: int
+    """The output image resolution"""
+
+    bg_color: int
+    """The background color as a Qt ARGB value"""
+
+    preserve_alpha: bool
+    """Whether to preserve the output image's alpha channel"""
+
+    autocrop: bool
+    """Whether to crop the output around pixels not of ``bg_color``"""
+
+    quality: int
+    """The output image compression quality"""
+
+    dest: Optional[str]
+    """An output file path, or ``None`` to return the image as PNG data"""
+
+
+def serialize_picture(picture: QPicture) -> bytes:
+    """Serialize a recorded ``QPicture``.
+
+    ``QPicture.data()`` can't be used here since PyQt truncates it at the first null
+    byte.
+    """
+    array = QByteArray()
+    buffer = QBuffer(array)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    picture.save(buffer)
+    buffer.close()
+    return bytes(array)
+
+
+def rasterize(job: RasterJob) -> Optional[bytes]:
+    """Play back a job's picture into an image and save it.
+
+    Returns:
+        The encoded PNG data if ``job.dest`` is ``None``, otherwise ``None``.
+
+    Raises:
+        ImageExportError: If the picture could not be loaded or the image could not
+            be saved.
+    """
+    # Keep a reference to the array, since the buffer doesn't own it
+    array = QByteArray(job.picture)
+    buffer = QBuffer(array)
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+    picture = QPicture()
+    if not picture.load(buffer):
+        raise ImageExportError("Could not load recorded scene picture")
+    buffer.close()
+
+    if job.preserve_alpha:
+        q_image_format = QImage.Format_ARGB32
+    else:
+        q_image_format = QImage.Format_RGB32
+    q_image = QImage(job.width, job.height, q_image_format)
+    q_color = QColor.fromRgba(job.bg_color)
+    q_image.fill(q_color)
+    painter = QPainter()
+    painter.begin(q_image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.drawPicture(0, 0, picture)
+    painter.end()
+    # Image resolution must be set after painting, since pictures are scaled when
+    # played back onto devices with a different resolution than their own.
+    q_image.setDotsPerMeterX(job.dots_per_meter)
+    q_image.setDotsPerMeterY(job.dots_per_meter)
+
+    # Imported here since `app_interface` imports this module
+    from neoscore.interface.app_interface import AppInterface
+
+    final_image = AppInterface._autocrop(q_image, q_color) if job.autocrop else q_image
+    if job.dest is None:
+        output_array = QByteArray()
+        qbuf = QBuffer(output_array)
+        qbuf.open(QIODevice.OpenModeFlag.WriteOnly)
+        success = final_image.save(qbuf, quality=job.quality, format="PNG")
+        qbuf.close()
+        if not success:
+            raise ImageExportError(
+                "Unknown error occurred when exporting image to bytearray"
+            )
+        return bytes(output_array)
+    if not final_image.save(job.dest, quality=job.quality):
+        raise ImageExportError(
+            "Unknown error occurred when exporting image to " + job.dest
+        )
+    return None
+
+
+class RasterWorkerPool:
+    """A pool of worker processes which rasterize :obj:`RasterJob` s.
+
+    Jobs are dispatched as they are submitted, so the caller can keep recording
+    pictures while earlier ones are rasterized. Each worker process is managed by a
+    thread in this process, which writes the results of its jobs to their
+    destinations.
+    """
+
+    def __init__(self, processes: int, font_paths: List[str]):
+        """
+        Args:
+            processes: The number of worker processes to start.
+            font_paths: Paths to font files to register in every worker.
+        """
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+        self._font_paths = list(font_paths)
+        self._jobs: queue.Queue[
+            Optional[Tuple[RasterJob, Optional[bytearray], Future]]
+        ] = queue.Queue()
+        self._threads = [
+            PropagatingThread(target=self._serve) for _ in range(processes)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, job: RasterJob, dest: Optional[bytearray] = None) -> Future:
+        """Queue a job for rasterization.
+
+        Args:
+            job: The job to run.
+            dest: A bytearray to write the resulting PNG data into. This must be
+                given if and only if ``job.dest`` is ``None``.
+
+        Returns:
+            A future which completes once the job's output is written, raising an
+            ``ImageExportError`` if the job failed.
+        """
+        future: Future = Future()
+        self._jobs.put((job, dest, future))
+        return future
+
+    def join(self):
+        """Wait for all submitted jobs to finish and shut down the workers.
+
+        Raises:
+            ImageExportError: If any job failed or a worker process died.
+        """
+        for _ in self._threads:
+            self._jobs.put(None)
+        error = None
+        for thread in self._threads:
+            try:
+                thread.join()
+            except BaseException as e:
+                error = error or e
+        if error:
+            raise error
+
+    def __enter__(self) -> RasterWorkerPool:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.join()
+
+    def _serve(self):
+        """Run one worker process, feeding it jobs until the pool is joined."""
+        env = dict(os.environ)
+        env["QT_QPA_PLATFORM"] = "offscreen"
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(_PACKAGE_ROOT), env.get("PYTHONPATH")) if p
+        )
+        process = subprocess.Popen(
+            [sys.executable, "-m", __name__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+        error = None
+        try:
+            try:
+                RasterWorkerPool._send(process.stdin, self._font_paths)
+            except OSError:
+                error = ImageExportError("Raster worker process failed to start")
+            while True:
+                item = self._jobs.get()
+                if item is None:
+                    break
+                job, dest, future = item
+                if error:
+                    # Keep draining so other workers aren't left with every job
+                    future.set_exception(error)
+                    continue
+                try:
+                    RasterWorkerPool._send(process.stdin, job)
+                    succeeded, result = pickle.load(process.stdout)
+                except (EOFError, OSError):
+                    error = ImageExportError(
+                        "Raster worker process exited unexpectedly"
+                    )
+                    future.set_exception(error)
+                    continue
+                if not succeeded:
+                    error = ImageExportError(result)
+                    future.set_exception(error)
+                    continue
+                if dest is not None:
+                    dest.clear()
+                    dest.extend(result)
+                future.set_result(None)
+        finally:
+            process.stdin.close()
+            if error:
+                process.kill()
+            process.wait()
+        if error:
+            raise error
+
+    @staticmethod
+    def _send(stream: BinaryIO, message: object):
+        pickle.dump(message, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        stream.flush()
+
+
+def _main():
+    # Route anything else printing to stdout (like font warnings) to stderr so it
+    # can't corrupt the message stream.
+    output = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    stdin = sys.stdin.buffer
+
+    from PyQt5.QtGui import QFontDatabase, QGuiApplication
+
+    app = QGuiApplication(["neoscore-raster-worker", "-platform", "offscreen"])
+    font_paths = pickle.load(stdin)
+    for path in font_paths:
+        QFontDatabase.addApplicationFont(path)
+    while True:
+        try:
+            job = pickle.load(stdin)
+        except EOFError:
+            break
+        try:
+            response = (True, rasterize(job))
+        except Exception as e:
+            response = (False, str(e))
+        RasterWorkerPool._send(output, response)
+    del app
+
+
+if __name__ == "__main__":
+    _main()
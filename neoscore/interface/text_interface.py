@@ -1,11 +1,16 @@
+from __future__ import annotations
+
+import sys
 from dataclasses import dataclass
-from typing import Dict, NamedTuple, Optional
+from typing import NamedTuple, Optional, Tuple
 
 from PyQt5.QtGui import QFont, QPainterPath
 
+from neoscore.core.caching import LruCache
 from neoscore.core.units import Unit
 from neoscore.interface.brush_interface import BrushInterface
 from neoscore.interface.font_interface import FontInterface
+from neoscore.interface.glyph_atlas import PATH_ELEMENT_BYTES, text_path
 from neoscore.interface.pen_interface import PenInterface
 from neoscore.interface.positioned_object_interface import PositionedObjectInterface
 from neoscore.interface.qt.converters import point_to_qt_point_f
@@ -24,7 +29,13 @@ class _CachedTextPath(NamedTuple):
     generation_font_size: int
 
 
-_PATH_CACHE: Dict[_CachedTextKey, _CachedTextPath] = {}
+def _estimate_cached_path_size(key: _CachedTextKey, value: _CachedTextPath) -> int:
+    return sys.getsizeof(key.text) + value.path.elementCount() * PATH_ELEMENT_BYTES
+
+
+_PATH_CACHE: LruCache[_CachedTextKey, _CachedTextPath] = LruCache(
+    "text_paths", 4096, _estimate_cached_path_size
+)
 
 """NOTE: We can actually optimize this even further. We can modify
 q_clipping_path so it explicitly stores paint results in the global
@@ -68,9 +79,16 @@ class TextInterface(PositionedObjectInterface):
     Use ``None`` to render to the end.
     """
 
+    @property
+    def _clip_region(self) -> Tuple[float, Optional[float]]:
+        return (
+            self.clip_start_x.base_value if self.clip_start_x is not None else 0,
+            self.clip_width.base_value if self.clip_width is not None else None,
+        )
+
     def render(self):
         """Render the line to the scene."""
-        self._register_qt_object(self._create_qt_object())
+        self._render_reconciled(self._create_qt_object)
 
     def _create_qt_object(self) -> QClippingPath:
         """Create and return this interface's underlying Qt object"""
@@ -81,22 +99,41 @@ class TextInterface(PositionedObjectInterface):
         qt_object.update_geometry()
         return qt_object
 
+    def _patch_qt_object(
+        self, previous: TextInterface, qt_object: QClippingPath
+    ) -> bool:
+        self._patch_transform(previous, qt_object)
+        geometry_changed = False
+        if (
+            self.text != previous.text
+            or self.font != previous.font
+            or self.scale != previous.scale
+            or self._clip_region != previous._clip_region
+        ):
+            path, scale = self._resolve_path(self.text, self.font, self.scale)
+            qt_object.setPath(path)
+            qt_object.setScale(scale)
+            qt_object.set_clip_region(*self._clip_region)
+            geometry_changed = True
+        if self.pen != previous.pen:
+            qt_object.setPen(self.pen.qt_object)
+            geometry_changed = True
+        if self.brush != previous.brush:
+            qt_object.setBrush(self.brush.qt_object)
+        if self.background_brush != previous.background_brush:
+            qt_object.background_brush = (
+                self.background_brush.qt_object if self.background_brush else None
+            )
+            qt_object.update()
+        if geometry_changed:
+            qt_object.update_geometry()
+        return True
+
     def _get_path(self, text: str, font: FontInterface, scale: float) -> QClippingPath:
-        qt_font = font.qt_object
-        needed_font_size = qt_font.pixelSize()
-        key = _CachedTextKey(text, font.family_name, font.weight, font.italic)
-        cached_result = _PATH_CACHE.get(key)
-        if cached_result:
-            cache_scale = needed_font_size / cached_result.generation_font_size
-            scale *= cache_scale
-            path = cached_result.path
-        else:
-            path = TextInterface._create_qt_path(text, qt_font)
-            _PATH_CACHE[key] = _CachedTextPath(path, needed_font_size)
+        path, scale = self._resolve_path(text, font, scale)
         return QClippingPath(
             path,
-            self.clip_start_x.base_value if self.clip_start_x is not None else 0,
-            self.clip_width.base_value if self.clip_width is not None else None,
+            *self._clip_region,
             scale,
             self.rotation,
             self.background_brush.qt_object if self.background_brush else None,
@@ -105,8 +142,29 @@ class TextInterface(PositionedObjectInterface):
         )
 
     @staticmethod
-    def _create_qt_path(text: str, font: QFont) -> QPainterPath:
-        qt_path = QPainterPath()
-        qt_path.addText(0, 0, font, text)
+    def _resolve_path(
+        text: str, font: FontInterface, scale: float
+    ) -> Tuple[QPainterPath, float]:
+        """Get a (possibly cached) path for some text and the scale to draw it at."""
+        qt_font = font.qt_object
+        needed_font_size = qt_font.pixelSize()
+        key = _CachedTextKey(text, font.family_name, font.weight, font.italic)
+        cached_result = _PATH_CACHE.get(key)
+        if cached_result is not None:
+            cache_scale = needed_font_size / cached_result.generation_font_size
+            return cached_result.path, scale * cache_scale
+        path = TextInterface._create_qt_path(text, qt_font, font.compose_glyph_paths)
+        _PATH_CACHE.put(key, _CachedTextPath(path, needed_font_size))
+        return path, scale
+
+    @staticmethod
+    def _create_qt_path(
+        text: str, font: QFont, compose_glyph_paths: bool = False
+    ) -> QPainterPath:
+        if compose_glyph_paths:
+            qt_path = text_path(text, font)
+        else:
+            qt_path = QPainterPath()
+            qt_path.addText(0, 0, font, text)
         qt_path.setFillRule(1)
         return qt_path
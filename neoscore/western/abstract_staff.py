@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
 
 from neoscore.core.has_music_font import HasMusicFont
 from neoscore.core.layout_controllers import NewLine
@@ -9,7 +9,7 @@ from neoscore.core.painted_object import PaintedObject
 from neoscore.core.path import Path
 from neoscore.core.pen import PenDef
 from neoscore.core.point import Point, PointDef
-from neoscore.core.positioned_object import PositionedObject
+from neoscore.core.positioned_object import PositionedObject, render_cached_property
 from neoscore.core.units import ZERO, Unit
 from neoscore.western.staff_fringe_layout import StaffFringeLayout
 from neoscore.western.staff_group import StaffGroup
@@ -101,11 +101,23 @@ class AbstractStaff(PaintedObject, HasMusicFont):
 
     def find_ordered_descendants_with_attr(self, attr: str) -> List[Tuple[Unit, Any]]:
         """Find all descendants with an attribute, sorted with their staff x positions"""
-        result = [
-            (self.descendant_pos_x(obj), obj)
-            for obj in self.descendants_with_attribute(attr)
-        ]
-        result.sort(key=lambda tup: tup[0])
+        return self._sorted_with_staff_x(self.descendants_with_attribute(attr))
+
+    def _find_ordered_descendants_with_class_attr(
+        self, attr: str
+    ) -> List[Tuple[Unit, Any]]:
+        """Like :obj:`find_ordered_descendants_with_attr`, but only matching class
+        attributes, such as type markers.
+
+        This is much faster since it uses the staff's class index.
+        """
+        return self._sorted_with_staff_x(self._descendants_with_class_attribute(attr))
+
+    def _sorted_with_staff_x(
+        self, objects: Iterable[PositionedObject]
+    ) -> List[Tuple[Unit, Any]]:
+        result = [(self.descendant_pos_x(obj), obj) for obj in objects]
+        result.sort(key=lambda tup: tup[0].base_value)
         return result
 
     def y_inside_staff(self, pos_y: Unit) -> bool:
@@ -115,8 +127,21 @@ class AbstractStaff(PaintedObject, HasMusicFont):
         """
         return ZERO <= pos_y <= self.height
 
+    @render_cached_property
+    def _fringe_layouts(self) -> Dict[Optional[float], StaffFringeLayout]:
+        """Fringe layouts found this render, keyed by their line's flowable x.
+
+        This is filled in lazily by :obj:`fringe_layout_at`.
+        """
+        return {}
+
     def fringe_layout_at(self, location: Optional[NewLine]) -> StaffFringeLayout:
-        return self.group.fringe_layout_at(self, location)
+        key = location.flowable_x.base_value if location else None
+        layouts = self._fringe_layouts
+        layout = layouts.get(key)
+        if layout is None:
+            layout = layouts[key] = self.group.fringe_layout_at(self, location)
+        return layout
 
     def _render_slice(
         self,
@@ -199,6 +224,31 @@ class AbstractStaff(PaintedObject, HasMusicFont):
         """
         raise NotImplementedError
 
+    def fringe_layout_fingerprint(
+        self, location: Optional[NewLine]
+    ) -> Optional[Hashable]:
+        """Summarize every input to :obj:`fringe_layout_for_isolated_staff`.
+
+        ``StaffGroup`` uses this to reuse fringe layouts across renders, recomputing
+        them only when this value changes. The location's flowable position is
+        accounted for separately.
+
+        Staff subclasses may implement this to enable fringe layout caching. The
+        default returns ``None``, which disables it.
+        """
+        return None
+
+    def _fringe_staff_pos_x(self, location: Optional[NewLine]) -> Unit:
+        """Find the staff position of a fringe location."""
+        if not location:
+            return ZERO
+        staff_pos_x = location.flowable_x - self.flowable.descendant_pos_x(self)
+        if staff_pos_x < ZERO:
+            # This happens on the first line of a staff positioned at x>0 relative
+            # to its flowable.
+            return ZERO
+        return staff_pos_x
+
     def pre_render_hook(self):
         super().pre_render_hook()
         self.register_layout_controllers()
@@ -58,14 +58,7 @@ class Flag(MusicText):
         """
         self.duration = duration
         self.direction = direction
-        duration_display = cast(DurationDisplay, self.duration.display)
-        if duration_display.flag_count == 0:
-            raise NoFlagNeededError(self.duration)
-        if self.direction == DirectionY.DOWN:
-            glyph_name = self._down_glyphnames[duration_display.flag_count]
-        else:
-            glyph_name = self._up_glyphnames[duration_display.flag_count]
-        MusicText.__init__(self, pos, parent, [glyph_name], font)
+        MusicText.__init__(self, pos, parent, [self._glyph_name()], font)
 
     @property
     def duration(self) -> Duration:
@@ -73,10 +66,13 @@ class Flag(MusicText):
 
     @duration.setter
     def duration(self, value: DurationDef):
+        rebuild_needed = hasattr(self, "_direction")
         value = Duration.from_def(value)
         if value.display is None:
             raise ValueError(f"{value} cannot be represented as a single note")
         self._duration = value
+        if rebuild_needed:
+            self.text = self._glyph_name()
 
     @property
     def direction(self) -> DirectionY:
@@ -84,7 +80,19 @@ class Flag(MusicText):
 
     @direction.setter
     def direction(self, value: DirectionY):
+        rebuild_needed = hasattr(self, "_direction")
         self._direction = value
+        if rebuild_needed:
+            self.text = self._glyph_name()
+
+    def _glyph_name(self) -> str:
+        duration_display = cast(DurationDisplay, self.duration.display)
+        if duration_display.flag_count == 0:
+            raise NoFlagNeededError(self.duration)
+        if self.direction == DirectionY.DOWN:
+            return self._down_glyphnames[duration_display.flag_count]
+        else:
+            return self._up_glyphnames[duration_display.flag_count]
 
     @classmethod
     def vertical_offset_needed(cls, duration: Duration) -> int:
@@ -48,8 +48,8 @@ class Hairpin(Spanner2D, MusicPath):
         MusicPath.__init__(self, pos, parent, font=font, brush=Brush.no_brush())
         end_pos = Point.from_def(end_pos)
         Spanner2D.__init__(self, end_pos, end_parent or self)
-        self.direction = direction
-        self.width = width if width is not None else self.music_font.unit(1)
+        self._direction = direction
+        self._width = width if width is not None else self.music_font.unit(1)
         self.pen = Pen(thickness=self.music_font.engraving_defaults["hairpinThickness"])
         self._draw_path()
 
@@ -68,6 +68,21 @@ class Hairpin(Spanner2D, MusicPath):
     @direction.setter
     def direction(self, value: DirectionX):
         self._direction = value
+        self._redraw_path()
+
+    @property
+    def width(self) -> Unit:
+        """The width of the wide end of the hairpin."""
+        return self._width
+
+    @width.setter
+    def width(self, value: Unit):
+        self._width = value
+        self._redraw_path()
+
+    def _end_changed(self):
+        super()._end_changed()
+        self._redraw_path()
 
     def _find_hairpin_points(
         self,
@@ -138,6 +153,12 @@ class Hairpin(Spanner2D, MusicPath):
             end_center_parent,
         )
 
+    def _redraw_path(self):
+        # The path is first drawn at the end of ``__init__``
+        if self.elements:
+            self._clear_elements()
+            self._draw_path()
+
     def _draw_path(self):
         (
             first_pos,
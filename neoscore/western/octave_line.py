@@ -99,19 +99,30 @@ class OctaveLine(Spanner, PositionedObject, HasMusicFont):
         path_x = text_rect.width
         path_y = cast(Unit, text_rect.height / -2)
         self.line_path.pos = Point(path_x, path_y)
+        self._draw_line_path()
 
-        # Drawn main line part
+    @property
+    def music_font(self) -> MusicFont:
+        return self._music_font
+
+    def _end_changed(self):
+        super()._end_changed()
+        # The line is first drawn at the end of ``__init__``
+        if hasattr(self, "line_text"):
+            self.line_text._length = self.breakable_length
+            self.line_path._clear_elements()
+            self._draw_line_path()
+
+    def _draw_line_path(self):
+        """Draw the main line part, ending in a hook."""
+        path_y = self.line_path.y
         self.line_path.line_to(self.end_pos.x, path_y, self.end_parent)
         self.line_path.line_to(
             self.end_pos.x,
-            (path_y + font.unit(0.75 * self.direction.value)),
+            (path_y + self.music_font.unit(0.75 * self.direction.value)),
             self.end_parent,
         )
 
-    @property
-    def music_font(self) -> MusicFont:
-        return self._music_font
-
 
 class _OctaveLineText(MusicText):
     """An octave text mark recurring at line beginnings with added parenthesis.
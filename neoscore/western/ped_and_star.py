@@ -51,3 +51,10 @@ class PedAndStar(Spanner2D, PositionedObject, HasMusicFont):
     @property
     def music_font(self) -> MusicFont:
         return self._music_font
+
+    def _end_changed(self):
+        super()._end_changed()
+        # The lift mark is first created at the end of ``__init__``
+        if hasattr(self, "lift_mark"):
+            self.lift_mark.parent = self.end_parent
+            self.lift_mark.pos = self.end_pos
@@ -67,6 +67,13 @@ class PedalLine(Spanner, MusicPath):
         self.half_lift_positions = half_lift_positions
         self._draw_path()
 
+    def _end_changed(self):
+        super()._end_changed()
+        # The path is first drawn at the end of ``__init__``
+        if self.elements:
+            self._clear_elements()
+            self._draw_path()
+
     def _draw_path(self):
         """Draw the path according to this object's attributes.
 
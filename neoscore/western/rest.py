@@ -45,14 +45,7 @@ class Rest(MusicText):
         """
         pos = Point.from_def(pos)
         self.duration = Duration.from_def(duration)
-        duration_display = cast(DurationDisplay, self.duration.display)
-        MusicText.__init__(
-            self,
-            pos,
-            parent,
-            [self._glyphnames[duration_display.base_duration]],
-            font,
-        )
+        MusicText.__init__(self, pos, parent, [self._glyph_name()], font)
 
     @property
     def duration(self) -> Duration:
@@ -61,7 +54,14 @@ class Rest(MusicText):
 
     @duration.setter
     def duration(self, value: DurationDef):
+        rebuild_needed = hasattr(self, "_duration")
         value = Duration.from_def(value)
         if value.display is None:
             raise ValueError(f"{value} cannot be represented as a single note")
         self._duration = value
+        if rebuild_needed:
+            self.text = self._glyph_name()
+
+    def _glyph_name(self) -> str:
+        duration_display = cast(DurationDisplay, self.duration.display)
+        return self._glyphnames[duration_display.base_duration]
@@ -60,3 +60,10 @@ class Slur(Spanner2D, AbstractSlur):
         )
         Spanner2D.__init__(self, end_pos, end_parent or self)
         self.draw_slur(self.end_pos, self.end_parent)
+
+    def _end_changed(self):
+        super()._end_changed()
+        # The slur is first drawn at the end of ``__init__``
+        if self.elements:
+            self._clear_elements()
+            self.draw_slur(self.end_pos, self.end_parent)
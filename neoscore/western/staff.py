@@ -1,6 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Type, cast
+from bisect import bisect_left, bisect_right
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from neoscore.core.exceptions import NoClefError
 from neoscore.core.layout_controllers import MarginController, NewLine
@@ -16,6 +28,7 @@ from neoscore.western.staff_group import StaffGroup
 if TYPE_CHECKING:
     from neoscore.western.clef import Clef
     from neoscore.western.key_signature import KeySignature
+    from neoscore.western.time_signature import TimeSignature
 
 
 class Staff(AbstractStaff):
@@ -66,52 +79,89 @@ class Staff(AbstractStaff):
         :obj:`.Clef`.
         """
         start_x = self.map_x_to(cast(PositionedObject, staff_object))
-        all_others_of_class = (
-            item
-            for item in self.descendants_of_exact_class(type(staff_object))
-            if item != staff_object
-        )
-        closest_x = Unit(float("inf"))
-        for item in all_others_of_class:
-            relative_x = self.map_x_to(item)
-            if start_x < relative_x < closest_x:
-                closest_x = relative_x
-        if closest_x == Unit(float("inf")):
+        xs = self._exact_class_xs(type(staff_object))
+        # Find the first object of the type after ``staff_object``, matching the
+        # tolerance of ``Unit`` comparisons
+        i = bisect_right(xs, start_x.base_value + Unit._CMP_POS_EPSILON)
+        if i == len(xs):
             return self.breakable_length - start_x
-        return closest_x - start_x
+        return Unit(xs[i]) - start_x
+
+    @render_cached_property
+    def _exact_class_x_index(self) -> Dict[type, List[float]]:
+        """Sorted base-unit x positions of descendants by exact class.
+
+        This is filled in lazily by :obj:`_exact_class_xs`.
+        """
+        return {}
+
+    def _exact_class_xs(self, cls: type) -> List[float]:
+        """Find the sorted base-unit x positions of all descendants of a class.
+
+        Subclasses are excluded. Results are reused for the rest of the render.
+        """
+        index = self._exact_class_x_index
+        xs = index.get(cls)
+        if xs is None:
+            xs = sorted(
+                self._map_x_to_raw(item)
+                for item in self.descendants_of_exact_class(cls)
+            )
+            index[cls] = xs
+        return xs
 
     @render_cached_property
     def clefs(self) -> List[Tuple[Unit, Clef]]:
         """All the clefs in this staff, ordered by their relative x pos."""
-        return self.find_ordered_descendants_with_attr("middle_c_staff_position")
+        return self._find_ordered_descendants_with_class_attr("middle_c_staff_position")
+
+    @render_cached_property
+    def _clef_xs(self) -> List[float]:
+        """The base-unit x positions of :obj:`clefs`, for bisection."""
+        return [clef_x.base_value for clef_x, _ in self.clefs]
 
     def active_clef_at(self, pos_x: Unit) -> Optional[Clef]:
         """Return the active clef at a given x position, if any."""
-        return next(
-            (clef for (clef_x, clef) in reversed(self.clefs) if clef_x <= pos_x),
-            None,
-        )
+        return _last_at_or_before(self._clef_xs, self.clefs, pos_x)
 
     @render_cached_property
     def key_signatures(self) -> List[Tuple[Unit, KeySignature]]:
         """All the key signatures in this staff, ordered by their relative x pos."""
-        return self.find_ordered_descendants_with_attr(
+        return self._find_ordered_descendants_with_class_attr(
             "_neoscore_key_signature_type_marker"
         )
 
     @render_cached_property
-    def time_signatures(self) -> List[Tuple[Unit, KeySignature]]:
+    def _key_signature_xs(self) -> List[float]:
+        """The base-unit x positions of :obj:`key_signatures`, for bisection."""
+        return [sig_x.base_value for sig_x, _ in self.key_signatures]
+
+    @render_cached_property
+    def time_signatures(self) -> List[Tuple[Unit, TimeSignature]]:
         """All the time signatures in this staff, ordered by their relative x pos."""
-        return self.find_ordered_descendants_with_attr(
+        return self._find_ordered_descendants_with_class_attr(
             "_neoscore_time_signature_type_marker"
         )
 
+    @render_cached_property
+    def _time_signature_xs(self) -> List[float]:
+        """The base-unit x positions of :obj:`time_signatures`, for bisection."""
+        return [sig_x.base_value for sig_x, _ in self.time_signatures]
+
     def active_key_signature_at(self, pos_x: Unit) -> Optional[KeySignature]:
         """Return the active key signature at a given x position, if any."""
-        return next(
-            (sig for (sig_x, sig) in reversed(self.key_signatures) if sig_x <= pos_x),
-            None,
-        )
+        return _last_at_or_before(self._key_signature_xs, self.key_signatures, pos_x)
+
+    def time_signature_at(self, pos_x: Unit) -> Optional[TimeSignature]:
+        """Return the time signature located exactly at a given x position, if any."""
+        xs = self._time_signature_xs
+        pos = pos_x.base_value
+        # Find the first time signature not before ``pos_x``, matching the
+        # tolerance of ``Unit`` comparisons
+        i = bisect_right(xs, pos + Unit._CMP_NEG_EPSILON)
+        if i < len(xs) and xs[i] - pos < Unit._CMP_POS_EPSILON:
+            return self.time_signatures[i][1]
+        return None
 
     def middle_c_at(self, pos_x: Unit) -> Unit:
         """Find the y-axis staff position of middle-c at a given point.
@@ -184,7 +234,7 @@ class Staff(AbstractStaff):
                     "_neoscore_key_signature",
                 )
             )
-        for time_sig in self.descendants_with_attribute(
+        for time_sig in self._descendants_with_class_attribute(
             "_neoscore_time_signature_type_marker"
         ):
             flowable_x = flowable.descendant_pos_x(time_sig)
@@ -204,21 +254,12 @@ class Staff(AbstractStaff):
     def fringe_layout_for_isolated_staff(
         self, location: Optional[NewLine]
     ) -> StaffFringeLayout:
-        if location:
-            staff_pos_x = location.flowable_x - self.flowable.descendant_pos_x(self)
-            if staff_pos_x < ZERO:
-                # This happens on the first line of a staff positioned at x>0 relative
-                # to its flowable.
-                staff_pos_x = ZERO
-        else:
-            staff_pos_x = ZERO
+        staff_pos_x = self._fringe_staff_pos_x(location)
         # Work right-to-left through different fringe layers
         current_x = -self.unit(StaffGroup.RIGHT_PADDING)
         clef = self.active_clef_at(staff_pos_x)
         key_sig = self.active_key_signature_at(staff_pos_x)
-        time_sig = next(
-            (sig for x, sig in self.time_signatures if x == staff_pos_x), None
-        )
+        time_sig = self.time_signature_at(staff_pos_x)
         clef_fringe_pos = current_x
         key_signature_fringe_pos = current_x
         time_signature_fringe_pos = current_x
@@ -246,3 +287,42 @@ class Staff(AbstractStaff):
             key_signature_fringe_pos,
             time_signature_fringe_pos,
         )
+
+    def fringe_layout_fingerprint(self, location: Optional[NewLine]) -> Hashable:
+        staff_pos_x = self._fringe_staff_pos_x(location)
+        clef = self.active_clef_at(staff_pos_x)
+        key_sig = self.active_key_signature_at(staff_pos_x)
+        time_sig = self.time_signature_at(staff_pos_x)
+        return (
+            staff_pos_x.base_value,
+            self.unit(1).base_value,
+            clef,
+            clef.bounding_rect.width.base_value if clef else None,
+            key_sig,
+            key_sig.visual_width.base_value if key_sig else None,
+            time_sig,
+            time_sig.visual_width.base_value if time_sig else None,
+        )
+
+
+_T = TypeVar("_T")
+
+
+def _last_at_or_before(
+    xs: Sequence[float], items: Sequence[Tuple[Unit, _T]], pos_x: Unit
+) -> Optional[_T]:
+    """Find the last item positioned at or before ``pos_x``.
+
+    Args:
+        xs: The sorted base-unit x positions of ``items``
+        items: ``(x, item)`` pairs sorted by x
+        pos_x: The position to look up
+
+    Returns:
+        The item, or ``None`` if every item comes after ``pos_x``.
+    """
+    # Match the tolerance of ``Unit`` comparisons
+    i = bisect_left(xs, pos_x.base_value + Unit._CMP_POS_EPSILON) - 1
+    if i < 0:
+        return None
+    return items[i][1]
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
 
 from sortedcontainers import SortedKeyList  # type: ignore
 
 from neoscore.core import neoscore
+from neoscore.core.caching import LruCacheFamily
 from neoscore.core.layout_controllers import NewLine
 from neoscore.core.units import ZERO, Unit
 from neoscore.western.staff_fringe_layout import StaffFringeLayout
@@ -12,6 +13,12 @@ from neoscore.western.staff_fringe_layout import StaffFringeLayout
 if TYPE_CHECKING:
     from neoscore.western.abstract_staff import AbstractStaff
 
+_FringeLayoutCacheKey = Tuple[Optional[float], bool, Hashable]
+
+_FRINGE_LAYOUT_CACHES: LruCacheFamily[
+    _FringeLayoutCacheKey, Dict["AbstractStaff", StaffFringeLayout]
+] = LruCacheFamily("staff_fringe_layouts", 1024)
+
 
 class StaffGroup:
 
@@ -38,9 +45,7 @@ class StaffGroup:
     """Padding to the left of key signatures in fringes, in pseudo-staff-units."""
 
     def __init__(self) -> None:
-        self._fringe_layout_cache: Dict[
-            Tuple[AbstractStaff, Optional[NewLine]], StaffFringeLayout
-        ] = {}
+        self._fringe_layout_cache = _FRINGE_LAYOUT_CACHES.new_cache()
         # Sort staves according to position to some arbitrary known object
         self._staves: SortedKeyList[AbstractStaff] = SortedKeyList(
             key=lambda s: neoscore.document.pages[0].map_to(s).y
@@ -65,33 +70,65 @@ class StaffGroup:
         This automatically aligns the returned layout with the fringes of other staves
         in the group.
 
-        Layouts are internally cached so this is fairly efficient.
+        Layouts are cached by the location's flowable position and a fingerprint of
+        every staff input to them (see
+        :obj:`.AbstractStaff.fringe_layout_fingerprint`), so they are reused across
+        renders until something affecting them changes. Cache usage is reported under
+        ``staff_fringe_layouts`` in :obj:`.neoscore.cache_stats`.
         """
-        # If the layout is already cached, return it
-        cached_value = self._fringe_layout_cache.get((staff, location))
-        if cached_value:
-            return cached_value
         # If the staff doesn't actually exist at the beginning of a line,
         # Do its fringe layout in isolation
-        if not self._staff_exists_at(staff, location):
-            layout = staff.fringe_layout_for_isolated_staff(location)
-            self._fringe_layout_cache[(staff, location)] = layout
-            return layout
+        isolated = not self._staff_exists_at(staff, location)
+        if isolated:
+            staves = [staff]
+        else:
+            staves = [s for s in self.staves if self._staff_exists_at(s, location)]
+        fingerprint = self._fringe_layout_fingerprint(staves, location)
+        if fingerprint is None:
+            return self._find_fringe_layouts(staves, location, isolated)[staff]
+        location_x = location.flowable_x.base_value if location else None
+        cache_key = (location_x, isolated, fingerprint)
+        layouts = self._fringe_layout_cache.get(cache_key)
+        if layouts is None:
+            layouts = self._find_fringe_layouts(staves, location, isolated)
+            self._fringe_layout_cache.put(cache_key, layouts)
+        return layouts[staff]
+
+    @staticmethod
+    def _fringe_layout_fingerprint(
+        staves: List[AbstractStaff], location: Optional[NewLine]
+    ) -> Optional[Hashable]:
+        """Summarize every input to the fringe layouts of some staves.
+
+        Returns ``None`` if any staff's layout can't be fingerprinted.
+        """
+        fingerprints = []
+        for staff in staves:
+            staff_fingerprint = staff.fringe_layout_fingerprint(location)
+            if staff_fingerprint is None:
+                return None
+            fingerprints.append((staff, staff_fingerprint))
+        return tuple(fingerprints)
+
+    def _find_fringe_layouts(
+        self, staves: List[AbstractStaff], location: Optional[NewLine], isolated: bool
+    ) -> Dict[AbstractStaff, StaffFringeLayout]:
+        """Compute the aligned fringe layouts of staves at a location."""
+        if isolated:
+            staff = staves[0]
+            return {staff: staff.fringe_layout_for_isolated_staff(location)}
         # Work out the layouts of each staff in isolation first
         isolated_layouts = []
         min_staff_basis = ZERO  # Wider fringes give a lower number here (further left)
-        for iter_staff in self.staves:
-            if not self._staff_exists_at(iter_staff, location):
-                continue
+        for iter_staff in staves:
             layout = iter_staff.fringe_layout_for_isolated_staff(location)
             min_staff_basis = min(min_staff_basis, layout.staff)
             isolated_layouts.append((iter_staff, layout))
-        # Then align each layout to fit the widest layout found, and store each in cache
-        for iter_staff, isolated_layout in isolated_layouts:
-            aligned_layout = self._align_layout(isolated_layout, min_staff_basis)
-            self._fringe_layout_cache[(iter_staff, location)] = aligned_layout
-        # Now the requested layout is cached, so return it
-        return self._fringe_layout_cache[(staff, location)]
+        # Then align each layout to fit the widest layout found
+        return {
+            iter_staff: self._align_layout(isolated_layout, min_staff_basis)
+            for iter_staff, isolated_layout in isolated_layouts
+        }
 
     @staticmethod
     def _staff_exists_at(staff: AbstractStaff, location: Optional[NewLine]) -> bool:
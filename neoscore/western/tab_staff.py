@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Hashable, Optional, cast
 
 from neoscore.core.layout_controllers import MarginController, NewLine
 from neoscore.core.music_font import MusicFont
@@ -87,7 +87,9 @@ class TabStaff(AbstractStaff):
     @render_cached_property
     def clefs(self) -> List[Tuple[Unit, TabClef]]:
         """All the clefs in this staff, ordered by their relative x pos."""
-        return self.find_ordered_descendants_with_attr("_neoscore_tab_clef_type_marker")
+        return self._find_ordered_descendants_with_class_attr(
+            "_neoscore_tab_clef_type_marker"
+        )
 
     def active_clef_at(self, pos_x: Unit) -> Optional[TabClef]:
         """Return the active clef at a given x position, if any."""
@@ -129,14 +131,7 @@ class TabStaff(AbstractStaff):
 
         Staff subclasses must implement this.
         """
-        if location:
-            staff_pos_x = location.flowable_x - self.flowable.descendant_pos_x(self)
-            if staff_pos_x < ZERO:
-                # This happens on the first line of a staff positioned at x>0 relative
-                # to its flowable.
-                staff_pos_x = ZERO
-        else:
-            staff_pos_x = ZERO
+        staff_pos_x = self._fringe_staff_pos_x(location)
         # Work right-to-left through different fringe layers
         current_x = -self.unit(StaffGroup.RIGHT_PADDING)
         clef_fringe_pos = current_x
@@ -149,3 +144,13 @@ class TabStaff(AbstractStaff):
         return StaffFringeLayout(
             staff_pos_x, staff_fringe_pos, clef_fringe_pos, ZERO, ZERO
         )
+
+    def fringe_layout_fingerprint(self, location: Optional[NewLine]) -> Hashable:
+        staff_pos_x = self._fringe_staff_pos_x(location)
+        clef = self.active_clef_at(staff_pos_x)
+        return (
+            staff_pos_x.base_value,
+            self.unit(1).base_value,
+            clef,
+            clef.bounding_rect.width.base_value if clef else None,
+        )
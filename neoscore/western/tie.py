@@ -59,3 +59,10 @@ class Tie(Spanner, AbstractSlur):
         )
         Spanner.__init__(self, end_x, end_parent or self)
         self.draw_slur(self.end_pos, self.end_parent)
+
+    def _end_changed(self):
+        super()._end_changed()
+        # The slur is first drawn at the end of ``__init__``
+        if self.elements:
+            self._clear_elements()
+            self.draw_slur(self.end_pos, self.end_parent)
@@ -10,7 +10,7 @@ from neoscore.core.music_font import MusicFont
 from neoscore.core.music_text import MusicText
 from neoscore.core.path import Path
 from neoscore.core.pen import Pen
-from neoscore.core.point import ORIGIN, PointDef
+from neoscore.core.point import ORIGIN, Point, PointDef
 from neoscore.core.positioned_object import PositionedObject
 from neoscore.core.spanner_2d import Spanner2D
 from neoscore.core.text_alignment import AlignmentX, AlignmentY
@@ -79,9 +79,8 @@ class Tuplet(Spanner2D, PositionedObject, HasMusicFont):
         self.smufl_text = self._indicator_to_glyph_names(indicator_text)
 
         # Create line text object; will paint over bracket line
-        spanner_center = self.point_along_spanner(0.5)
         self.indicator = MusicText(
-            (spanner_center.x, spanner_center.y + self.bracket_height),
+            self._indicator_pos(),
             self,
             self.smufl_text,
             font,
@@ -90,6 +89,20 @@ class Tuplet(Spanner2D, PositionedObject, HasMusicFont):
             alignment_y=AlignmentY.CENTER,
         )
 
+    def _end_changed(self):
+        super()._end_changed()
+        # Children are first created at the end of ``__init__``
+        if not hasattr(self, "indicator"):
+            return
+        if self.bracket:
+            self.bracket._clear_elements()
+            self._draw_bracket(self.bracket)
+        self.indicator.pos = self._indicator_pos()
+
+    def _indicator_pos(self) -> Point:
+        spanner_center = self.point_along_spanner(0.5)
+        return Point(spanner_center.x, spanner_center.y + self.bracket_height)
+
     def _create_bracket(self) -> Path:
         bracket = Path(
             ORIGIN,
@@ -97,6 +110,10 @@ class Tuplet(Spanner2D, PositionedObject, HasMusicFont):
             Brush.no_brush(),
             Pen(thickness=self.music_font.engraving_defaults["tupletBracketThickness"]),
         )
+        self._draw_bracket(bracket)
+        return bracket
+
+    def _draw_bracket(self, bracket: Path):
         # Draw opening crook
         bracket.line_to(ZERO, self.bracket_height)
         # Draw spanning line
@@ -105,7 +122,6 @@ class Tuplet(Spanner2D, PositionedObject, HasMusicFont):
         )
         # Draw end crook
         bracket.line_to(self.end_pos.x, self.end_y, self.end_parent)
-        return bracket
 
     @staticmethod
     def _indicator_to_glyph_names(indicator: str) -> List[str]:
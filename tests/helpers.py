@@ -1,3 +1,4 @@
+import importlib.util
 import os
 import sys
 import tempfile
@@ -9,6 +10,11 @@ from neoscore.core.path_element import CurveTo
 from neoscore.core.point import Point
 from neoscore.core.units import Mm, Unit
 
+requires_numpy = unittest.skipIf(
+    importlib.util.find_spec("numpy") is None, "NumPy is not installed"
+)
+"""A test decorator skipping tests which need the optional NumPy dependency."""
+
 
 def assert_almost_equal(
     left: Union[Point, Unit],
@@ -1,10 +1,22 @@
+import os
+import re
+import tempfile
+
+import pytest
+from PyQt5.QtGui import QImage
+
 from neoscore.core import neoscore
 from neoscore.core.brush import Brush
 from neoscore.core.color import Color
+from neoscore.core.music_font import MusicFont
 from neoscore.core.path import Path
 from neoscore.core.pen import Pen
 from neoscore.core.point import ORIGIN
+from neoscore.core.positioned_object import PositionedObject
+from neoscore.core.spanner import Spanner
 from neoscore.core.text import Text
+from neoscore.core.units import ZERO, Mm
+from neoscore.western.hairpin import Hairpin
 
 from ..helpers import AppTest
 
@@ -37,3 +49,339 @@ class TestNeoscore(AppTest):
         neoscore.set_background_brush(new_brush)
         assert neoscore.background_brush == new_brush
         assert neoscore.app_interface.background_brush == new_brush.interface
+
+    def test_incremental_render_only_rebuilds_dirty_subtrees(self):
+        neoscore.set_incremental_rendering(True)
+        try:
+            page = neoscore.document.pages[0]
+            static = Text(ORIGIN, page, "static")
+            parent = Path(ORIGIN, page)
+            child = Text(ORIGIN, parent, "child")
+            last = Text(ORIGIN, page, "last")
+            neoscore._render_document(False, neoscore.background_brush)
+            static_interface = static.interfaces[0]
+            old_child_interface = child.interfaces[0]
+            child.text = "changed"
+            assert neoscore.document._dirty_subtree_roots(False) == [child]
+            neoscore._render_document(False, neoscore.background_brush)
+            assert static.interfaces[0] is static_interface
+            assert child.interfaces[0] is not old_child_interface
+            assert child.interfaces[0].text == "changed"
+            assert old_child_interface._qt_object.scene() is None
+            # Stacking order among siblings is preserved
+            parent.pos = ORIGIN
+            neoscore._render_document(False, neoscore.background_brush)
+            scene_items = neoscore.app_interface.scene.items()
+            assert scene_items.index(
+                parent.interface_for_children._qt_object
+            ) > scene_items.index(last.interface_for_children._qt_object)
+        finally:
+            neoscore.set_incremental_rendering(False)
+
+    def test_incremental_render_rebuilds_position_dependents(self):
+        neoscore.set_incremental_rendering(True)
+        try:
+            page = neoscore.document.pages[0]
+            parent = Text(ORIGIN, page, "parent")
+            anchor = Text((Mm(50), ZERO), parent, "anchor")
+            path = Path(ORIGIN, page)
+            path.line_to(ZERO, ZERO, anchor)
+            neoscore._render_document(False, neoscore.background_brush)
+            parent.x = Mm(50)
+            assert set(neoscore.document._dirty_subtree_roots(False)) == {
+                parent,
+                path,
+            }
+            neoscore._render_document(False, neoscore.background_brush)
+            qt_path = path.interfaces[0]._qt_object.path()
+            end = qt_path.elementAt(qt_path.elementCount() - 1)
+            assert end.x == pytest.approx(Mm(100).base_value)
+        finally:
+            neoscore.set_incremental_rendering(False)
+
+    def test_spanner_end_parent_is_position_dependency(self):
+        neoscore.set_incremental_rendering(True)
+        try:
+
+            class MockSpanner(Spanner, PositionedObject):
+                def __init__(self, end_parent):
+                    PositionedObject.__init__(self, ORIGIN, None)
+                    Spanner.__init__(self, ZERO, end_parent)
+
+            anchor = Text(ORIGIN, None, "anchor")
+            spanner = MockSpanner(anchor)
+            neoscore._render_document(False, neoscore.background_brush)
+            anchor.x = Mm(10)
+            assert spanner in neoscore.document._dirty_subtree_roots(False)
+        finally:
+            neoscore.set_incremental_rendering(False)
+
+    def test_incremental_render_rebuilds_changed_spanner_end(self):
+        neoscore.set_incremental_rendering(True)
+        try:
+            page = neoscore.document.pages[0]
+            hairpin = Hairpin(
+                ORIGIN, page, (Mm(20), ZERO), font=MusicFont("Bravura", Mm)
+            )
+            neoscore._render_document(False, neoscore.background_brush)
+            old_qt_path = hairpin.interfaces[0]._qt_object.path()
+            hairpin.end_pos = (Mm(40), ZERO)
+            roots = neoscore.document._dirty_subtree_roots(False)
+            assert roots is not None
+            assert hairpin in roots
+            neoscore._render_document(False, neoscore.background_brush)
+            qt_path = hairpin.interfaces[0]._qt_object.path()
+            assert qt_path != old_qt_path
+            assert qt_path.elementAt(0).x == pytest.approx(Mm(40).base_value)
+        finally:
+            neoscore.set_incremental_rendering(False)
+
+    def test_changing_spanner_end_parent_drops_old_dependency(self):
+        neoscore.set_incremental_rendering(True)
+        try:
+
+            class MockSpanner(Spanner, PositionedObject):
+                def __init__(self, end_parent):
+                    PositionedObject.__init__(self, ORIGIN, None)
+                    Spanner.__init__(self, ZERO, end_parent)
+
+            old_anchor = Text(ORIGIN, None, "old")
+            new_anchor = Text(ORIGIN, None, "new")
+            spanner = MockSpanner(old_anchor)
+            neoscore._render_document(False, neoscore.background_brush)
+            spanner.end_parent = new_anchor
+            assert spanner in neoscore.document._dirty_subtree_roots(False)
+            neoscore._render_document(False, neoscore.background_brush)
+            old_anchor.x = Mm(10)
+            assert neoscore.document._dirty_subtree_roots(False) == [old_anchor]
+            neoscore._render_document(False, neoscore.background_brush)
+            new_anchor.x = Mm(10)
+            assert spanner in neoscore.document._dirty_subtree_roots(False)
+        finally:
+            neoscore.set_incremental_rendering(False)
+
+    def test_incremental_render_falls_back_to_full_render(self):
+        neoscore.set_incremental_rendering(True)
+        try:
+            text = Text(ORIGIN, None, "test")
+            neoscore._render_document(False, neoscore.background_brush)
+            # Rendering with different page geometry display needs a full render
+            assert neoscore.document._dirty_subtree_roots(True) is None
+            assert neoscore.document._dirty_subtree_roots(False) == []
+            # Changes to pages need a full render
+            text.parent = neoscore.document.pages[1]
+            assert neoscore.document._dirty_subtree_roots(False) is None
+        finally:
+            neoscore.set_incremental_rendering(False)
+
+    def test_dirty_objects_not_tracked_when_incremental_rendering_disabled(self):
+        Text(ORIGIN, None, "test")
+        assert not neoscore.document._dirty_objects
+
+    def test_item_reconciliation_reuses_and_patches_qt_items(self):
+        neoscore.set_item_reconciliation(True)
+        try:
+            text = Text(ORIGIN, None, "test")
+            path = Path.straight_line(ORIGIN, None, (Mm(10), Mm(10)))
+            neoscore._render_document(False, neoscore.background_brush)
+            text_item = text.interfaces[0]._qt_object
+            path_item = path.interfaces[0]._qt_object
+            text.text = "changed"
+            path.pos = (Mm(5), Mm(5))
+            neoscore._render_document(False, neoscore.background_brush)
+            assert text.interfaces[0]._qt_object is text_item
+            assert path.interfaces[0]._qt_object is path_item
+            assert path_item.pos().x() == Mm(5).base_value
+            reconciled = bytearray()
+            neoscore.render_image(None, reconciled, 20)
+        finally:
+            neoscore.set_item_reconciliation(False)
+        rebuilt = bytearray()
+        neoscore.render_image(None, rebuilt, 20)
+        assert reconciled == rebuilt
+
+    def test_viewport_culling(self):
+        neoscore.set_viewport_culling(True, Mm(10))
+        try:
+            doc = neoscore.document
+            near = Text(ORIGIN, doc.pages[0], "near")
+            far = Text(ORIGIN, doc.pages[3], "far")
+            neoscore._render_document(False, neoscore.background_brush, True)
+            assert near.interfaces
+            assert not far.interfaces
+            # The whole document stays reachable by scrolling
+            scene_rect = neoscore.app_interface.scene.sceneRect()
+            assert scene_rect.right() >= doc.pages[3].x.base_value
+            # Moving the view renders newly exposed content
+            neoscore.set_viewport_center_pos(doc.pages[3].pos)
+            neoscore._on_viewport_changed()
+            assert far.interfaces
+            assert not near.interfaces
+            # Non-interactive renders are never culled
+            neoscore._render_document(False, neoscore.background_brush)
+            assert near.interfaces
+            assert far.interfaces
+        finally:
+            neoscore.set_viewport_culling(False)
+
+    def test_render_pdf_vector_mode(self):
+        Text(ORIGIN, None, "page 1")
+        Text((Mm(0), Mm(0)), neoscore.document.pages[1], "page 2")
+        out_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+        out_file.close()
+        try:
+            neoscore.render_pdf(out_file.name, mode="vector")
+            with open(out_file.name, "rb") as f:
+                data = f.read()
+        finally:
+            os.unlink(out_file.name)
+        assert data.startswith(b"%PDF")
+        assert len(re.findall(rb"/Type\s*/Page\b(?!s)", data)) == 2
+        # Cached item pixmaps must not leak into vector output
+        assert b"/Subtype /Image" not in data
+
+    def test_render_pdf_with_unknown_mode(self):
+        with pytest.raises(ValueError):
+            neoscore.render_pdf("out.pdf", mode="foo")
+
+    def test_render_pdf_in_processes(self):
+        Text(ORIGIN, None, "page 1")
+        Text((Mm(0), Mm(0)), neoscore.document.pages[1], "page 2")
+        out_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+        out_file.close()
+        try:
+            neoscore.render_pdf(out_file.name, 20, processes=2)
+            with open(out_file.name, "rb") as f:
+                data = f.read()
+        finally:
+            os.unlink(out_file.name)
+        assert data.startswith(b"%PDF")
+        assert len(re.findall(rb"/Type\s*/Page\b(?!s)", data)) == 2
+
+    def test_render_pdf_streams_pages_in_order(self):
+        Text(ORIGIN, None, "page 1")
+        Text((Mm(0), Mm(0)), neoscore.document.pages[2], "page 3")
+        out_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+        out_file.close()
+        try:
+            neoscore.render_pdf(out_file.name, 20, max_in_flight_pages=1)
+            with open(out_file.name, "rb") as f:
+                data = f.read()
+        finally:
+            os.unlink(out_file.name)
+        assert len(re.findall(rb"/Type\s*/Page\b(?!s)", data)) == 3
+        # Pages are A4-sized images at 20 DPI
+        assert data.count(b"/Width 165 /Height 233") == 3
+
+    def test_render_pdf_removes_partial_file_on_failure(self):
+        Text(ORIGIN, None, "page 1")
+        Text((Mm(0), Mm(0)), neoscore.document.pages[1], "page 2")
+        out_dir = tempfile.TemporaryDirectory()
+        out_path = os.path.join(out_dir.name, "out.pdf")
+
+        def failing_images(*args, **kwargs):
+            yield b"not a png"
+
+        original = neoscore.app_interface.render_png_images
+        neoscore.app_interface.render_png_images = failing_images
+        try:
+            with pytest.raises(ValueError):
+                neoscore.render_pdf(out_path, 20)
+            assert not os.path.exists(out_path)
+        finally:
+            neoscore.app_interface.render_png_images = original
+            out_dir.cleanup()
+
+    def test_render_pdf_with_invalid_max_in_flight_pages(self):
+        with pytest.raises(ValueError):
+            neoscore.render_pdf("out.pdf", max_in_flight_pages=0)
+
+    def test_render_images_in_processes_matches_main_thread_render(self):
+        Text(ORIGIN, None, "test")
+        Path.straight_line((Mm(5), Mm(5)), None, (Mm(20), Mm(10)))
+        rects = [(ZERO, ZERO, Mm(30), Mm(20)), (ZERO, ZERO, Mm(40), Mm(40))]
+        serial = [bytearray() for _ in rects]
+        neoscore.render_images(list(zip(rects, serial)), 50, autocrop=True)
+        parallel = [bytearray() for _ in rects]
+        neoscore.render_images(
+            list(zip(rects, parallel)), 50, autocrop=True, processes=2
+        )
+        for serial_img, parallel_img in zip(serial, parallel):
+            assert parallel_img.startswith(b"\x89PNG")
+            serial_q_image = QImage.fromData(bytes(serial_img))
+            parallel_q_image = QImage.fromData(bytes(parallel_img))
+            assert serial_q_image.size() == parallel_q_image.size()
+            assert serial_q_image.dotsPerMeterX() == parallel_q_image.dotsPerMeterX()
+            # Antialiasing may differ by a few color levels between processes
+            assert _max_channel_difference(serial_q_image, parallel_q_image) <= 4
+
+    def test_render_images_in_processes_to_file(self):
+        Text(ORIGIN, None, "test")
+        with tempfile.TemporaryDirectory() as out_dir:
+            out_path = os.path.join(out_dir, "out.png")
+            neoscore.render_images([(None, out_path)], 20, processes=1)
+            assert not QImage(out_path).isNull()
+
+    def test_render_images_with_invalid_processes(self):
+        with pytest.raises(ValueError):
+            neoscore.render_images([(None, bytearray())], processes=0)
+
+    def test_render_svg(self):
+        Text(ORIGIN, None, "test")
+        Text((Mm(10), ZERO), None, "test")
+        page_svg = bytearray()
+        neoscore.render_svg(neoscore.document.pages[0], page_svg)
+        assert b"<svg" in page_svg
+        # Width is that of the page
+        assert re.search(rb'viewBox="0 0 595\.\d+', page_svg)
+        rect_svg = bytearray()
+        neoscore.render_svg((ZERO, ZERO, Mm(50), Mm(50)), rect_svg)
+        assert rect_svg != page_svg
+        deduplicated_svg = bytearray()
+        neoscore.render_svg(neoscore.document.pages[0], deduplicated_svg, True)
+        assert deduplicated_svg.count(b"<use") == 2
+        assert len(deduplicated_svg) < len(page_svg)
+
+    def test_cache_stats_and_clear_caches(self):
+        neoscore.clear_caches()
+        Text(ORIGIN, None, "cached")
+        Text(ORIGIN, None, "cached")
+        neoscore._render_document(False, neoscore.background_brush)
+        stats = neoscore.cache_stats()
+        assert stats["text_paths"].size == 1
+        assert stats["text_paths"].hits >= 1
+        assert stats["text_paths"].estimated_bytes > 0
+        neoscore.clear_caches()
+        assert neoscore.cache_stats()["text_paths"].size == 0
+
+    def test_set_cache_max_size(self):
+        max_size = neoscore.cache_stats()["text_paths"].max_size
+        try:
+            neoscore.set_cache_max_size("text_paths", 1)
+            Text(ORIGIN, None, "a")
+            Text(ORIGIN, None, "b")
+            neoscore._render_document(False, neoscore.background_brush)
+            assert neoscore.cache_stats()["text_paths"].size == 1
+        finally:
+            neoscore.set_cache_max_size("text_paths", max_size)
+        with pytest.raises(KeyError):
+            neoscore.set_cache_max_size("nonexistent", 1)
+
+
+def _max_channel_difference(image: QImage, other: QImage) -> int:
+    """Find the largest difference in any color channel between two images' pixels."""
+    image = image.convertToFormat(QImage.Format.Format_ARGB32)
+    other = other.convertToFormat(QImage.Format.Format_ARGB32)
+    difference = 0
+    for x in range(image.width()):
+        for y in range(image.height()):
+            color = image.pixelColor(x, y)
+            other_color = other.pixelColor(x, y)
+            difference = max(
+                difference,
+                abs(color.red() - other_color.red()),
+                abs(color.green() - other_color.green()),
+                abs(color.blue() - other_color.blue()),
+                abs(color.alpha() - other_color.alpha()),
+            )
+    return difference
@@ -0,0 +1,136 @@
+import gc
+import unittest
+
+import pytest
+
+from neoscore.core import caching
+from neoscore.core.caching import CacheStats, LruCache, LruCacheFamily
+
+
+class TestLruCache(unittest.TestCase):
+    def tearDown(self):
+        for name in list(caching._REGISTRY):
+            if name.startswith("test_"):
+                del caching._REGISTRY[name]
+
+    def test_get_and_put(self):
+        cache = LruCache("test_cache", 10)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = LruCache("test_cache", 2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_replacing_entry_does_not_evict(self):
+        cache = LruCache("test_cache", 2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("a", 3)
+        assert cache.get("a") == 3
+        assert cache.stats().evictions == 0
+
+    def test_stats(self):
+        cache = LruCache("test_cache", 1, lambda key, value: 10)
+        cache.get("a")
+        cache.put("a", 1)
+        cache.get("a")
+        cache.put("b", 2)
+        assert cache.stats() == CacheStats(1, 1, 1, 1, 1, 10)
+
+    def test_reducing_max_size_evicts(self):
+        cache = LruCache("test_cache", 3)
+        for key in "abc":
+            cache.put(key, key)
+        cache.max_size = 1
+        assert len(cache) == 1
+        assert "c" in cache
+        assert cache.stats().evictions == 2
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            LruCache("test_cache", 0)
+
+    def test_duplicate_name(self):
+        LruCache("test_cache", 1)
+        with pytest.raises(ValueError):
+            LruCache("test_cache", 1)
+
+    def test_clear_resets_stats(self):
+        cache = LruCache("test_cache", 1)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        assert cache.stats() == CacheStats(0, 1, 0, 0, 0, 0)
+
+    def test_registry(self):
+        cache = LruCache("test_cache", 1)
+        cache.put("a", 1)
+        assert caching.get_cache("test_cache") is cache
+        assert caching.cache_stats()["test_cache"].size == 1
+        caching.clear_caches()
+        assert len(cache) == 0
+
+
+class TestLruCacheFamily(unittest.TestCase):
+    def tearDown(self):
+        for name in list(caching._REGISTRY):
+            if name.startswith("test_"):
+                del caching._REGISTRY[name]
+
+    def test_caches_are_unregistered_and_independent(self):
+        family = LruCacheFamily("test_family", 10)
+        cache_1 = family.new_cache()
+        cache_2 = family.new_cache()
+        cache_1.put("a", 1)
+        assert cache_2.get("a") is None
+        assert caching.get_cache("test_family") is family
+        assert list(caching._REGISTRY.values()).count(cache_1) == 0
+
+    def test_stats_combine_caches(self):
+        family = LruCacheFamily("test_family", 1, lambda key, value: 10)
+        cache_1 = family.new_cache()
+        cache_2 = family.new_cache()
+        cache_1.put("a", 1)
+        cache_1.get("a")
+        cache_2.get("a")
+        cache_2.put("a", 1)
+        cache_2.put("b", 2)
+        assert family.stats() == CacheStats(2, 1, 1, 1, 1, 20)
+
+    def test_freed_caches_leave_stats(self):
+        family = LruCacheFamily("test_family", 10)
+        cache = family.new_cache()
+        cache.put("a", 1)
+        del cache
+        gc.collect()
+        assert family.stats().size == 0
+
+    def test_max_size_applies_to_each_cache(self):
+        family = LruCacheFamily("test_family", 3)
+        cache = family.new_cache()
+        for key in "abc":
+            cache.put(key, key)
+        family.max_size = 1
+        assert len(cache) == 1
+        assert family.new_cache().max_size == 1
+        with pytest.raises(ValueError):
+            family.max_size = 0
+
+    def test_clear(self):
+        family = LruCacheFamily("test_family", 3)
+        cache = family.new_cache()
+        cache.put("a", 1)
+        cache.get("a")
+        caching.clear_caches()
+        assert len(cache) == 0
+        assert family.stats() == CacheStats(0, 3, 0, 0, 0, 0)
@@ -1,11 +1,17 @@
 import unittest
 
-from neoscore.core import paper
+from neoscore.core import neoscore, paper
 from neoscore.core.document import _PAGE_DISPLAY_GAP, Document  # noqa
+from neoscore.core.flowable import Flowable
 from neoscore.core.paper import Paper
 from neoscore.core.point import ORIGIN, Point
+from neoscore.core.positioned_object import PositionedObject
+from neoscore.core.rect import Rect
+from neoscore.core.text import Text
 from neoscore.core.units import ZERO, Mm
 
+from ..helpers import AppTest
+
 
 class TestDocument(unittest.TestCase):
     def test_init_with_explicit_paper(self):
@@ -22,3 +28,117 @@ class TestDocument(unittest.TestCase):
         assert test_doc.page_origin(2) == Point(
             (paper.A4.width + _PAGE_DISPLAY_GAP) * 2, ZERO
         )
+
+
+class TestDocumentWalk(AppTest):
+    def test_walk(self):
+        root = PositionedObject(ORIGIN, None)
+        child_1 = PositionedObject(ORIGIN, root)
+        subchild_1 = PositionedObject(ORIGIN, child_1)
+        child_2 = PositionedObject(ORIGIN, root)
+        other_page_obj = PositionedObject(ORIGIN, neoscore.document.pages[1])
+        visits = []
+        neoscore.document.walk(
+            pre=lambda obj: visits.append(("pre", obj)),
+            post=lambda obj: visits.append(("post", obj)),
+        )
+        assert visits == [
+            ("pre", root),
+            ("pre", child_1),
+            ("pre", subchild_1),
+            ("post", subchild_1),
+            ("post", child_1),
+            ("pre", child_2),
+            ("post", child_2),
+            ("post", root),
+            ("pre", other_page_obj),
+            ("post", other_page_obj),
+        ]
+
+    def test_walk_post_order_matches_descendants(self):
+        root = PositionedObject(ORIGIN, None)
+        for i in range(3):
+            child = PositionedObject(ORIGIN, root)
+            PositionedObject(ORIGIN, child)
+        visits = []
+        neoscore.document.walk(post=visits.append)
+        assert visits == list(neoscore.document.pages[0].descendants)
+
+    def test_walk_visits_objects_added_during_walk(self):
+        root = PositionedObject(ORIGIN, None)
+        added = []
+
+        def add_child(obj):
+            if obj is root:
+                added.append(PositionedObject(ORIGIN, root))
+
+        visits = []
+        neoscore.document.walk(pre=add_child, post=visits.append)
+        assert visits == [added[0], root]
+
+
+class TestDocumentCulling(AppTest):
+    def test_page_visibility_without_cull_rect(self):
+        neoscore.document._set_cull_rect(None)
+        assert neoscore.document._is_page_visible_at(Mm(100000).base_value)
+        assert neoscore.document._is_visible(Rect(Mm(-1000), ZERO, Mm(1), Mm(1)))
+
+    def test_page_visibility_with_cull_rect(self):
+        doc = neoscore.document
+        pages = [doc.pages[i] for i in range(3)]
+        doc._set_cull_rect(Rect(ZERO, ZERO, Mm(10), Mm(10)))
+        assert doc._visible_page_indices == {0}
+        assert doc._is_page_visible_at(pages[0].x.base_value)
+        assert not doc._is_page_visible_at(pages[1].x.base_value)
+        assert not doc._is_page_visible_at(pages[2].x.base_value)
+        # Positions beyond the document's pages are never culled
+        assert doc._is_page_visible_at(Mm(-10000).base_value)
+        assert doc._is_page_visible_at((pages[2].x + Mm(10000)).base_value)
+
+    def test_render_with_cull_rect_skips_invisible_pages(self):
+        visible = Text(ORIGIN, neoscore.document.pages[0], "visible")
+        culled = Text(ORIGIN, neoscore.document.pages[2], "culled")
+        neoscore.document.render(
+            False, neoscore.background_brush, Rect(ZERO, ZERO, Mm(10), Mm(10))
+        )
+        assert visible.interfaces
+        assert visible._interface_for_children is not None
+        assert not culled.interfaces
+        assert culled._interface_for_children is None
+
+    def test_render_with_cull_rect_creates_culled_parent_interface_when_needed(self):
+        pages = neoscore.document.pages
+        culled_parent = Text(ORIGIN, pages[2], "culled")
+        visible_child = Text(
+            (pages[0].x - pages[2].x, ZERO), culled_parent, "visible child"
+        )
+        neoscore.document.render(
+            False, neoscore.background_brush, Rect(ZERO, ZERO, Mm(10), Mm(10))
+        )
+        assert not culled_parent.interfaces
+        assert visible_child.interfaces
+        assert culled_parent._interface_for_children is not None
+        assert (
+            visible_child.interfaces[0].parent is culled_parent._interface_for_children
+        )
+
+    def test_render_with_cull_rect_skips_invisible_flowable_lines(self):
+        flowable = Flowable(ORIGIN, None, Mm(5000), Mm(30))
+        visible = Text(ORIGIN, flowable, "visible")
+        culled = Text((Mm(4900), ZERO), flowable, "culled")
+        neoscore.document.render(
+            False, neoscore.background_brush, Rect(ZERO, ZERO, Mm(100), Mm(10))
+        )
+        assert visible.interfaces
+        assert not culled.interfaces
+        assert flowable.lines[0] is not flowable.lines[-1]
+        assert neoscore.document._is_line_visible(flowable.lines[0])
+        assert not neoscore.document._is_line_visible(flowable.lines[-1])
+
+    def test_render_without_cull_rect_renders_everything(self):
+        neoscore.document.render(
+            False, neoscore.background_brush, Rect(ZERO, ZERO, Mm(10), Mm(10))
+        )
+        culled = Text(ORIGIN, neoscore.document.pages[2], "culled")
+        neoscore.document.render(False, neoscore.background_brush)
+        assert culled.interfaces
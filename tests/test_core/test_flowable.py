@@ -1,7 +1,11 @@
+import gc
+import weakref
+
 from neoscore.core import neoscore
 from neoscore.core.break_hint import BreakHint
 from neoscore.core.flowable import Flowable
 from neoscore.core.layout_controllers import MarginController
+from neoscore.core.line_breakers import GreedyLineBreaker, OptimalLineBreaker
 from neoscore.core.paper import Paper
 from neoscore.core.point import ORIGIN, Point
 from neoscore.core.units import ZERO, Mm
@@ -90,6 +94,114 @@ class TestFlowable(AppTest):
         flowable._generate_lines()
         assert flowable.lines[1].flowable_x == live_width - Mm(19)
 
+    def test_generate_layout_controllers_ignores_break_opportunity_at_line_end(self):
+        live_width = neoscore.document.paper.live_width
+        flowable = Flowable(
+            ORIGIN, None, live_width * 3, Mm(100), break_threshold=Mm(20)
+        )
+        BreakHint((live_width - Mm(10), ZERO), flowable)
+        # Not strictly before the maximum line end, so not taken
+        BreakHint((live_width, ZERO), flowable)
+        BreakHint((live_width * 2 - Mm(15), ZERO), flowable)
+        flowable._generate_lines()
+        assert flowable.lines[1].flowable_x == live_width - Mm(10)
+        assert flowable.lines[2].flowable_x == live_width * 2 - Mm(15)
+
+    def test_generate_layout_controllers_with_many_margin_changes(self):
+        live_width = neoscore.document.paper.live_width
+        flowable = Flowable(ORIGIN, None, live_width * 5, Mm(20))
+        for i in range(10):
+            flowable.add_margin_controller(MarginController(Mm(i * 100), Mm(i)))
+        flowable._generate_lines()
+        for line in flowable.lines[1:]:
+            assert line.x == Mm(int(line.flowable_x / Mm(100)))
+
+    def test_default_line_breaker(self):
+        flowable = Flowable(ORIGIN, None, Mm(100), Mm(100))
+        assert isinstance(flowable.line_breaker, GreedyLineBreaker)
+
+    def test_generate_layout_controllers_with_optimal_line_breaker(self):
+        flowable = Flowable(
+            ORIGIN,
+            None,
+            Mm(400),
+            Mm(50),
+            break_threshold=Mm(160),
+            line_breaker=OptimalLineBreaker(),
+        )
+        for x in [128, 152, 248]:
+            BreakHint((Mm(x), ZERO), flowable)
+        flowable._generate_lines()
+        assert [line.flowable_x for line in flowable.lines] == [
+            ZERO,
+            Mm(128),
+            Mm(248),
+        ]
+        flowable.line_breaker = GreedyLineBreaker()
+        flowable._generate_lines()
+        assert [line.flowable_x for line in flowable.lines] == [
+            ZERO,
+            Mm(152),
+            Mm(248),
+        ]
+
+    def test_generate_lines_reuses_unchanged_layout(self):
+        live_width = neoscore.document.paper.live_width
+        flowable = Flowable(ORIGIN, None, live_width * 3, Mm(50))
+        BreakHint((live_width - Mm(2), ZERO), flowable)
+        flowable._generate_lines()
+        lines = flowable.lines
+        hits = neoscore.cache_stats()["flowable_layouts"].hits
+        flowable._generate_lines()
+        assert flowable.lines is lines
+        assert neoscore.cache_stats()["flowable_layouts"].hits == hits + 1
+
+    def test_layout_cache_freed_with_flowable(self):
+        flowable = Flowable(ORIGIN, None, Mm(500), Mm(50))
+        flowable._generate_lines()
+        assert neoscore.cache_stats()["flowable_layouts"].size == 1
+        flowable_ref = weakref.ref(flowable)
+        for line in flowable.lines:
+            line.remove()
+        flowable.remove()
+        del flowable
+        gc.collect()
+        assert flowable_ref() is None
+        assert neoscore.cache_stats()["flowable_layouts"].size == 0
+
+    def test_generate_lines_regenerates_changed_layout(self):
+        live_width = neoscore.document.paper.live_width
+        flowable = Flowable(ORIGIN, None, live_width * 3, Mm(50))
+        hint = BreakHint((live_width - Mm(2), ZERO), flowable)
+        flowable._generate_lines()
+        lines = flowable.lines
+        hint.x = live_width - Mm(3)
+        flowable._generate_lines()
+        assert flowable.lines is not lines
+        assert flowable.lines[1].flowable_x == live_width - Mm(3)
+        flowable.height = Mm(60)
+        flowable._generate_lines()
+        assert flowable.lines[0].height == Mm(60)
+        flowable.add_margin_controller(MarginController(ZERO, Mm(5)))
+        flowable._generate_lines()
+        assert flowable.lines[0].x == Mm(5)
+
+    def test_generate_lines_restores_previous_layout(self):
+        live_width = neoscore.document.paper.live_width
+        flowable = Flowable(ORIGIN, None, live_width * 3, Mm(50))
+        hint = BreakHint((live_width - Mm(2), ZERO), flowable)
+        flowable._generate_lines()
+        first_lines = flowable.lines
+        hint.x = live_width - Mm(3)
+        flowable._generate_lines()
+        second_lines = flowable.lines
+        hint.x = live_width - Mm(2)
+        flowable._generate_lines()
+        assert flowable.lines is first_lines
+        page = neoscore.document.pages[0]
+        assert all(line in page.children for line in first_lines)
+        assert not any(line in page.children for line in second_lines)
+
     def test_generate_layout_controllers_with_margin_controllers(self):
         live_width = neoscore.document.paper.live_width
         flowable = Flowable((Mm(10), ZERO), None, live_width * 3, Mm(50))
@@ -135,6 +247,25 @@ class TestFlowable(AppTest):
         assert flowable.last_break_at(Mm(140)) == flowable.lines[0]
         assert flowable.last_break_at(Mm(180)) == flowable.lines[1]
 
+    def test_last_break_index_at_line_boundaries(self):
+        flowable = Flowable((Mm(10), Mm(0)), None, Mm(1000), Mm(90), Mm(5))
+        flowable._generate_lines()
+        line_1_start = flowable.lines[1].flowable_x
+        assert flowable.last_break_index_at(Mm(-10)) == 0
+        assert flowable.last_break_index_at(ZERO) == 0
+        # Positions exactly at a line end belong to that line
+        assert flowable.last_break_index_at(line_1_start) == 0
+        assert flowable.last_break_index_at(line_1_start + Mm(0.001)) == 1
+        assert flowable.last_break_index_at(flowable.lines[-1].flowable_x) == (
+            len(flowable.lines) - 2
+        )
+
+    def test_last_break_index_at_after_replacing_lines(self):
+        flowable = Flowable((Mm(10), Mm(0)), None, Mm(1000), Mm(90), Mm(5))
+        flowable._generate_lines()
+        flowable.lines = flowable.lines[:2]
+        assert flowable.last_break_index_at(Mm(10000)) == 1
+
     def test_last_break_at_raises_out_of_bounds_when_needed(self):
         flowable = Flowable((Mm(10), Mm(0)), None, Mm(10000), Mm(90), Mm(5))
         flowable._generate_lines()
@@ -0,0 +1,102 @@
+import unittest
+
+from neoscore.core.line_breakers import GreedyLineBreaker, OptimalLineBreaker
+from neoscore.core.units import ZERO, Unit
+
+
+def constant_max_length(value):
+    return lambda flowable_x: Unit(value)
+
+
+def line_specs(lines):
+    return [(start.base_value, length.base_value) for start, length in lines]
+
+
+class TestGreedyLineBreaker(unittest.TestCase):
+    def test_without_break_opportunities(self):
+        lines = GreedyLineBreaker().break_lines(
+            Unit(250), [], Unit(10), constant_max_length(100)
+        )
+        assert line_specs(lines) == [(0, 100), (100, 100), (200, 100)]
+
+    def test_takes_last_break_opportunity_in_threshold(self):
+        lines = GreedyLineBreaker().break_lines(
+            Unit(250),
+            [Unit(80), Unit(95), Unit(155)],
+            Unit(100),
+            constant_max_length(100),
+        )
+        assert line_specs(lines) == [(0, 95), (95, 60), (155, 100)]
+
+
+class TestOptimalLineBreaker(unittest.TestCase):
+    def test_without_break_opportunities(self):
+        lines = OptimalLineBreaker().break_lines(
+            Unit(250), [], Unit(10), constant_max_length(100)
+        )
+        assert line_specs(lines) == [(0, 100), (100, 100), (200, 100)]
+
+    def test_single_line(self):
+        lines = OptimalLineBreaker().break_lines(
+            Unit(50), [Unit(20)], Unit(100), constant_max_length(100)
+        )
+        assert line_specs(lines) == [(0, 100)]
+
+    def test_minimizes_total_demerits(self):
+        lines = OptimalLineBreaker().break_lines(
+            Unit(250),
+            [Unit(80), Unit(95), Unit(155)],
+            Unit(100),
+            constant_max_length(100),
+        )
+        # Greedy would take 95 and leave a badly filled second line
+        assert line_specs(lines) == [(0, 80), (80, 75), (155, 100)]
+
+    def test_respects_break_threshold(self):
+        lines = OptimalLineBreaker().break_lines(
+            Unit(250),
+            [Unit(80), Unit(95), Unit(155)],
+            Unit(10),
+            constant_max_length(100),
+        )
+        assert line_specs(lines) == [(0, 95), (95, 100), (195, 100)]
+
+    def test_ignores_break_opportunities_past_flowable_end(self):
+        lines = OptimalLineBreaker().break_lines(
+            Unit(150), [Unit(95), Unit(180)], Unit(100), constant_max_length(100)
+        )
+        assert line_specs(lines) == [(0, 95), (95, 100)]
+
+    def test_varying_max_line_length(self):
+        queried = []
+
+        def max_length(flowable_x):
+            queried.append(flowable_x)
+            return Unit(50) if flowable_x == ZERO else Unit(100)
+
+        lines = OptimalLineBreaker().break_lines(
+            Unit(200), [Unit(45), Unit(140)], Unit(20), max_length
+        )
+        assert line_specs(lines) == [(0, 45), (45, 95), (140, 100)]
+        assert queried == sorted(queried)
+
+    def test_line_penalty_favors_fewer_lines(self):
+        opps = [Unit(x) for x in [30, 60, 90, 120, 150, 180]]
+        loose = OptimalLineBreaker(line_penalty=0).break_lines(
+            Unit(200), opps, Unit(100), constant_max_length(100)
+        )
+        tight = OptimalLineBreaker(line_penalty=1000).break_lines(
+            Unit(200), opps, Unit(100), constant_max_length(100)
+        )
+        assert len(tight) <= len(loose)
+        assert line_specs(tight) == [(0, 90), (90, 90), (180, 100)]
+
+    def test_long_flowable(self):
+        opps = [Unit(x * 7.3) for x in range(1, 20000)]
+        lines = OptimalLineBreaker().break_lines(
+            Unit(7.3 * 20000), opps, Unit(30), constant_max_length(100)
+        )
+        for (start, length), (next_start, _) in zip(lines, lines[1:]):
+            assert start + length == next_start
+            assert length <= Unit(100)
+        assert lines[-1][0] + lines[-1][1] > Unit(7.3 * 20000)
@@ -0,0 +1,63 @@
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+import pytest
+
+from neoscore.core import env, metadata_cache
+
+
+class TestMetadataCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.temp_dir.name)
+        self.cache_dir = self.dir / "cache"
+        self.json_path = self.dir / "metadata.json"
+        self.json_path.write_text(json.dumps({"a": [1, 2.5, "x"], "b": None}))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_load_json_creates_cache_entry(self):
+        data = metadata_cache.load_json(self.json_path, self.cache_dir)
+        assert data == {"a": [1, 2.5, "x"], "b": None}
+        assert len(list(self.cache_dir.glob("*.marshal"))) == 1
+
+    def test_load_json_reuses_cache_entry(self):
+        metadata_cache.load_json(self.json_path, self.cache_dir)
+        with mock.patch("json.loads") as loads:
+            data = metadata_cache.load_json(self.json_path, self.cache_dir)
+        loads.assert_not_called()
+        assert data == {"a": [1, 2.5, "x"], "b": None}
+
+    def test_changed_file_is_not_read_stale(self):
+        metadata_cache.load_json(self.json_path, self.cache_dir)
+        self.json_path.write_text(json.dumps({"c": 3}))
+        assert metadata_cache.load_json(self.json_path, self.cache_dir) == {"c": 3}
+        assert len(list(self.cache_dir.glob("*.marshal"))) == 2
+
+    def test_corrupt_cache_entry_falls_back_to_json(self):
+        metadata_cache.load_json(self.json_path, self.cache_dir)
+        (cache_path,) = self.cache_dir.glob("*.marshal")
+        cache_path.write_bytes(b"\xff\x00garbage")
+        data = metadata_cache.load_json(self.json_path, self.cache_dir)
+        assert data == {"a": [1, 2.5, "x"], "b": None}
+
+    def test_missing_file_raises(self):
+        with pytest.raises(FileNotFoundError):
+            metadata_cache.load_json(self.dir / "missing.json", self.cache_dir)
+
+    def test_invalid_json_raises(self):
+        self.json_path.write_text("{")
+        with pytest.raises(json.JSONDecodeError):
+            metadata_cache.load_json(self.json_path, self.cache_dir)
+
+    def test_empty_cache_dir_env_disables_cache(self):
+        with mock.patch.object(env, "CACHE_DIR", ""):
+            assert metadata_cache.default_cache_dir() is None
+
+    def test_cache_dir_env_overrides_default(self):
+        with mock.patch.object(env, "CACHE_DIR", str(self.cache_dir)):
+            assert metadata_cache.default_cache_dir() == self.cache_dir
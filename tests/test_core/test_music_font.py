@@ -111,3 +111,26 @@ class TestMusicFont(AppTest):
             "cutOutSE": Point(Unit(0.84), Unit(0.596)),
             "cutOutSW": Point(Unit(0.144), Unit(0.896)),
         }
+
+    def test_glyph_info_shared_between_fonts_of_same_size(self):
+        font_1 = MusicFont("Bravura", Mm(2))
+        font_2 = MusicFont("Bravura", Mm(2))
+        assert font_1.glyph_info("noteheadBlack") is font_2.glyph_info("noteheadBlack")
+        assert font_1.engraving_defaults is font_2.engraving_defaults
+
+    def test_glyph_info_scaled_per_font_size(self):
+        small_info = MusicFont("Bravura", Mm(1)).glyph_info("noteheadBlack")
+        large_info = MusicFont("Bravura", Mm(2)).glyph_info("noteheadBlack")
+        assert small_info is not large_info
+        assert large_info.advance_width == small_info.advance_width * 2
+        assert large_info.bounding_rect.width == small_info.bounding_rect.width * 2
+        assert (
+            MusicFont("Bravura", Mm(2)).engraving_defaults["stemThickness"]
+            == MusicFont("Bravura", Mm(1)).engraving_defaults["stemThickness"] * 2
+        )
+
+    def test_metadata_not_mutated_by_glyph_lookups(self):
+        bbox = self.font.metadata["glyphBBoxes"]["noteheadBlack"]
+        original = {key: list(value) for key, value in bbox.items()}
+        MusicFont("Bravura", Mm(3)).glyph_info("noteheadBlack")
+        assert bbox == original
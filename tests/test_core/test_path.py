@@ -6,7 +6,7 @@ from neoscore.core.brush import Brush
 from neoscore.core.path import Path
 from neoscore.core.path_element import ControlPoint, CurveTo, LineTo, MoveTo
 from neoscore.core.pen import Pen
-from neoscore.core.point import ORIGIN, Point
+from neoscore.core.point import ORIGIN, Point, PointArray
 from neoscore.core.positioned_object import PositionedObject
 from neoscore.core.units import ZERO, Mm, Unit
 from neoscore.interface.path_interface import (
@@ -15,7 +15,7 @@ from neoscore.interface.path_interface import (
     ResolvedMoveTo,
 )
 
-from ..helpers import AppTest, assert_path_els_equal
+from ..helpers import AppTest, assert_path_els_equal, requires_numpy
 
 
 class TestPath(AppTest):
@@ -87,6 +87,22 @@ class TestPath(AppTest):
             ResolvedLineTo(Unit(10), Unit(12)),
         ]
 
+    def test_lines_to(self):
+        path = Path((Unit(5), Unit(6)), None)
+        parent = PositionedObject((Unit(100), Unit(50)), None)
+        path.lines_to([(Unit(1), Unit(2)), Point(Unit(3), Unit(4))], parent)
+        assert len(path.elements) == 3
+        assert_path_els_equal(path.elements[0], MoveTo(ORIGIN, path))
+        assert_path_els_equal(path.elements[1], LineTo(Point(Unit(1), Unit(2)), parent))
+        assert_path_els_equal(path.elements[2], LineTo(Point(Unit(3), Unit(4)), parent))
+
+    @requires_numpy
+    def test_lines_to_with_point_array(self):
+        path = Path((Unit(5), Unit(6)), None)
+        path.lines_to(PointArray([(1, 2), (3, 4)], Mm) * 2)
+        assert_path_els_equal(path.elements[1], LineTo(Point(Mm(2), Mm(4)), path))
+        assert_path_els_equal(path.elements[2], LineTo(Point(Mm(6), Mm(8)), path))
+
     def test_line_to_with_parent(self):
         path = Path((Unit(5), Unit(6)), None)
         parent = PositionedObject((Unit(100), Unit(50)), None)
@@ -98,6 +114,17 @@ class TestPath(AppTest):
             ResolvedLineTo(Unit(100 + 1 - 5), Unit(50 + 3 - 6)),
         ]
 
+    def test_clear_elements(self):
+        path = Path(ORIGIN, None)
+        parent = PositionedObject((Unit(100), Unit(50)), None)
+        path.line_to(Unit(1), Unit(3), parent)
+        path.cubic_to(Unit(1), Unit(2), Unit(3), Unit(4), Unit(5), Unit(6), parent)
+        assert path in parent._position_dependents
+        path._clear_elements()
+        assert path.elements == []
+        assert parent.children == []
+        assert path not in parent._position_dependents
+
     def test_cubic_to_with_no_parents(self):
         path = Path((Unit(5), Unit(6)), None)
         path.cubic_to(Unit(10), Unit(11), ZERO, Unit(1), Unit(5), Unit(6))
@@ -0,0 +1,98 @@
+import io
+import re
+import struct
+import unittest
+import zlib
+
+import pytest
+
+from neoscore.core.pdf_writer import StreamingPdfWriter
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    crc = zlib.crc32(chunk_type + data)
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def _make_png(width: int, height: int, color_type: int = 2) -> bytes:
+    channels = 3 if color_type == 2 else 1
+    rows = b"".join(b"\x00" + b"\x80" * width * channels for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(
+            b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+        )
+        + _png_chunk(b"IDAT", zlib.compress(rows))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+class TestStreamingPdfWriter(unittest.TestCase):
+    def test_writes_pages_in_order(self):
+        out = io.BytesIO()
+        with StreamingPdfWriter(out) as writer:
+            writer.add_png_page(_make_png(144, 72), 72)
+            writer.add_png_page(_make_png(10, 20, 0), 144)
+            assert writer.page_count == 2
+        data = out.getvalue()
+        assert data.startswith(b"%PDF-1.4")
+        assert data.endswith(b"%%EOF\n")
+        assert b"/MediaBox [0 0 144.0000 72.0000]" in data
+        assert b"/MediaBox [0 0 5.0000 10.0000]" in data
+        assert data.index(b"/DeviceRGB") < data.index(b"/DeviceGray")
+        assert b"/Count 2" in data
+
+    def test_image_data_is_copied_from_png(self):
+        png = _make_png(3, 3)
+        out = io.BytesIO()
+        with StreamingPdfWriter(out) as writer:
+            writer.add_png_page(png, 72)
+        idat_length = struct.unpack(">I", png[33:37])[0]
+        assert png[41 : 41 + idat_length] in out.getvalue()
+
+    def test_xref_offsets_point_to_objects(self):
+        out = io.BytesIO()
+        with StreamingPdfWriter(out) as writer:
+            writer.add_png_page(_make_png(4, 4), 72)
+        data = out.getvalue()
+        xref_offset = int(re.search(rb"startxref\n(\d+)", data).group(1))
+        assert data[xref_offset:].startswith(b"xref\n0 6\n")
+        entries = re.findall(rb"(\d{10}) 00000 n ", data[xref_offset:])
+        assert len(entries) == 5
+        for number, offset in enumerate(entries, 1):
+            assert data[int(offset) :].startswith(f"{number} 0 obj".encode())
+
+    def test_close_is_idempotent(self):
+        out = io.BytesIO()
+        writer = StreamingPdfWriter(out)
+        writer.close()
+        length = len(out.getvalue())
+        writer.close()
+        assert len(out.getvalue()) == length
+        with pytest.raises(ValueError):
+            writer.add_png_page(_make_png(1, 1), 72)
+
+    def test_context_manager_closes_on_success(self):
+        out = io.BytesIO()
+        with StreamingPdfWriter(out) as writer:
+            writer.add_png_page(_make_png(1, 1), 72)
+        assert out.getvalue().endswith(b"%%EOF\n")
+
+    def test_context_manager_does_not_close_on_exception(self):
+        out = io.BytesIO()
+        with pytest.raises(RuntimeError):
+            with StreamingPdfWriter(out) as writer:
+                writer.add_png_page(_make_png(1, 1), 72)
+                raise RuntimeError
+        data = out.getvalue()
+        assert b"%%EOF" not in data
+        assert b"xref" not in data
+        with pytest.raises(ValueError):
+            writer.add_png_page(_make_png(1, 1), 72)
+
+    def test_unsupported_png_raises(self):
+        writer = StreamingPdfWriter(io.BytesIO())
+        with pytest.raises(ValueError):
+            writer.add_png_page(b"not a png", 72)
+        with pytest.raises(ValueError):
+            writer.add_png_page(_make_png(1, 1, color_type=6), 72)
@@ -2,8 +2,10 @@ import unittest
 
 import pytest
 
-from neoscore.core.point import Point
-from neoscore.core.units import Mm, Unit
+from neoscore.core.point import Point, PointArray
+from neoscore.core.units import Inch, Mm, Unit, UnitArray
+
+from ..helpers import requires_numpy
 
 
 class TestPoint(unittest.TestCase):
@@ -44,3 +46,67 @@ class TestPoint(unittest.TestCase):
 
     def test__neg__(self):
         assert -Point(Unit(1), Unit(-2)) == Point(Unit(-1), Unit(2))
+
+
+@requires_numpy
+class TestPointArray(unittest.TestCase):
+    def test_init_from_point_defs(self):
+        array = PointArray([Point(Mm(1), Mm(2)), (3, Inch(1))], Mm)
+        assert array.to_list() == [
+            Point(Mm(1), Mm(2)),
+            Point(Mm(3), Mm(Inch(1))),
+        ]
+        assert array.base_values.shape == (2, 2)
+
+    def test_init_from_numpy_array(self):
+        import numpy
+
+        array = PointArray(numpy.array([[1, 2], [3, 4]]), Inch)
+        assert array[1] == Point(Inch(3), Inch(4))
+
+    def test_init_empty(self):
+        assert len(PointArray([])) == 0
+
+    def test_from_xy(self):
+        array = PointArray.from_xy(UnitArray([1, 2], Mm), UnitArray([3, 4], Mm))
+        assert array.unit == Mm
+        assert array.to_list() == [Point(Mm(1), Mm(3)), Point(Mm(2), Mm(4))]
+
+    def test_x_and_y(self):
+        array = PointArray([(1, 2), (3, 4)], Mm)
+        assert array.x.to_list() == [Mm(1), Mm(3)]
+        assert array.y.to_list() == [Mm(2), Mm(4)]
+
+    def test_indexing(self):
+        array = PointArray([(1, 2), (3, 4), (5, 6)], Mm)
+        assert array[0] == Point(Mm(1), Mm(2))
+        assert type(array[0].x) == Mm
+        assert array[1:].to_list() == [Point(Mm(3), Mm(4)), Point(Mm(5), Mm(6))]
+
+    def test_repr(self):
+        assert repr(PointArray([(1, 2)], Mm)) == "PointArray([(1.0, 2.0)], Mm)"
+
+    def test_add_and_sub(self):
+        array = PointArray([(1, 2), (3, 4)], Mm)
+        assert (array + Point(Mm(1), Mm(1))).to_list() == [
+            Point(Mm(2), Mm(3)),
+            Point(Mm(4), Mm(5)),
+        ]
+        assert (array + (Mm(1), Mm(1)))[0] == Point(Mm(2), Mm(3))
+        assert (array - array)[1] == Point(Mm(0), Mm(0))
+        with pytest.raises(TypeError):
+            array + 1
+
+    def test_mul(self):
+        import numpy
+
+        array = PointArray([(1, 2), (3, 4)], Mm)
+        assert (array * 2)[1] == Point(Mm(6), Mm(8))
+        assert (array * numpy.array([1, 2]))[1] == Point(Mm(6), Mm(8))
+        with pytest.raises(TypeError):
+            array * Mm(2)
+
+    def test_neg_and_abs(self):
+        array = PointArray([(-1, 2)], Mm)
+        assert (-array)[0] == Point(Mm(1), Mm(-2))
+        assert abs(array)[0] == Point(Mm(1), Mm(2))
@@ -1,11 +1,15 @@
+import pytest
+
 from neoscore.core import neoscore
+from neoscore.core.document import Document
 from neoscore.core.flowable import Flowable
 from neoscore.core.paper import Paper
 from neoscore.core.point import ORIGIN, Point
 from neoscore.core.positioned_object import PositionedObject
+from neoscore.core.text import Text
 from neoscore.core.units import ZERO, Mm, Unit
 
-from ..helpers import AppTest, assert_almost_equal
+from ..helpers import AppTest, assert_almost_equal, requires_numpy
 
 
 class TestPositionedObject(AppTest):
@@ -61,6 +65,22 @@ class TestPositionedObject(AppTest):
             subsubchild_1,
         } == descendants_set
 
+    def test_descendants_order(self):
+        root = PositionedObject(ORIGIN, None)
+        child_1 = PositionedObject(ORIGIN, root)
+        subchild_1 = PositionedObject(ORIGIN, child_1)
+        child_2 = PositionedObject(ORIGIN, root)
+        assert list(root.descendants) == [subchild_1, child_1, child_2]
+
+    def test_descendants_of_deep_tree(self):
+        root = PositionedObject(ORIGIN, None)
+        parent = root
+        for i in range(5000):
+            parent = PositionedObject(ORIGIN, parent)
+        descendants = list(root.descendants)
+        assert len(descendants) == 5000
+        assert descendants[0] is parent
+
     def test_descendants_of_class_or_subclass(self):
         # Use two new mock classes for type filter testing
         class MockDifferentClass1(PositionedObject):
@@ -121,6 +141,68 @@ class TestPositionedObject(AppTest):
         # Assert descendants content
         assert {child_2} == descendants_set
 
+    def test_descendant_lookups_follow_tree_changes(self):
+        class MockDifferentClass(PositionedObject):
+            test_attr = 1
+
+        root = PositionedObject(ORIGIN, None)
+        other_root = PositionedObject(ORIGIN, None)
+        child = PositionedObject(ORIGIN, root)
+        subchild = MockDifferentClass(ORIGIN, child)
+        assert list(root._descendants_with_class_attribute("test_attr")) == [subchild]
+        assert list(other_root._descendants_with_class_attribute("test_attr")) == []
+        child.parent = other_root
+        assert list(root._descendants_with_class_attribute("test_attr")) == []
+        assert list(root.descendants_of_exact_class(MockDifferentClass)) == []
+        assert list(other_root.descendants_of_exact_class(MockDifferentClass)) == [
+            subchild
+        ]
+        assert list(
+            neoscore.document.pages[0].descendants_of_exact_class(MockDifferentClass)
+        ) == [subchild]
+        child.remove()
+        assert list(other_root.descendants_of_class_or_subclass(PositionedObject)) == []
+        assert (
+            list(
+                neoscore.document.pages[0].descendants_of_exact_class(
+                    MockDifferentClass
+                )
+            )
+            == []
+        )
+        other_root._register_child(child)
+        assert list(
+            other_root.descendants_of_class_or_subclass(MockDifferentClass)
+        ) == [subchild]
+
+    def test_descendant_lookups_only_search_own_subtree(self):
+        class MockDifferentClass(PositionedObject):
+            test_attr = 1
+
+        root = PositionedObject(ORIGIN, None)
+        other_root = PositionedObject(ORIGIN, None)
+        child = MockDifferentClass(ORIGIN, root)
+        MockDifferentClass(ORIGIN, other_root)
+        assert list(root.descendants_of_exact_class(MockDifferentClass)) == [child]
+        assert list(root._descendants_with_class_attribute("test_attr")) == [child]
+
+    def test_descendant_lookups_in_detached_subtree(self):
+        class MockDifferentClass(PositionedObject):
+            test_attr = 1
+
+        root = PositionedObject(ORIGIN, None)
+        root.remove()
+        child = MockDifferentClass(ORIGIN, root)
+        assert list(root.descendants_with_attribute("test_attr")) == [child]
+        assert list(root._descendants_with_class_attribute("test_attr")) == [child]
+        assert list(root.descendants_of_exact_class(MockDifferentClass)) == [child]
+
+    def test_descendants_with_attribute_matches_instance_attributes(self):
+        root = PositionedObject(ORIGIN, None)
+        child = PositionedObject(ORIGIN, root)
+        child.my_marker = True
+        assert list(root.descendants_with_attribute("my_marker")) == [child]
+
     def test_ancestors(self):
         root = PositionedObject(ORIGIN, None)
         child_1 = PositionedObject(ORIGIN, root)
@@ -160,6 +242,27 @@ class TestPositionedObject(AppTest):
         )
         assert_almost_equal(relative_pos, expected)
 
+    @requires_numpy
+    def test_map_to_all(self):
+        source = PositionedObject((Unit(5), Unit(6)), neoscore.document.pages[1])
+        destinations = [
+            PositionedObject((Unit(99), Unit(90)), neoscore.document.pages[4]),
+            PositionedObject((Unit(1), Unit(2)), source),
+            source,
+        ]
+        relative_positions = source.map_to_all(destinations)
+        assert len(relative_positions) == 3
+        for relative_pos, destination in zip(relative_positions, destinations):
+            assert_almost_equal(relative_pos, source.map_to(destination))
+
+    @requires_numpy
+    def test_map_to_all_without_common_ancestor(self):
+        source = PositionedObject(ORIGIN, None)
+        other_document = Document(neoscore.document.paper)
+        detached = PositionedObject(ORIGIN, other_document.pages[0])
+        with pytest.raises(ValueError):
+            source.map_to_all([detached])
+
     def test_map_to_with_same_source_and_dest(self):
         obj = PositionedObject((Unit(5), Unit(6)), neoscore.document.pages[0])
         assert_almost_equal(obj.map_to(obj), Point(Unit(0), Unit(0)))
@@ -210,3 +313,53 @@ class TestPositionedObject(AppTest):
         page_pos = neoscore.document.pages[2].canvas_pos()
         relative_pos = canvas_pos - page_pos
         assert_almost_equal(relative_pos, Point(Mm(5), Mm(6)))
+
+    def test_coordinate_queries_follow_ancestor_moves(self):
+        grandparent = PositionedObject((Mm(1), Mm(2)), None)
+        parent = PositionedObject((Mm(3), Mm(4)), grandparent)
+        child = PositionedObject((Mm(5), Mm(6)), parent)
+        other = PositionedObject((Mm(10), Mm(10)), None)
+        assert_almost_equal(other.map_to(child), Point(Mm(-1), Mm(2)))
+        assert_almost_equal(grandparent.descendant_pos(child), Point(Mm(8), Mm(10)))
+        grandparent.pos = Point(Mm(11), Mm(12))
+        assert_almost_equal(other.map_to(child), Point(Mm(9), Mm(12)))
+        assert_almost_equal(other.map_x_to(child), Mm(9))
+        assert_almost_equal(grandparent.descendant_pos(child), Point(Mm(8), Mm(10)))
+        parent.parent = other
+        assert_almost_equal(other.map_to(child), Point(Mm(8), Mm(10)))
+        assert_almost_equal(other.descendant_pos_x(child), Mm(8))
+        with pytest.raises(ValueError):
+            grandparent.descendant_pos(child)
+        child.x = Mm(15)
+        assert_almost_equal(other.map_x_to(child), Mm(18))
+        page_pos = neoscore.document.pages[0].canvas_pos()
+        assert_almost_equal(child.canvas_pos() - page_pos, Point(Mm(28), Mm(20)))
+
+    def test_map_to_preserves_destination_unit_type(self):
+        parent = PositionedObject((Mm(1), Mm(2)), None)
+        source = PositionedObject((Mm(3), Mm(4)), None)
+        destination = PositionedObject((Mm(5), Mm(6)), parent)
+        assert type(source.map_to(destination).x) == Mm
+        assert type(source.map_x_to(destination)) == Mm
+
+    def test_position_dependents_are_counted(self):
+        anchor = PositionedObject(ORIGIN, None)
+        dependent = PositionedObject(ORIGIN, None)
+        anchor._add_position_dependent(dependent)
+        anchor._add_position_dependent(dependent)
+        anchor._remove_position_dependent(dependent)
+        assert dependent in anchor._position_dependents
+        anchor._remove_position_dependent(dependent)
+        assert dependent not in anchor._position_dependents
+        # Removing an unregistered dependent does nothing
+        anchor._remove_position_dependent(dependent)
+
+    def test_setting_children_updates_class_indexes(self):
+        grandparent = PositionedObject(ORIGIN, None)
+        parent = PositionedObject(ORIGIN, grandparent)
+        removed = Text(ORIGIN, parent, "removed")
+        added = Text(ORIGIN, None, "added")
+        parent.children = [added]
+        assert list(parent.descendants_of_exact_class(Text)) == [added]
+        assert list(grandparent.descendants_of_exact_class(Text)) == [added]
+        assert removed not in grandparent.descendants_of_class_or_subclass(Text)
@@ -0,0 +1,106 @@
+import json
+import time
+import unittest
+
+from neoscore.core import neoscore
+from neoscore.core.flowable import Flowable
+from neoscore.core.point import ORIGIN
+from neoscore.core.render_profiling import (
+    INTERFACE_CREATION,
+    LAYOUT,
+    PHASES,
+    POST_RENDER_HOOK,
+    PRE_RENDER_HOOK,
+    QT_ITEM_CREATION,
+    RenderProfiler,
+    profiler,
+)
+from neoscore.core.text import Text
+from neoscore.core.units import Mm
+
+from ..helpers import AppTest
+
+
+class TestRenderProfiler(unittest.TestCase):
+    def test_disabled_profiler_records_nothing(self):
+        test_profiler = RenderProfiler()
+        with test_profiler.phase(int, LAYOUT):
+            pass
+        assert test_profiler.stats() == {}
+
+    def test_phase_counts_and_times(self):
+        test_profiler = RenderProfiler(True)
+        for _ in range(2):
+            with test_profiler.phase(int, LAYOUT):
+                time.sleep(0.001)
+        stats = test_profiler.stats()
+        assert list(stats) == ["int"]
+        assert stats["int"][LAYOUT].count == 2
+        assert stats["int"][LAYOUT].total_time >= 0.002
+
+    def test_nested_phase_times_are_exclusive(self):
+        test_profiler = RenderProfiler(True)
+        with test_profiler.phase(int, INTERFACE_CREATION):
+            with test_profiler.phase(None, QT_ITEM_CREATION):
+                time.sleep(0.02)
+        stats = test_profiler.stats()["int"]
+        assert stats[QT_ITEM_CREATION].total_time >= 0.02
+        assert stats[INTERFACE_CREATION].total_time < 0.02
+
+    def test_reset(self):
+        test_profiler = RenderProfiler(True)
+        with test_profiler.phase(int, LAYOUT):
+            pass
+        test_profiler.reset()
+        assert test_profiler.stats() == {}
+
+    def test_format_table(self):
+        test_profiler = RenderProfiler(True)
+        with test_profiler.phase(int, LAYOUT):
+            pass
+        with test_profiler.phase(str, LAYOUT):
+            time.sleep(0.001)
+        lines = test_profiler.format_table().splitlines()
+        assert lines[0].split()[:3] == ["class", "total", "ms"]
+        for phase in PHASES:
+            assert phase in lines[0]
+        # Slowest classes come first
+        assert lines[1].startswith("str")
+        assert lines[2].startswith("int")
+
+    def test_to_json(self):
+        test_profiler = RenderProfiler(True)
+        with test_profiler.phase(int, LAYOUT):
+            pass
+        result = json.loads(test_profiler.to_json())
+        assert result["int"][LAYOUT]["count"] == 1
+        assert result["int"][LAYOUT]["total_time"] >= 0
+
+
+class TestDocumentRenderProfiling(AppTest):
+    def setUp(self):
+        super().setUp()
+        profiler.reset()
+        profiler.enabled = True
+
+    def tearDown(self):
+        profiler.enabled = False
+        profiler.reset()
+        super().tearDown()
+
+    def test_render_records_all_phases(self):
+        flowable = Flowable(ORIGIN, None, Mm(500), Mm(20))
+        Text(ORIGIN, flowable, "test")
+        neoscore.document.render(False, neoscore.background_brush)
+        stats = profiler.stats()
+        assert set(stats["Text"]) == {
+            PRE_RENDER_HOOK,
+            LAYOUT,
+            INTERFACE_CREATION,
+            QT_ITEM_CREATION,
+            POST_RENDER_HOOK,
+        }
+        assert stats["Text"][INTERFACE_CREATION].count == 1
+        assert stats["Text"][QT_ITEM_CREATION].count == 1
+        # Flowable line generation counts as layout
+        assert stats["Flowable"][LAYOUT].count == 2
@@ -2,8 +2,8 @@ import unittest
 
 import pytest
 
-from neoscore.core.units import Inch, Mm, Unit, make_unit_class
-from tests.helpers import assert_almost_equal
+from neoscore.core.units import Inch, Mm, Unit, UnitArray, make_unit_class
+from tests.helpers import assert_almost_equal, requires_numpy
 
 MockUnit = make_unit_class("MockUnit", 2)
 
@@ -124,3 +124,77 @@ class TestInch(unittest.TestCase):
     def test_inch_unit_conversion(self):
         assert_almost_equal(Inch(1), Unit(72))
         assert_almost_equal(Inch(2), Unit(144))
+
+
+@requires_numpy
+class TestUnitArray(unittest.TestCase):
+    def test_init_from_numbers_and_units(self):
+        array = UnitArray([1, Mm(2), Inch(1)], Mm)
+        assert array.unit == Mm
+        assert array.to_list() == [Mm(1), Mm(2), Mm(Inch(1))]
+        assert all(type(value) == Mm for value in array)
+
+    def test_init_from_numpy_array(self):
+        import numpy
+
+        array = UnitArray(numpy.array([1, 2]), Inch)
+        assert array.base_values.tolist() == [72, 144]
+
+    def test_conversion_shares_base_values(self):
+        array = UnitArray([1, 2], Inch)
+        converted = UnitArray(array, Mm)
+        assert converted.unit == Mm
+        assert converted.base_values is array.base_values
+        assert converted[0] == Mm(Inch(1))
+
+    def test_immutable(self):
+        array = UnitArray([1, 2])
+        with pytest.raises(ValueError):
+            array.base_values[0] = 5
+
+    def test_indexing(self):
+        array = UnitArray([1, 2, 3], Mm)
+        assert array[1] == Mm(2)
+        assert type(array[1]) == Mm
+        assert array[1:].to_list() == [Mm(2), Mm(3)]
+        assert len(array) == 3
+
+    def test_display_values(self):
+        array = UnitArray([1, 2], Mm)
+        assert array.display_values.tolist() == pytest.approx([1, 2])
+
+    def test_repr(self):
+        assert repr(UnitArray([1, 2.5], Mm)) == "UnitArray([1.0, 2.5], Mm)"
+
+    def test_add_and_sub(self):
+        array = UnitArray([1, 2], Mm)
+        assert (array + Mm(1)).to_list() == [Mm(2), Mm(3)]
+        assert (array - array).to_list() == [Mm(0), Mm(0)]
+        assert (array + UnitArray([1, 1], Inch)).unit == Mm
+        with pytest.raises(TypeError):
+            array + 1
+
+    def test_mul_and_div(self):
+        array = UnitArray([1, 2], Mm)
+        assert (array * 2).to_list() == [Mm(2), Mm(4)]
+        assert (2 * array).to_list() == [Mm(2), Mm(4)]
+        assert (array / 2).to_list() == [Mm(0.5), Mm(1)]
+        assert (array / Mm(2)).tolist() == pytest.approx([0.5, 1])
+        with pytest.raises(TypeError):
+            array * Mm(2)
+
+    def test_neg_and_abs(self):
+        array = UnitArray([-1, 2], Mm)
+        assert (-array).to_list() == [Mm(1), Mm(-2)]
+        assert abs(array).to_list() == [Mm(1), Mm(2)]
+
+    def test_reductions(self):
+        array = UnitArray([3, 1, 2], Mm)
+        assert array.sum() == Mm(6)
+        assert array.min() == Mm(1)
+        assert array.max() == Mm(3)
+        assert type(array.sum()) == Mm
+
+    def test_isclose(self):
+        array = UnitArray([1, 2], Unit)
+        assert array.isclose(Unit(1.0001)).tolist() == [True, False]
@@ -1,6 +1,7 @@
 import random
 
 from neoscore.core import neoscore
+from neoscore.interface.app_interface import AppInterface
 
 from ..helpers import AppTest
 
@@ -13,3 +14,31 @@ class TestAppInterface(AppTest):
             neoscore.app_interface.viewport_scale = set_scale
             got_scale = neoscore.app_interface.viewport_scale
             self.assertAlmostEqual(set_scale, got_scale)
+
+    def test_viewport_lod_threshold(self):
+        app_interface = neoscore.app_interface
+        assert app_interface.viewport_lod_threshold is None
+        assert not app_interface.view.lod_simplification_active()
+        app_interface.viewport_scale = 0.2
+        app_interface.viewport_lod_threshold = 0.35
+        assert app_interface.view.lod_simplification_active()
+        app_interface.viewport_scale = 0.5
+        assert not app_interface.view.lod_simplification_active()
+        app_interface.viewport_lod_threshold = None
+        app_interface.viewport_scale = 0.2
+        assert not app_interface.view.lod_simplification_active()
+
+    def test_deduplicate_svg_paths(self):
+        svg = (
+            b'<svg xmlns="http://www.w3.org/2000/svg"'
+            b' xmlns:xlink="http://www.w3.org/1999/xlink">'
+            b'<g transform="matrix(1,0,0,1,5,5)"><path d="M0,0 L1,1"/></g>'
+            b'<g transform="matrix(1,0,0,1,9,9)"><path d="M0,0 L1,1"/></g>'
+            b'<g><path d="M0,0 L2,2"/></g>'
+            b"</svg>"
+        )
+        result = AppInterface._deduplicate_svg_paths(svg).decode()
+        assert result.count('d="M0,0 L1,1"') == 1
+        assert result.count('<use xlink:href="#neoscore-path-0"') == 2
+        # Unique paths are left in place
+        assert '<g><path d="M0,0 L2,2" /></g>' in result
@@ -0,0 +1,66 @@
+from PyQt5.QtGui import QPainterPath
+
+from neoscore.core import neoscore
+from neoscore.core.units import Unit
+from neoscore.interface import glyph_atlas
+from neoscore.interface.font_interface import FontInterface
+
+from ..helpers import AppTest
+
+
+def _add_text_path(text, qt_font) -> QPainterPath:
+    path = QPainterPath()
+    path.addText(0, 0, qt_font, text)
+    return path
+
+
+def _assert_paths_equal(
+    left: QPainterPath, right: QPainterPath, epsilon: float = 0.0001
+):
+    assert left.elementCount() == right.elementCount()
+    for i in range(left.elementCount()):
+        left_element = left.elementAt(i)
+        right_element = right.elementAt(i)
+        assert left_element.type == right_element.type
+        assert abs(left_element.x - right_element.x) < epsilon
+        assert abs(left_element.y - right_element.y) < epsilon
+
+
+class TestGlyphAtlas(AppTest):
+    def setUp(self):
+        super().setUp()
+        neoscore.clear_caches()
+
+    def test_text_path_matches_add_text(self):
+        for family in ["Lora", "Bravura"]:
+            qt_font = FontInterface(family, Unit(12), None, False).qt_object
+            for text in ["Allegro ma non troppo", "fi AV", "\ue050 \ue0a4", ""]:
+                _assert_paths_equal(
+                    glyph_atlas.text_path(text, qt_font),
+                    _add_text_path(text, qt_font),
+                )
+
+    def test_glyph_outlines_are_shared_across_strings(self):
+        qt_font = FontInterface("Lora", Unit(12), None, False).qt_object
+        glyph_atlas.text_path("Allegro", qt_font)
+        stats = neoscore.cache_stats()["glyph_outlines"]
+        # "l" is repeated
+        assert stats.size == 6
+        assert stats.hits == 1
+        glyph_atlas.text_path("Allegro ma", qt_font)
+        stats = neoscore.cache_stats()["glyph_outlines"]
+        assert stats.size == 9
+        assert stats.hits == 1 + 7
+
+    def test_text_path_with_different_size_scales_cached_outlines(self):
+        small_font = FontInterface("Bravura", Unit(12), None, False).qt_object
+        large_font = FontInterface("Bravura", Unit(30), None, False).qt_object
+        # A black notehead
+        glyph_atlas.text_path("\ue0a4", small_font)
+        _assert_paths_equal(
+            glyph_atlas.text_path("\ue0a4", large_font),
+            _add_text_path("\ue0a4", large_font),
+            # Outlines are quantized to 1/64 pixel, so scaled ones differ slightly
+            epsilon=1 / 32,
+        )
+        assert neoscore.cache_stats()["glyph_outlines"].size == 1
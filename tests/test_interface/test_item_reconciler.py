@@ -0,0 +1,128 @@
+from neoscore.core import neoscore
+from neoscore.core.brush_pattern import BrushPattern
+from neoscore.core.color import Color
+from neoscore.core.pen_cap_style import PenCapStyle
+from neoscore.core.pen_join_style import PenJoinStyle
+from neoscore.core.pen_pattern import PenPattern
+from neoscore.core.point import ORIGIN, Point
+from neoscore.core.units import Unit
+from neoscore.interface.brush_interface import BrushInterface
+from neoscore.interface.invisible_object_interface import InvisibleObjectInterface
+from neoscore.interface.path_interface import PathInterface, ResolvedLineTo
+from neoscore.interface.pen_interface import PenInterface
+
+from ..helpers import AppTest
+
+
+class TestItemReconciler(AppTest):
+    def setUp(self):
+        super().setUp()
+        self.reconciler = neoscore.app_interface.item_reconciler
+        self.pen = PenInterface(
+            Color("#000000"),
+            Unit(0),
+            PenPattern.SOLID,
+            PenJoinStyle.BEVEL,
+            PenCapStyle.SQUARE,
+        )
+        self.brush = BrushInterface(Color("#000000"), BrushPattern.SOLID)
+
+    def _path(self, pos, elements, owner, parent=None):
+        self.reconciler.push_owner(owner)
+        interface = PathInterface(
+            pos, parent, 1, 0, ORIGIN, self.brush, self.pen, elements
+        )
+        interface.render()
+        self.reconciler.pop_owner()
+        return interface
+
+    def test_render_outside_frame_is_not_tracked(self):
+        assert self.reconciler.tracking_scene
+        InvisibleObjectInterface(ORIGIN, None, 1, 0, ORIGIN).render()
+        assert not self.reconciler.tracking_scene
+        neoscore.app_interface.clear_scene()
+        assert self.reconciler.tracking_scene
+
+    def test_matching_slot_patches_previous_item(self):
+        owner = object()
+        self.reconciler.begin_frame()
+        first = self._path(ORIGIN, [ResolvedLineTo(Unit(5), Unit(5))], owner)
+        self.reconciler.end_frame()
+        self.reconciler.begin_frame()
+        second = self._path(
+            Point(Unit(10), Unit(20)), [ResolvedLineTo(Unit(50), Unit(5))], owner
+        )
+        self.reconciler.end_frame()
+        assert second._qt_object is first._qt_object
+        assert second._qt_object.pos().x() == 10
+        assert second._qt_object.pos().y() == 20
+        assert second._qt_object.path().boundingRect().width() == 50
+        assert len(neoscore.app_interface.scene.items()) == 1
+
+    def test_unclaimed_items_removed(self):
+        owner_1 = object()
+        owner_2 = object()
+        self.reconciler.begin_frame()
+        first = self._path(ORIGIN, [], owner_1)
+        removed = self._path(ORIGIN, [], owner_2)
+        self.reconciler.end_frame()
+        self.reconciler.begin_frame()
+        second = self._path(ORIGIN, [], owner_1)
+        self.reconciler.end_frame()
+        assert second._qt_object is first._qt_object
+        assert removed._qt_object.scene() is None
+        assert neoscore.app_interface.scene.items() == [second._qt_object]
+
+    def test_different_interface_types_not_reused(self):
+        owner = object()
+        self.reconciler.begin_frame()
+        self.reconciler.push_owner(owner)
+        invisible = InvisibleObjectInterface(ORIGIN, None, 1, 0, ORIGIN)
+        invisible.render()
+        self.reconciler.pop_owner()
+        self.reconciler.end_frame()
+        self.reconciler.begin_frame()
+        path = self._path(ORIGIN, [], owner)
+        self.reconciler.end_frame()
+        assert path._qt_object is not invisible._qt_object
+        assert invisible._qt_object.scene() is None
+
+    def _render_parent(self, owner):
+        self.reconciler.push_owner(owner)
+        parent = InvisibleObjectInterface(ORIGIN, None, 1, 0, ORIGIN)
+        parent.render()
+        self.reconciler.pop_owner()
+        return parent
+
+    def test_reparented_items_reused(self):
+        parent_owner = object()
+        owner = object()
+        self.reconciler.begin_frame()
+        self._render_parent(parent_owner)
+        first = self._path(ORIGIN, [], owner)
+        self.reconciler.end_frame()
+        self.reconciler.begin_frame()
+        parent = self._render_parent(parent_owner)
+        second = self._path(ORIGIN, [], owner, parent)
+        self.reconciler.end_frame()
+        assert second._qt_object is first._qt_object
+        assert second._qt_object.parentItem() is parent._qt_object
+
+    def test_stacking_order_follows_render_order(self):
+        parent_owner = object()
+        owner_1 = object()
+        owner_2 = object()
+        self.reconciler.begin_frame()
+        parent = self._render_parent(parent_owner)
+        self._path(ORIGIN, [], owner_1, parent)
+        self._path(ORIGIN, [], owner_2, parent)
+        self.reconciler.end_frame()
+        self.reconciler.begin_frame()
+        parent = self._render_parent(parent_owner)
+        second = self._path(ORIGIN, [], owner_2, parent)
+        first = self._path(ORIGIN, [], owner_1, parent)
+        self.reconciler.end_frame()
+        assert parent._qt_object.childItems() == [
+            second._qt_object,
+            first._qt_object,
+        ]
@@ -0,0 +1,64 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush, QColor, QPainterPath, QPen
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsScene, QWidget
+
+from neoscore.interface.qt.q_clipping_path import QClippingPath
+from neoscore.interface.qt.viewport import Viewport
+
+from ...helpers import AppTest
+
+
+class _PaintCountingPath(QClippingPath):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.paint_count = 0
+
+    def paint(self, *args, **kwargs):
+        self.paint_count += 1
+        super().paint(*args, **kwargs)
+
+
+class TestViewport(AppTest):
+    def setUp(self):
+        super().setUp()
+        self.scene = QGraphicsScene()
+        self.view = Viewport(self.scene)
+        # OpenGL may be unavailable in test environments
+        self.view.setViewport(QWidget())
+        self.view.resize(400, 400)
+
+    def add_circle(self, diameter: float, x: float) -> _PaintCountingPath:
+        painter_path = QPainterPath()
+        painter_path.addEllipse(0, 0, diameter, diameter)
+        item = _PaintCountingPath(painter_path)
+        item.setBrush(QBrush(QColor("#ff0000")))
+        item.setPen(QPen(Qt.PenStyle.NoPen))
+        item.update_geometry()
+        item.setPos(x, 0)
+        self.scene.addItem(item)
+        return item
+
+    def test_lod_painting_batches_small_paths(self):
+        small_items = [self.add_circle(10, x * 10) for x in range(5)]
+        large_item = self.add_circle(200, 100)
+        self.view.scale(0.2, 0.2)
+        self.view.lod_threshold = 0.35
+        self.view.centerOn(small_items[2])
+        image = self.view.viewport().grab().toImage()
+        assert large_item.paint_count == 1
+        for item in small_items:
+            assert item.paint_count == 0
+            assert not item.flags() & QGraphicsItem.ItemHasNoContents
+        # Small circles are filled to their bounding rect corners
+        corner = self.view.mapFromScene(small_items[0].sceneBoundingRect().topLeft())
+        assert image.pixelColor(corner) == QColor("#ff0000")
+
+    def test_painting_without_lod_paints_every_path(self):
+        small_items = [self.add_circle(10, x * 10) for x in range(5)]
+        self.view.scale(0.2, 0.2)
+        self.view.centerOn(small_items[2])
+        image = self.view.viewport().grab().toImage()
+        for item in small_items:
+            assert item.paint_count == 1
+        corner = self.view.mapFromScene(small_items[0].sceneBoundingRect().topLeft())
+        assert image.pixelColor(corner) != QColor("#ff0000")
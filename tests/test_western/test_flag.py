@@ -30,6 +30,13 @@ class TestFlag(AppTest):
         flag = Flag(ORIGIN, self.staff, Duration(1, 16), DirectionY.UP)
         assert flag.music_chars == [MusicChar(self.staff.music_font, "flag16thUp")]
 
+    def test_setters_update_glyph(self):
+        flag = Flag(ORIGIN, self.staff, Duration(1, 32), DirectionY.DOWN)
+        flag.direction = DirectionY.UP
+        assert flag.music_chars == [MusicChar(self.staff.music_font, "flag32ndUp")]
+        flag.duration = Duration(1, 16)
+        assert flag.music_chars == [MusicChar(self.staff.music_font, "flag16thUp")]
+
     def test_font_override(self):
         font = MusicFont("Bravura", Mm(3))
         flag = Flag(ORIGIN, self.staff, Duration(1, 32), DirectionY.DOWN, font)
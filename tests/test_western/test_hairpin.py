@@ -236,3 +236,29 @@ class TestHairpin(AppTest):
         assert_almost_equal(points[0].y, points[4].x)
         assert points[2] == Point(Unit(-6), Unit(2))
         assert points[3] == self.right_parent
+
+    def test_changing_geometry_redraws_path(self):
+        hairpin = Hairpin(
+            (Unit(0), Unit(0)),
+            self.left_parent,
+            (Unit(10), Unit(0)),
+            self.left_parent,
+            DirectionX.RIGHT,
+            Unit(2),
+        )
+        hairpin.end_pos = (Unit(20), Unit(0))
+        assert [el.pos for el in hairpin.elements] == [
+            Point(Unit(20), Unit(1)),
+            Point(Unit(0), Unit(0)),
+            Point(Unit(20), Unit(-1)),
+        ]
+        hairpin.direction = DirectionX.LEFT
+        assert hairpin.elements[1].pos == Point(Unit(20), Unit(0))
+        hairpin.width = Unit(4)
+        assert hairpin.elements[0].pos == Point(Unit(0), Unit(2))
+        hairpin.end_parent = self.right_parent
+        assert hairpin.elements[1].parent == self.right_parent
+        # Elements of previous drawings are removed
+        assert len(hairpin.elements) == 3
+        assert len(self.left_parent.children) == 3
+        assert len(self.right_parent.children) == 1
@@ -8,7 +8,10 @@ from neoscore.core.point import ORIGIN, Point
 from neoscore.core.units import Mm
 from neoscore.western import clef_type
 from neoscore.western.clef import Clef
+from neoscore.western.key_signature import KeySignature
+from neoscore.western.meter import Meter
 from neoscore.western.staff import NoClefError, Staff
+from neoscore.western.time_signature import TimeSignature
 from tests.helpers import assert_almost_equal
 
 from ..helpers import AppTest
@@ -41,6 +44,27 @@ class TestStaff(AppTest):
         assert_almost_equal(staff.distance_to_next_of_type(treble), Mm(20))
         assert_almost_equal(staff.distance_to_next_of_type(bass), Mm(100 - 31))
 
+    def test_distance_to_next_of_type_ignores_other_types_and_order(self):
+        staff = Staff((Mm(10), Mm(0)), self.flowable, Mm(100))
+        key_sig_2 = KeySignature(Mm(40), staff, "d_major")
+        Clef(Mm(0), staff, "treble")
+        Clef(Mm(20), staff, "bass")
+        key_sig_1 = KeySignature(Mm(5), staff, "g_major")
+        assert_almost_equal(staff.distance_to_next_of_type(key_sig_1), Mm(35))
+        assert_almost_equal(staff.distance_to_next_of_type(key_sig_2), Mm(60))
+
+    def test_distance_to_next_of_type_during_render(self):
+        staff = Staff((Mm(10), Mm(0)), self.flowable, Mm(100))
+        Clef(Mm(0), staff, "treble")
+        key_sig_1 = KeySignature(Mm(5), staff, "g_major")
+        key_sig_2 = KeySignature(Mm(40), staff, "d_major")
+        staff.pre_render_hook()
+        assert_almost_equal(staff.distance_to_next_of_type(key_sig_1), Mm(35))
+        assert_almost_equal(staff.distance_to_next_of_type(key_sig_2), Mm(60))
+        assert KeySignature in staff._exact_class_x_index
+        staff.post_render_hook()
+        assert staff._exact_class_x_index == {}
+
     def test_active_clef_at_with_explicit_clefs(self):
         staff = Staff((Mm(0), Mm(0)), self.flowable, Mm(100))
         Clef(Mm(0), staff, "treble")
@@ -50,6 +74,37 @@ class TestStaff(AppTest):
         # Test after bass clef goes into effect
         assert staff.active_clef_at(Mm(11)).clef_type == clef_type.BASS
 
+    def test_active_clef_at_clef_position_and_tolerance(self):
+        staff = Staff((Mm(0), Mm(0)), self.flowable, Mm(100))
+        Clef(Mm(10), staff, "bass")
+        Clef(Mm(0), staff, "treble")
+        assert staff.active_clef_at(Mm(10)).clef_type == clef_type.BASS
+        # Positions within ``Unit`` comparison tolerance count as equal
+        assert staff.active_clef_at(Mm(10) - Mm(0.0001)).clef_type == clef_type.BASS
+        assert staff.active_clef_at(Mm(9)).clef_type == clef_type.TREBLE
+        assert staff.active_clef_at(Mm(-1)) is None
+
+    def test_active_key_signature_at(self):
+        staff = Staff((Mm(0), Mm(0)), self.flowable, Mm(100))
+        Clef(Mm(0), staff, "treble")
+        g_major = KeySignature(Mm(5), staff, "g_major")
+        d_major = KeySignature(Mm(20), staff, "d_major")
+        assert staff.active_key_signature_at(Mm(1)) is None
+        assert staff.active_key_signature_at(Mm(5)) == g_major
+        assert staff.active_key_signature_at(Mm(19)) == g_major
+        assert staff.active_key_signature_at(Mm(50)) == d_major
+
+    def test_time_signature_at(self):
+        staff = Staff((Mm(0), Mm(0)), self.flowable, Mm(100))
+        Clef(Mm(0), staff, "treble")
+        first = TimeSignature(Mm(5), staff, Meter.numeric(3, 4))
+        second = TimeSignature(Mm(20), staff, Meter.numeric(4, 4))
+        assert staff.time_signature_at(Mm(5)) == first
+        assert staff.time_signature_at(Mm(20) + Mm(0.0001)) == second
+        assert staff.time_signature_at(Mm(6)) is None
+        assert staff.time_signature_at(Mm(0)) is None
+        assert staff.time_signature_at(Mm(50)) is None
+
     def test_active_clef_at_with_implicit_default_clef(self):
         staff = Staff((Mm(0), Mm(0)), self.flowable, Mm(100))
         assert staff.active_clef_at(Mm(5)) is None
@@ -0,0 +1,71 @@
+from neoscore.core import neoscore
+from neoscore.core.flowable import Flowable
+from neoscore.core.paper import Paper
+from neoscore.core.point import ORIGIN
+from neoscore.core.units import ZERO, Mm
+from neoscore.western.clef import Clef
+from neoscore.western.key_signature import KeySignature
+from neoscore.western.staff import Staff
+from neoscore.western.staff_group import StaffGroup
+from tests.helpers import assert_almost_equal
+
+from ..helpers import AppTest
+
+
+class TestStaffGroup(AppTest):
+    def setUp(self):
+        super().setUp()
+        neoscore.document.paper = Paper(
+            *[Mm(val) for val in [210, 297, 20, 20, 20, 20, 10]]
+        )
+        self.flowable = Flowable(ORIGIN, None, Mm(1000), Mm(60), Mm(5))
+        self.group = StaffGroup()
+        self.staff_1 = Staff(ORIGIN, self.flowable, Mm(1000), self.group)
+        self.staff_2 = Staff((ZERO, Mm(30)), self.flowable, Mm(1000), self.group)
+        self.clef_1 = Clef(ZERO, self.staff_1, "treble")
+        Clef(ZERO, self.staff_2, "bass")
+
+    def test_fringe_layouts_are_aligned(self):
+        KeySignature(ZERO, self.staff_2, "cs_major")
+        isolated_layout_1 = self.staff_1.fringe_layout_for_isolated_staff(None)
+        layout_1 = self.group.fringe_layout_at(self.staff_1, None)
+        layout_2 = self.group.fringe_layout_at(self.staff_2, None)
+        assert_almost_equal(layout_1.staff, layout_2.staff)
+        assert layout_1.staff < isolated_layout_1.staff
+
+    def test_fringe_layouts_reused_across_line_regeneration(self):
+        self.flowable._generate_lines()
+        line = self.flowable.lines[0]
+        layout = self.group.fringe_layout_at(self.staff_1, line)
+        stats = neoscore.cache_stats()["staff_fringe_layouts"]
+        self.flowable.height = Mm(70)
+        self.flowable._generate_lines()
+        new_line = self.flowable.lines[0]
+        assert new_line is not line
+        assert self.group.fringe_layout_at(self.staff_1, new_line) is layout
+        assert self.group.fringe_layout_at(self.staff_2, new_line)
+        new_stats = neoscore.cache_stats()["staff_fringe_layouts"]
+        assert new_stats.hits == stats.hits + 2
+        assert new_stats.misses == stats.misses
+
+    def test_fringe_layouts_recomputed_when_inputs_change(self):
+        staff = Staff((ZERO, Mm(60)), self.flowable, Mm(1000))
+        clef = Clef(ZERO, staff, "treble")
+        layout = staff.group.fringe_layout_at(staff, None)
+        clef.clef_type = "percussion_1"
+        new_layout = staff.group.fringe_layout_at(staff, None)
+        assert new_layout.clef != layout.clef
+        KeySignature(ZERO, staff, "cs_major")
+        assert (
+            staff.group.fringe_layout_at(staff, None).key_signature
+            < new_layout.key_signature
+        )
+
+    def test_staff_fringe_layouts_reused_within_render(self):
+        self.staff_1.pre_render_hook()
+        layout = self.staff_1.fringe_layout_at(None)
+        stats = neoscore.cache_stats()["staff_fringe_layouts"]
+        assert self.staff_1.fringe_layout_at(None) is layout
+        assert neoscore.cache_stats()["staff_fringe_layouts"] == stats
+        self.staff_1.post_render_hook()
+        assert self.staff_1._fringe_layouts == {}